@@ -0,0 +1,586 @@
+# =============================================================================
+# Modelos de poblaciones en tiempo discreto (Clases 19 y 20)
+# =============================================================================
+# Funciones de las Clases 19 y 20 reunidas en un módulo para importarlas desde
+# los notebooks con `from poblaciones import *`, más un motor que itera los
+# mapas `siguiente_*` para muchos parámetros a la vez.
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional: sin él se usa la versión en Python
+    njit = None
+
+
+def _nice_axes(xlabel="", ylabel="", title=""):
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.title(title)
+    plt.grid(True)
+
+
+# =============================================================================
+# Modelos (Clase 19)
+# =============================================================================
+def exp_difference(N0: float, r: float, T: int = 20):
+    """Devuelve tiempos y trayectoria de N_t para el modelo exponencial.
+    N_{t+1} = (1+r) N_t
+    """
+    t = np.arange(T+1, dtype=int)
+    N = np.zeros(T+1, dtype=float)
+    N[0] = N0
+    for i in range(T):
+        N[i+1] = (1+r)*N[i]
+    return t, N
+
+
+def logistic_step(N: float, r: float, K: float) -> float:
+    """Un paso del modelo logístico: N_{t+1} = N_t + r N_t (1 - N_t/K)."""
+    return N + r*N*(1 - N/K)
+
+
+def logistic_trajectory(N0: float, r: float, K: float, T: int = 50):
+    t = np.arange(T+1, dtype=int)
+    N = np.zeros(T+1, dtype=float)
+    N[0] = N0
+    for i in range(T):
+        N[i+1] = logistic_step(N[i], r, K)
+    return t, N
+
+
+def f_logistico_normalizado(x: float, r: float) -> float:
+    return x + r*x*(1 - x)
+
+
+def cobweb(f, x0: float, n_iter: int, xmin=0.0, xmax=1.0):
+    xs = np.linspace(xmin, xmax, 400)
+    ys = f(xs)
+
+    plt.figure()
+    # Curva y=f(x) y recta identidad
+    plt.plot(xs, ys)
+    plt.plot(xs, xs, linestyle="--")
+
+    # Trayectoria telaraña
+    x, y = x0, f(x0)
+    for _ in range(n_iter):
+        # vertical: (x, x) -> (x, f(x))
+        plt.plot([x, x], [x, y])
+        # horizontal: (x, f(x)) -> (f(x), f(x))
+        plt.plot([x, y], [y, y])
+        x, y = y, f(y)
+
+    _nice_axes("x_t (N_t/K)", "x_{t+1}", "Diagrama telaraña")
+    plt.xlim(xmin, xmax+0.05)
+    plt.ylim(xmin, xmax+0.05)
+    plt.show()
+
+
+def escalera_cobweb(f, x0: float, n_iter: int):
+    """
+    Puntos de la escalera del diagrama telaraña como una sola polilínea:
+    (x0, x0), (x0, x1), (x1, x1), (x1, x2), ..., (x_n, x_n).
+
+    Regresa
+    -------
+    (xs, ys) : (np.ndarray, np.ndarray)
+        Coordenadas de los 2*n_iter + 1 vértices.
+    """
+    orbita = np.empty(n_iter + 1)
+    orbita[0] = x0
+    for k in range(n_iter):
+        orbita[k+1] = f(orbita[k])
+    doble = np.repeat(orbita, 2)
+    return doble[:-1], doble[1:]
+
+
+def cobweb_persistente(f=f_logistico_normalizado, xmin=0.0, xmax=1.0):
+    """
+    Diagrama telaraña interactivo para el mapa f(x, r) con sliders de r, x0 y
+    número de iteraciones.
+
+    La figura se crea una sola vez con tres líneas (curva, identidad y la
+    escalera como una sola polilínea); al mover un slider sólo se cambian sus
+    datos. Para ver la actualización en el lugar se necesita un backend
+    interactivo (`%matplotlib widget`). `ipywidgets` se importa aquí para que
+    el resto del módulo funcione sin él.
+
+    Parámetros
+    ----------
+    f : callable
+        Mapa f(x, r), p. ej. `f_logistico_normalizado`.
+    xmin, xmax : float
+        Intervalo de x que se muestra.
+
+    Regresa
+    -------
+    El objeto de `interact` con los sliders.
+    """
+    from ipywidgets import interact, FloatSlider, IntSlider
+
+    xs = np.linspace(xmin, xmax, 400)
+    fig, ax = plt.subplots()
+    curva, = ax.plot(xs, xs)
+    ax.plot(xs, xs, linestyle="--")
+    escalera, = ax.plot([], [], linewidth=1)
+    ax.set_xlabel("x_t (N_t/K)")
+    ax.set_ylabel("x_{t+1}")
+    ax.grid(True)
+    ax.set_xlim(xmin, xmax+0.05)
+    ax.set_ylim(xmin, xmax+0.05)
+
+    def actualizar(r=1.2, x0=0.1, n_iter=25):
+        curva.set_ydata(f(xs, r))
+        escalera.set_data(*escalera_cobweb(lambda x: f(x, r), x0, n_iter))
+        ax.set_title(f"Diagrama telaraña (r={r:.2f})")
+        fig.canvas.draw_idle()
+
+    return interact(
+        actualizar,
+        r=FloatSlider(min=0.0, max=2.5, step=0.01, value=1.2, description="r"),
+        x0=FloatSlider(min=0.01, max=0.99, step=0.01, value=0.1, description="x0=N0/K"),
+        n_iter=IntSlider(min=1, max=100, step=1, value=25, description="# iter")
+    )
+
+
+# =============================================================================
+# Trayectorias largas (Numba opcional)
+# =============================================================================
+# Una sola trayectoria es secuencial en el tiempo y no se puede vectorizar.
+# Si Numba está instalado el ciclo se compila; si no, la misma función corre
+# en Python y el resultado es idéntico.
+def _compilar(f):
+    """Compila `f` con Numba si está disponible; si no, la regresa sin cambios."""
+    return njit(cache=True)(f) if njit is not None else f
+
+
+def _trayectoria_logistica(N0, r, K, T):
+    N = np.empty(T + 1)
+    N[0] = N0
+    x = N0
+    for i in range(T):
+        x = x + r*x*(1 - x/K)
+        N[i + 1] = x
+    return N
+
+
+_trayectoria_logistica_compilada = _compilar(_trayectoria_logistica)
+
+
+def logistic_trajectory_rapida(N0: float, r: float, K: float, T: int = 50):
+    """
+    Igual que `logistic_trajectory` pero con el ciclo compilado (si hay
+    Numba). Pensada para trayectorias de millones de pasos.
+    """
+    t = np.arange(T+1, dtype=int)
+    return t, _trayectoria_logistica_compilada(float(N0), float(r), float(K), int(T))
+
+
+def verificar_trayectoria_rapida(T: int = 2000) -> bool:
+    """Comprueba que `logistic_trajectory_rapida` coincide con `logistic_trajectory`."""
+    for N0, r, K in [(10.0, 0.5, 100.0), (10.0, 2.2, 100.0), (0.3, 2.9, 1.0)]:
+        _, lento = logistic_trajectory(N0, r, K, T)
+        _, rapido = logistic_trajectory_rapida(N0, r, K, T)
+        assert np.array_equal(lento, rapido), f"No coincide con r={r}."
+    return True
+
+
+# =============================================================================
+# Ecuaciones en diferencias con efecto Allee y pesca (Clase 20)
+# =============================================================================
+def iterar_dinamica(f_actualizacion, x0, pasos, **parametros):
+    """
+    Itera la ecuación en diferencias:
+        x_{t+1} = f_actualizacion(x_t, **parametros)
+    - f_actualizacion: función que recibe x_t y parámetros, y devuelve x_{t+1}
+    - x0: estado inicial (>=0)
+    - pasos: número de iteraciones (entero)
+    Devuelve: np.ndarray con la serie (longitud pasos+1).
+    (Se trunca a 0 si aparece un valor negativo por redondeos/ruido numérico.)
+    """
+    x = np.empty(pasos + 1, dtype=float)
+    x[0] = float(x0)
+    for t in range(pasos):
+        x[t+1] = max(0.0, float(f_actualizacion(x[t], **parametros)))
+    return x
+
+
+def graficar_serie(serie, titulo=None, equilibrios=None, etiqueta='N_t'):
+    """
+    Grafica una serie temporal discreta.
+    - equilibrios: valor o lista de valores para dibujar líneas horizontales.
+    """
+    plt.figure()
+    plt.plot(serie, marker='o', linewidth=1)
+    if equilibrios is not None:
+        for e in np.atleast_1d(equilibrios):
+            plt.axhline(float(e), linestyle='--', linewidth=1)
+    plt.xlabel('tiempo t')
+    plt.ylabel(etiqueta)
+    if titulo:
+        plt.title(titulo)
+    plt.tight_layout()
+    plt.show()
+
+
+def siguiente_exponencial(N, r):
+    """Modelo exponencial: N_{t+1} = (1+r) N_t."""
+    return (1 + r) * N
+
+
+def siguiente_allee_fuerte(N, r, K, A):
+    """Efecto Allee fuerte con umbral A."""
+    return N + r * N * (1 - N / K) * (N / A - 1)
+
+
+def siguiente_allee_debil(N, r, K, A):
+    """Efecto Allee débil (crecimiento positivo pero pequeño a bajas densidades)."""
+    return N + r * N * (1 - N / K) * (N / (A + N))
+
+
+def siguiente_pesca_cosecha_constante(N, r, K, H):
+    """Logístico discreto con cosecha constante H."""
+    return N + r * N * (1 - N / K) - H
+
+
+def siguiente_pesca_cosecha_proporcional(N, r, K, h):
+    """Logístico discreto con cosecha proporcional h."""
+    return N + r * N * (1 - N / K) - h * N
+
+
+def equilibrios_pesca_cosecha_constante(r, K, H):
+    """
+    Resuelve r N (1 - N/K) = H  -> (r/K) N^2 - r N + H = 0
+    Devuelve (N1, N2) ordenados si hay soluciones reales; si no, tuple().
+    """
+    a = r / K
+    b = -r
+    c = H
+    D = b*b - 4*a*c
+    if D < 0:
+        return tuple()
+    raiz = D**0.5
+    N1 = (-b - raiz) / (2*a)
+    N2 = (-b + raiz) / (2*a)
+    return (min(N1, N2), max(N1, N2))
+
+
+def equilibrio_pesca_cosecha_proporcional(r, K, h):
+    """Equilibrio positivo: K (1 - h/r) si h<r; si no, solo 0."""
+    return (0.0 if h >= r else K * (1 - h / r))
+
+
+# =============================================================================
+# Barridos vectorizados de parámetros
+# =============================================================================
+# Los mapas `siguiente_*`, `logistic_step` y `f_logistico_normalizado` sólo
+# usan operaciones de NumPy, así que aceptan arreglos: en lugar de un ciclo en
+# Python por cada parámetro, se avanza un arreglo con todas las combinaciones
+# (r, N0, ...) a la vez y el único ciclo es sobre el tiempo.
+def _preparar_barrido(x0, parametros: dict):
+    """Difunde x0 y los parámetros a una forma común (sin copiar los parámetros)."""
+    arreglos = np.broadcast_arrays(np.asarray(x0, dtype=float),
+                                   *(np.asarray(v, dtype=float) for v in parametros.values()))
+    x = np.array(arreglos[0], dtype=float)
+    return x, dict(zip(parametros, arreglos[1:]))
+
+
+def iterar_barrido(f_actualizacion, x0, pasos: int, truncar: bool = True,
+                   **parametros) -> np.ndarray:
+    """
+    Versión vectorizada de `iterar_dinamica` para muchos parámetros a la vez.
+
+    `x0` y cada parámetro pueden ser escalares o arreglos que se difunden
+    (broadcasting) entre sí; por ejemplo r de forma (R, 1) y x0 de forma
+    (1, M) dan R*M trayectorias.
+
+    Parámetros
+    ----------
+    f_actualizacion : callable
+        Mapa x_t -> x_{t+1} escrito con operaciones de NumPy.
+    x0 : float | array_like
+        Estados iniciales.
+    pasos : int
+        Número de iteraciones.
+    truncar : bool
+        Si es True, los valores negativos se truncan a 0 como en
+        `iterar_dinamica`.
+    **parametros
+        Parámetros del mapa (escalares o arreglos).
+
+    Regresa
+    -------
+    np.ndarray
+        Arreglo (pasos+1, *forma) con todas las series.
+    """
+    x, parametros = _preparar_barrido(x0, parametros)
+    serie = np.empty((pasos + 1, *x.shape), dtype=float)
+    serie[0] = x
+    with np.errstate(over="ignore", invalid="ignore"):
+        for t in range(pasos):
+            x = f_actualizacion(x, **parametros)
+            if truncar:
+                x = np.maximum(x, 0.0)
+            serie[t + 1] = x
+    return serie
+
+
+def estado_final(f_actualizacion, x0, pasos: int, truncar: bool = True,
+                 **parametros) -> np.ndarray:
+    """Igual que `iterar_barrido` pero sólo regresa x_pasos (sin guardar la serie)."""
+    x, parametros = _preparar_barrido(x0, parametros)
+    with np.errstate(over="ignore", invalid="ignore"):
+        for _ in range(pasos):
+            x = f_actualizacion(x, **parametros)
+            if truncar:
+                x = np.maximum(x, 0.0)
+    return x
+
+
+def bifurcacion(f_actualizacion, nombre: str, valores, x0=0.1, descartar: int = 500,
+                conservar: int = 100, truncar: bool = True, **fijos):
+    """
+    Datos para un diagrama de bifurcación del mapa `f_actualizacion`
+    respecto al parámetro `nombre`.
+
+    Se itera el mapa para todos los `valores` a la vez, se descartan los
+    primeros `descartar` pasos (transitorio) y se guardan los siguientes
+    `conservar` estados de cada valor.
+
+    Parámetros
+    ----------
+    f_actualizacion : callable
+        Mapa x_t -> x_{t+1}, p. ej. `f_logistico_normalizado`.
+    nombre : str
+        Nombre del parámetro que se barre, p. ej. 'r'.
+    valores : array_like
+        Valores del parámetro (1D).
+    x0 : float | array_like
+        Estado inicial (escalar o uno por valor).
+    descartar : int
+        Pasos de calentamiento que no se guardan.
+    conservar : int
+        Puntos del atractor que se guardan por valor.
+    truncar : bool
+        Truncar negativos a 0 como en `iterar_dinamica`.
+    **fijos
+        Resto de los parámetros del mapa (p. ej. K=100).
+
+    Regresa
+    -------
+    (parametro, x) : (np.ndarray, np.ndarray)
+        Dos arreglos (len(valores), conservar): el valor del parámetro
+        repetido y los estados x_t, listos para `plt.plot(..., ',')`.
+    """
+    valores = np.asarray(valores, dtype=float)
+    x = estado_final(f_actualizacion, x0, descartar, truncar, **{nombre: valores}, **fijos)
+    cola = iterar_barrido(f_actualizacion, x, conservar - 1, truncar,
+                          **{nombre: valores}, **fijos)
+    cola = np.moveaxis(cola, 0, -1)
+    return np.broadcast_to(valores[:, None], cola.shape), cola
+
+
+def graficar_bifurcacion(parametro, x, nombre: str = "r", titulo: str = None,
+                         etiqueta: str = "x"):
+    """Grafica la salida de `bifurcacion` como una nube de puntos."""
+    visibles = np.isfinite(x)
+    plt.figure(figsize=(8, 5))
+    plt.plot(parametro[visibles], x[visibles], ',', color='k', alpha=0.3)
+    _nice_axes(nombre, etiqueta, titulo or "Diagrama de bifurcación")
+    plt.show()
+
+
+# =============================================================================
+# Exponentes de Lyapunov y periodo de los atractores
+# =============================================================================
+# Para un mapa x_{t+1} = f(x_t) el exponente de Lyapunov es el promedio de
+# log|f'(x_t)| sobre la órbita: negativo en órbitas periódicas estables,
+# positivo en caos. Las derivadas de los mapas del curso se dan de forma
+# analítica; para cualquier otro mapa se usan diferencias centrales.
+def derivada_logistico_normalizado(x, r):
+    return 1 + r*(1 - 2*x)
+
+
+def derivada_logistic_step(N, r, K):
+    return 1 + r*(1 - 2*N/K)
+
+
+def derivada_exponencial(N, r):
+    return (1 + r) * np.ones_like(N)
+
+
+def derivada_allee_fuerte(N, r, K, A):
+    return 1 + r * ((1 - N/K)*(N/A - 1) - (N/K)*(N/A - 1) + (N/A)*(1 - N/K))
+
+
+def derivada_allee_debil(N, r, K, A):
+    # N^2 (1 - N/K) / (A + N) con la regla del cociente
+    u = N**2 - N**3 / K
+    du = 2*N - 3*N**2 / K
+    return 1 + r * (du*(A + N) - u) / (A + N)**2
+
+
+def derivada_pesca_cosecha_constante(N, r, K, H):
+    return 1 + r*(1 - 2*N/K)
+
+
+def derivada_pesca_cosecha_proporcional(N, r, K, h):
+    return 1 + r*(1 - 2*N/K) - h
+
+
+DERIVADAS = {
+    f_logistico_normalizado: derivada_logistico_normalizado,
+    logistic_step: derivada_logistic_step,
+    siguiente_exponencial: derivada_exponencial,
+    siguiente_allee_fuerte: derivada_allee_fuerte,
+    siguiente_allee_debil: derivada_allee_debil,
+    siguiente_pesca_cosecha_constante: derivada_pesca_cosecha_constante,
+    siguiente_pesca_cosecha_proporcional: derivada_pesca_cosecha_proporcional,
+}
+
+
+def derivada_numerica(f_actualizacion, x, paso_relativo: float = 1e-6, **parametros):
+    """Derivada de f respecto a x por diferencias centrales (vectorizada)."""
+    h = paso_relativo * np.maximum(np.abs(x), 1.0)
+    return (f_actualizacion(x + h, **parametros) - f_actualizacion(x - h, **parametros)) / (2*h)
+
+
+def _derivada_de(f_actualizacion, derivada):
+    if derivada is not None:
+        return derivada
+    if f_actualizacion in DERIVADAS:
+        return DERIVADAS[f_actualizacion]
+    return lambda x, **p: derivada_numerica(f_actualizacion, x, **p)
+
+
+def lyapunov(f_actualizacion, nombre: str, valores, x0=0.1, descartar: int = 500,
+             pasos: int = 1000, derivada=None, truncar: bool = True, **fijos) -> np.ndarray:
+    """
+    Exponente de Lyapunov del mapa para cada valor del parámetro `nombre`.
+
+    Parámetros
+    ----------
+    f_actualizacion : callable
+        Mapa x_t -> x_{t+1}, p. ej. `f_logistico_normalizado`.
+    nombre : str
+        Parámetro que se barre.
+    valores : array_like
+        Valores del parámetro (1D).
+    x0 : float | array_like
+        Estado inicial.
+    descartar : int
+        Pasos de calentamiento antes de promediar.
+    pasos : int
+        Pasos que se promedian.
+    derivada : callable | None
+        f'(x, **parametros). Si es None se busca en `DERIVADAS` y, si el mapa
+        no está ahí, se usan diferencias finitas.
+    truncar : bool
+        Truncar negativos a 0 como en `iterar_dinamica`.
+    **fijos
+        Resto de los parámetros del mapa.
+
+    Regresa
+    -------
+    np.ndarray
+        Exponentes (len(valores),). Vale nan si la órbita diverge y -inf si
+        cae exactamente en un punto crítico (f'(x) = 0).
+    """
+    valores = np.asarray(valores, dtype=float)
+    parametros = {nombre: valores, **fijos}
+    df = _derivada_de(f_actualizacion, derivada)
+    x = estado_final(f_actualizacion, x0, descartar, truncar, **parametros)
+    x, parametros = _preparar_barrido(x, parametros)
+    suma = np.zeros_like(x)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(pasos):
+            suma += np.log(np.abs(df(x, **parametros)))
+            x = f_actualizacion(x, **parametros)
+            if truncar:
+                x = np.maximum(x, 0.0)
+    return suma / pasos
+
+
+def periodo_atractor(f_actualizacion, nombre: str, valores, x0=0.1, descartar: int = 1000,
+                     max_periodo: int = 64, tol: float = 1e-6, truncar: bool = True,
+                     **fijos) -> np.ndarray:
+    """
+    Periodo del atractor alcanzado tras `descartar` pasos, para cada valor del
+    parámetro `nombre`.
+
+    Se guardan 2*max_periodo estados de la órbita y el periodo es el menor p
+    tal que |x_{t+p} - x_t| <= tol*(1 + |x_t|) en toda la ventana.
+
+    Regresa
+    -------
+    np.ndarray
+        Periodos (len(valores),) de tipo int: 1 = punto fijo, 2, 4, ... ciclos,
+        0 = sin periodo <= max_periodo (caos, cuasiperiodicidad o divergencia).
+    """
+    valores = np.asarray(valores, dtype=float)
+    x = estado_final(f_actualizacion, x0, descartar, truncar, **{nombre: valores}, **fijos)
+    cola = iterar_barrido(f_actualizacion, x, 2*max_periodo - 1, truncar,
+                          **{nombre: valores}, **fijos)
+    periodo = np.zeros(cola.shape[1:], dtype=int)
+    ventana = cola[:max_periodo]
+    with np.errstate(invalid="ignore"):
+        for p in range(max_periodo, 0, -1):
+            cerca = np.abs(cola[p:p + max_periodo] - ventana) <= tol * (1 + np.abs(ventana))
+            periodo[cerca.all(axis=0)] = p
+    return periodo
+
+
+def analizar_atractores(f_actualizacion, nombre: str, valores, x0=0.1, descartar: int = 1000,
+                        pasos: int = 1000, max_periodo: int = 64, tol: float = 1e-6,
+                        derivada=None, truncar: bool = True, **fijos) -> dict:
+    """
+    Exponente de Lyapunov y periodo del atractor sobre una malla de valores.
+
+    Regresa
+    -------
+    dict
+        {'valores', 'lyapunov', 'periodo', 'caotico'}; `caotico` marca los
+        valores con exponente positivo.
+    """
+    valores = np.asarray(valores, dtype=float)
+    lam = lyapunov(f_actualizacion, nombre, valores, x0, descartar, pasos, derivada,
+                   truncar, **fijos)
+    per = periodo_atractor(f_actualizacion, nombre, valores, x0, descartar, max_periodo,
+                           tol, truncar, **fijos)
+    return {"valores": valores, "lyapunov": lam, "periodo": per,
+            "caotico": np.nan_to_num(lam, nan=-np.inf) > 0}
+
+
+def graficar_lyapunov(resultado: dict, nombre: str = "r", titulo: str = None):
+    """Grafica el exponente de Lyapunov y el periodo del atractor contra el parámetro."""
+    fig, axs = plt.subplots(2, 1, figsize=(8, 6), sharex=True)
+    axs[0].plot(resultado["valores"], resultado["lyapunov"], linewidth=0.8)
+    axs[0].axhline(0, color="k", linestyle="--", linewidth=0.8)
+    axs[0].set_ylabel("Exponente de Lyapunov")
+    axs[0].grid(True)
+    axs[1].plot(resultado["valores"], resultado["periodo"], '.', markersize=2)
+    axs[1].set_ylabel("Periodo (0 = sin periodo)")
+    axs[1].set_xlabel(nombre)
+    axs[1].grid(True)
+    fig.suptitle(titulo or "Lyapunov y periodo del atractor")
+    plt.show()
+
+
+def comparar_tiempos(n_parametros: int = 2000, pasos: int = 300) -> dict:
+    """
+    Compara `iterar_dinamica` (un parámetro a la vez) contra `iterar_barrido`
+    para el logístico normalizado con `n_parametros` valores de r.
+    """
+    rs = np.linspace(0.0, 3.0, n_parametros)
+    inicio = time.perf_counter()
+    lento = np.array([iterar_dinamica(f_logistico_normalizado, 0.1, pasos, r=r) for r in rs])
+    t_ciclo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    rapido = iterar_barrido(f_logistico_normalizado, 0.1, pasos, r=rs)
+    t_vector = time.perf_counter() - inicio
+    assert np.allclose(lento, rapido.T, equal_nan=True)
+    print(f"ciclo: {t_ciclo:.3f} s   vectorizado: {t_vector:.4f} s   (x{t_ciclo / t_vector:.0f})")
+    return {"ciclo": t_ciclo, "vectorizado": t_vector}
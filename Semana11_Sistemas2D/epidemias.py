@@ -0,0 +1,455 @@
+# =============================================================================
+# Modelos compartimentales de epidemias (Clase 21)
+# =============================================================================
+# Un modelo se describe con sus compartimentos (S, I, R, ...) y una lista de
+# transiciones (origen, destino, propensión). La propensión es la tasa total
+# del flujo origen -> destino y recibe el estado y los parámetros como
+# diccionarios de arreglos, así que un mismo modelo sirve para:
+#   - simulación determinista en tiempo discreto, con muchos juegos de
+#     parámetros a la vez (arreglos que se difunden entre sí);
+#   - simulación estocástica con poblaciones enteras, por tau-leaping o por el
+#     algoritmo exacto de Gillespie, con muchas réplicas a la vez;
+#   - ensambles de decenas de miles de réplicas repartidos entre procesos,
+#     resumidos con histogramas que se combinan sin guardar las trayectorias.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+# =============================================================================
+# Descripción de modelos
+# =============================================================================
+class ModeloCompartimental:
+    """
+    Modelo de compartimentos con transiciones entre ellos.
+
+    Parámetros
+    ----------
+    nombre : str
+        Nombre del modelo.
+    compartimentos : sequence of str
+        Nombres de los compartimentos, p. ej. ("S", "I", "R").
+    transiciones : list of (str, str, callable)
+        (origen, destino, propension). `propension(x, p)` recibe `x`, un dict
+        {compartimento: arreglo} que además trae el total 'N', y `p`, el dict
+        de parámetros, y regresa la tasa del flujo por unidad de tiempo.
+        Las funciones deben estar definidas a nivel de módulo para poder
+        mandar el modelo a otros procesos.
+    """
+
+    def __init__(self, nombre: str, compartimentos, transiciones):
+        self.nombre = nombre
+        self.compartimentos = tuple(compartimentos)
+        self.transiciones = list(transiciones)
+        indice = {c: i for i, c in enumerate(self.compartimentos)}
+        self.origen = np.array([indice[o] for o, _, _ in self.transiciones])
+        self.destino = np.array([indice[d] for _, d, _ in self.transiciones])
+        # Cambio en cada compartimento cuando ocurre una vez cada transición.
+        self.cambios = np.zeros((len(self.transiciones), len(self.compartimentos)), dtype=np.int64)
+        self.cambios[np.arange(len(self.transiciones)), self.origen] -= 1
+        self.cambios[np.arange(len(self.transiciones)), self.destino] += 1
+
+    def __repr__(self):
+        flechas = ", ".join(f"{o}->{d}" for o, d, _ in self.transiciones)
+        return f"ModeloCompartimental({self.nombre!r}: {flechas})"
+
+    def propensiones(self, x: np.ndarray, p: dict) -> np.ndarray:
+        """Tasas de todas las transiciones para estados x de forma (..., C): regresa (..., K)."""
+        estado = {c: x[..., i] for i, c in enumerate(self.compartimentos)}
+        estado["N"] = x.sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a = np.stack([np.broadcast_to(f(estado, p), x.shape[:-1])
+                          for _, _, f in self.transiciones], axis=-1)
+        return np.nan_to_num(np.maximum(a, 0.0), nan=0.0)
+
+
+def contagio_frecuencia(x, p):
+    """Contagio dependiente de frecuencia: β S I / N."""
+    return p["beta"] * x["S"] * x["I"] / x["N"]
+
+
+def incubacion(x, p):
+    """Paso de expuestos a infecciosos: σ E."""
+    return p["sigma"] * x["E"]
+
+
+def recuperacion(x, p):
+    """Remoción de infectados: γ I."""
+    return p["gamma"] * x["I"]
+
+
+MODELO_SI = ModeloCompartimental("SI", ("S", "I"), [("S", "I", contagio_frecuencia)])
+MODELO_SIR = ModeloCompartimental("SIR", ("S", "I", "R"),
+                                  [("S", "I", contagio_frecuencia), ("I", "R", recuperacion)])
+MODELO_SEIR = ModeloCompartimental("SEIR", ("S", "E", "I", "R"),
+                                   [("S", "E", contagio_frecuencia), ("E", "I", incubacion),
+                                    ("I", "R", recuperacion)])
+MODELOS = {"SI": MODELO_SI, "SIR": MODELO_SIR, "SEIR": MODELO_SEIR}
+
+
+def _modelo(modelo) -> ModeloCompartimental:
+    return MODELOS[modelo] if isinstance(modelo, str) else modelo
+
+
+def _estado_inicial(modelo: ModeloCompartimental, x0: dict, dtype=float) -> np.ndarray:
+    """Apila x0 = {compartimento: valor o arreglo} en un arreglo (..., C)."""
+    faltan = set(modelo.compartimentos) - set(x0)
+    if faltan:
+        raise ValueError(f"Faltan condiciones iniciales para {sorted(faltan)}.")
+    valores = np.broadcast_arrays(*(np.asarray(x0[c]) for c in modelo.compartimentos))
+    return np.stack(valores, axis=-1).astype(dtype)
+
+
+def _a_dict(modelo: ModeloCompartimental, X: np.ndarray, t: np.ndarray) -> dict:
+    salida = {c: X[..., i] for i, c in enumerate(modelo.compartimentos)}
+    salida["t"] = t
+    return salida
+
+
+# =============================================================================
+# Simulación determinista (vectorizada sobre parámetros)
+# =============================================================================
+def simular_determinista(modelo, x0: dict, params: dict, pasos: int, dt: float = 1.0) -> dict:
+    """
+    Integra el modelo en tiempo discreto: x_{t+dt} = x_t + dt * flujos(x_t).
+
+    Con dt = 1 son las ecuaciones en diferencias de la Clase 21. Los valores
+    de `x0` y de `params` pueden ser arreglos que se difunden entre sí, de
+    modo que muchos juegos de parámetros avanzan juntos. Si en un paso las
+    salidas de un compartimento superan lo que contiene, se reducen en
+    proporción para no generar poblaciones negativas.
+
+    Parámetros
+    ----------
+    modelo : ModeloCompartimental | str
+        Modelo o nombre ('SI', 'SIR', 'SEIR').
+    x0 : dict
+        {compartimento: valor inicial}, en proporciones o en individuos.
+    params : dict
+        Parámetros del modelo, p. ej. {'beta': ..., 'gamma': ...}.
+    pasos : int
+        Número de pasos.
+    dt : float
+        Tamaño del paso.
+
+    Regresa
+    -------
+    dict
+        {compartimento: arreglo (pasos+1, *forma), 't': tiempos}.
+    """
+    modelo = _modelo(modelo)
+    p = {k: np.asarray(v, dtype=float) for k, v in params.items()}
+    x = _estado_inicial(modelo, x0)
+    forma = np.broadcast_shapes(x.shape[:-1], *(v.shape for v in p.values()))
+    x = np.broadcast_to(x, forma + x.shape[-1:]).copy()
+    X = np.empty((pasos + 1, *x.shape))
+    X[0] = x
+    for t in range(pasos):
+        flujos = dt * modelo.propensiones(x, p)                       # (..., K)
+        salida = np.zeros(x.shape)
+        for k, o in enumerate(modelo.origen):
+            salida[..., o] += flujos[..., k]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(salida > x, x / salida, 1.0)
+        flujos = flujos * factor[..., modelo.origen]
+        x = x + flujos @ modelo.cambios.astype(float)
+        X[t + 1] = x
+    return _a_dict(modelo, X, np.arange(pasos + 1) * dt)
+
+
+def simular_SI(beta: float, S0: float, I0: float, T: int):
+    """
+    Simula el modelo epidemiológico SI discreto durante T pasos de tiempo:
+    S_{t+1} = S_t - β S_t I_t,  I_{t+1} = I_t + β S_t I_t  (proporciones, N = 1).
+
+    Regresa
+    -------
+    (S, I) : (np.ndarray, np.ndarray)
+        Series de longitud T+1.
+    """
+    r = simular_determinista(MODELO_SI, {"S": S0, "I": I0}, {"beta": beta}, T)
+    return r["S"], r["I"]
+
+
+def simular_SIR(beta: float, gamma: float, S0: float, I0: float, R0: float, T: int):
+    """
+    Simula el modelo SIR discreto durante T pasos (proporciones, N = 1):
+    S_{t+1} = S_t - β S_t I_t,  I_{t+1} = I_t + β S_t I_t - γ I_t,
+    R_{t+1} = R_t + γ I_t.
+
+    Regresa
+    -------
+    (S, I, R) : np.ndarray
+        Series de longitud T+1.
+    """
+    r = simular_determinista(MODELO_SIR, {"S": S0, "I": I0, "R": R0},
+                             {"beta": beta, "gamma": gamma}, T)
+    return r["S"], r["I"], r["R"]
+
+
+# =============================================================================
+# Simulación estocástica (poblaciones enteras)
+# =============================================================================
+def _parametros_escalares(params: dict) -> dict:
+    p = {k: np.asarray(v, dtype=float) for k, v in params.items()}
+    if any(v.ndim > 0 for v in p.values()):
+        raise ValueError("Los modos estocásticos usan un solo juego de parámetros (escalares).")
+    return p
+
+
+def simular_tau_leaping(modelo, x0: dict, params: dict, t_final: float, dt: float = 1.0,
+                        replicas: int = 1, rng=None) -> dict:
+    """
+    Simulación estocástica por tau-leaping con `replicas` réplicas a la vez.
+
+    En cada salto de duración dt, el número de eventos de cada transición es
+    binomial: cada individuo del origen la realiza con probabilidad
+    1 - exp(-a dt / x_origen), donde a es la propensión. Las transiciones se
+    sortean en orden descontando a quienes ya salieron, así que ningún
+    compartimento queda negativo.
+
+    Regresa
+    -------
+    dict
+        {compartimento: arreglo de enteros (pasos+1, replicas), 't': tiempos}.
+    """
+    modelo = _modelo(modelo)
+    if rng is None:
+        rng = np.random.default_rng()
+    p = _parametros_escalares(params)
+    x = np.broadcast_to(_estado_inicial(modelo, x0, np.int64),
+                        (replicas, len(modelo.compartimentos))).copy()
+    pasos = int(np.ceil(t_final / dt - 1e-12))
+    X = np.empty((pasos + 1, *x.shape), dtype=np.int64)
+    X[0] = x
+    for t in range(pasos):
+        a = modelo.propensiones(x.astype(float), p)                   # (R, K)
+        disponible = x.copy()
+        eventos = np.zeros_like(a, dtype=np.int64)
+        for k, o in enumerate(modelo.origen):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tasa = np.where(x[:, o] > 0, a[:, k] / x[:, o], 0.0)
+            eventos[:, k] = rng.binomial(disponible[:, o], -np.expm1(-tasa * dt))
+            disponible[:, o] -= eventos[:, k]
+        x = x + eventos @ modelo.cambios
+        X[t + 1] = x
+    return _a_dict(modelo, X, np.arange(pasos + 1) * dt)
+
+
+def simular_gillespie(modelo, x0: dict, params: dict, t_final: float, dt: float = 1.0,
+                      replicas: int = 1, rng=None) -> dict:
+    """
+    Algoritmo exacto de Gillespie con `replicas` réplicas avanzando juntas.
+
+    En cada iteración cada réplica realiza un evento: el tiempo de espera es
+    exponencial con tasa a0 = Σ a_k y la transición se elige con
+    probabilidad a_k / a0. El estado se registra en la malla t = 0, dt, ...,
+    t_final (el valor en cada instante es el último estado alcanzado antes
+    de él), para que las salidas sean comparables con `simular_tau_leaping`.
+
+    Regresa
+    -------
+    dict
+        {compartimento: arreglo de enteros (len(t), replicas), 't': tiempos}.
+    """
+    modelo = _modelo(modelo)
+    if rng is None:
+        rng = np.random.default_rng()
+    p = _parametros_escalares(params)
+    x = np.broadcast_to(_estado_inicial(modelo, x0, np.int64),
+                        (replicas, len(modelo.compartimentos))).copy()
+    malla = np.arange(int(np.ceil(t_final / dt - 1e-12)) + 1) * dt
+    X = np.empty((len(malla), *x.shape), dtype=np.int64)
+    t = np.zeros(replicas)
+    siguiente = np.zeros(replicas, dtype=np.int64)   # próximo punto de la malla por registrar
+    activas = np.arange(replicas)
+    while len(activas) > 0:
+        a = modelo.propensiones(x[activas].astype(float), p)
+        a0 = a.sum(axis=1)
+        with np.errstate(divide="ignore"):
+            espera = np.where(a0 > 0, rng.exponential(1.0, len(activas)) / a0, np.inf)
+        t_nuevo = t[activas] + espera
+        # Registrar el estado actual en los puntos de malla anteriores al evento.
+        while True:
+            g = siguiente[activas]
+            pendientes = (g < len(malla)) & (malla[np.minimum(g, len(malla) - 1)] < t_nuevo)
+            if not pendientes.any():
+                break
+            filas = activas[pendientes]
+            X[siguiente[filas], filas] = x[filas]
+            siguiente[filas] += 1
+        # Aplicar el evento a las réplicas que aún no terminan.
+        sigue = (siguiente[activas] < len(malla)) & np.isfinite(t_nuevo)
+        activas, a, a0, t_nuevo = activas[sigue], a[sigue], a0[sigue], t_nuevo[sigue]
+        if len(activas) == 0:
+            break
+        u = rng.random(len(activas)) * a0
+        k = np.minimum((np.cumsum(a, axis=1) < u[:, None]).sum(axis=1), a.shape[1] - 1)
+        x[activas] += modelo.cambios[k]
+        t[activas] = t_nuevo
+    return _a_dict(modelo, X, malla)
+
+
+# =============================================================================
+# Ensambles con resúmenes en streaming
+# =============================================================================
+class HistogramaTemporal:
+    """
+    Histograma de una cantidad entera en cada instante de una malla de tiempo.
+
+    Permite calcular media y cuantiles sin guardar las réplicas, y dos
+    histogramas se combinan sumando sus conteos, así que cada proceso resume
+    sus réplicas y al final sólo se juntan los conteos. Si `maximo + 1` no
+    supera `max_bins` cada entero tiene su propia caja y los cuantiles son
+    exactos; si no, se agrupan en `max_bins` cajas de igual ancho.
+    """
+
+    def __init__(self, n_tiempos: int, maximo: int, max_bins: int = 4096):
+        self.maximo = int(maximo)
+        self.n_bins = min(self.maximo + 1, max_bins)
+        self.ancho = (self.maximo + 1) / self.n_bins
+        self.conteos = np.zeros((n_tiempos, self.n_bins), dtype=np.int64)
+        self.suma = np.zeros(n_tiempos)
+        self.n = 0
+
+    def agregar(self, valores: np.ndarray) -> None:
+        """Agrega réplicas: `valores` es (n_tiempos, replicas)."""
+        T, R = valores.shape
+        caja = np.minimum((valores / self.ancho).astype(np.int64), self.n_bins - 1)
+        plano = caja + np.arange(T)[:, None] * self.n_bins
+        self.conteos += np.bincount(plano.ravel(), minlength=T * self.n_bins).reshape(T, -1)
+        self.suma += valores.sum(axis=1)
+        self.n += R
+
+    def combinar(self, otro: "HistogramaTemporal") -> "HistogramaTemporal":
+        self.conteos += otro.conteos
+        self.suma += otro.suma
+        self.n += otro.n
+        return self
+
+    def media(self) -> np.ndarray:
+        return self.suma / max(self.n, 1)
+
+    def cuantiles(self, qs) -> np.ndarray:
+        """Regresa un arreglo (len(qs), n_tiempos) con los cuantiles pedidos."""
+        acumulado = np.cumsum(self.conteos, axis=1)
+        salida = []
+        for q in np.atleast_1d(qs):
+            caja = (acumulado < q * self.n).sum(axis=1)
+            salida.append(np.minimum(caja, self.n_bins - 1) * self.ancho)
+        return np.array(salida)
+
+
+def _lote_ensamble(modelo, x0, params, t_final, dt, modo, replicas, semilla,
+                   umbral_brote, max_bins):
+    """Corre un lote de réplicas y regresa sus histogramas y tamaños finales."""
+    rng = np.random.default_rng(semilla)
+    simular = simular_gillespie if modo == "gillespie" else simular_tau_leaping
+    r = simular(modelo, x0, params, t_final, dt, replicas, rng)
+    N = int(sum(np.asarray(x0[c]) for c in modelo.compartimentos))
+    histos = {}
+    for c in modelo.compartimentos:
+        h = HistogramaTemporal(len(r["t"]), N, max_bins)
+        h.agregar(r[c])
+        histos[c] = h
+    # Tamaño final: susceptibles iniciales que se infectaron (salieron de S);
+    # los infectados y removidos de t = 0 no cuentan como parte del brote.
+    tamano = int(x0["S"]) - r["S"][-1]
+    return histos, tamano, int((tamano >= umbral_brote).sum())
+
+
+def ensamble_epidemia(modelo, x0: dict, params: dict, t_final: float, dt: float = 1.0,
+                      replicas: int = 10000, modo: str = "tau", lote: int = 1000,
+                      umbral_brote: float = 0.1, cuantiles=(0.05, 0.5, 0.95),
+                      semilla: int = None, n_procesos: int = None, max_bins: int = 4096) -> dict:
+    """
+    Ensamble de réplicas estocásticas repartido en lotes entre procesos.
+
+    Cada lote recibe su propia semilla derivada con `SeedSequence.spawn`, así
+    que el resultado no depende del número de procesos. Las trayectorias no
+    se guardan: cada lote se resume en histogramas por compartimento y
+    tiempo (`HistogramaTemporal`) que después se combinan.
+
+    Parámetros
+    ----------
+    modelo : ModeloCompartimental | str
+        Modelo o nombre ('SI', 'SIR', 'SEIR').
+    x0 : dict
+        Condiciones iniciales enteras, p. ej. {'S': 990, 'I': 10, 'R': 0}.
+    params : dict
+        Parámetros (escalares).
+    t_final, dt : float
+        Horizonte y paso (salto de tau-leaping o malla de registro).
+    replicas : int
+        Número total de réplicas.
+    modo : str
+        'tau' (tau-leaping) o 'gillespie' (exacto).
+    lote : int
+        Réplicas por lote (se simulan juntas como un arreglo).
+    umbral_brote : float
+        Tamaño final (susceptibles que se infectaron) a partir del cual se
+        cuenta un brote; si es < 1 se interpreta como fracción de la
+        población.
+    cuantiles : sequence of float
+        Cuantiles que se reportan en el tiempo.
+    semilla : int | None
+        Semilla raíz.
+    n_procesos : int | None
+        Procesos a usar; None usa todos los núcleos, 1 no crea procesos.
+
+    Regresa
+    -------
+    dict
+        't', 'media' y 'cuantiles' ({compartimento: arreglo}), 'qs',
+        'tamano_final' (susceptibles que se infectaron en cada réplica),
+        'prob_brote' y 'histogramas'.
+    """
+    modelo = _modelo(modelo)
+    if modo not in ("tau", "gillespie"):
+        raise ValueError("modo debe ser 'tau' o 'gillespie'.")
+    N = int(sum(np.asarray(x0[c]) for c in modelo.compartimentos))
+    if umbral_brote < 1:
+        umbral_brote = umbral_brote * N
+    tamanos = [min(lote, replicas - i) for i in range(0, replicas, lote)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    argumentos = [(modelo, x0, params, t_final, dt, modo, n, s, umbral_brote, max_bins)
+                  for n, s in zip(tamanos, semillas)]
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    if n_procesos == 1:
+        resultados = [_lote_ensamble(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            resultados = list(ejecutor.map(_lote_ensamble, *zip(*argumentos)))
+
+    histos = resultados[0][0]
+    for h, _, _ in resultados[1:]:
+        for c in modelo.compartimentos:
+            histos[c].combinar(h[c])
+    tamano_final = np.concatenate([r[1] for r in resultados])
+    brotes = sum(r[2] for r in resultados)
+    t = np.arange(histos[modelo.compartimentos[0]].conteos.shape[0]) * dt
+    return {"t": t, "qs": np.asarray(cuantiles),
+            "media": {c: histos[c].media() for c in modelo.compartimentos},
+            "cuantiles": {c: histos[c].cuantiles(cuantiles) for c in modelo.compartimentos},
+            "tamano_final": tamano_final, "prob_brote": brotes / replicas,
+            "histogramas": histos}
+
+
+def graficar_ensamble(resultado: dict, titulo: str = None):
+    """Grafica la media y la banda entre el primer y el último cuantil de cada compartimento."""
+    plt.figure()
+    t = resultado["t"]
+    for c, media in resultado["media"].items():
+        linea, = plt.plot(t, media, label=c)
+        q = resultado["cuantiles"][c]
+        plt.fill_between(t, q[0], q[-1], color=linea.get_color(), alpha=0.2)
+    plt.xlabel("t")
+    plt.ylabel("Individuos")
+    plt.title(titulo or f"Ensamble (P(brote) = {resultado['prob_brote']:.3f})")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,521 @@
+# =============================================================================
+# Modelo presa–depredador de Lotka–Volterra (Clase 22)
+# =============================================================================
+# Funciones de la Clase 22 reunidas en un módulo para importarlas desde los
+# notebooks con `from lotka_volterra import *`.
+from collections import OrderedDict
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional: sin él se usa la versión en Python
+    njit = None
+
+
+def _validar_parametros(alpha, beta, gamma, delta, X0, Y0, T, paso):
+    if any(p <= 0 for p in [alpha, beta, gamma, delta]):
+        raise ValueError("Se requieren α, β, γ, δ > 0.")
+    if X0 <= 0 or Y0 <= 0:
+        raise ValueError("Se requiere X0 > 0 y Y0 > 0.")
+    if T < 1:
+        raise ValueError("Se requiere T ≥ 1.")
+    if paso <= 0:
+        raise ValueError("El tamaño de paso Δt debe ser positivo.")
+
+
+def simular_LotkaVolterra(alpha: float, beta: float, gamma: float, delta: float,
+                          X0: float, Y0: float, T: int, paso: float = 0.1):
+    """
+    Simula el modelo depredador–presa de Lotka–Volterra con paso explícito Δt.
+
+    Parámetros
+    ----------
+    alpha : float
+        Tasa de crecimiento de las presas (α > 0).
+    beta : float
+        Tasa de depredación (β > 0).
+    gamma : float
+        Tasa de mortalidad de los depredadores (γ > 0).
+    delta : float
+        Eficiencia de conversión de presas en depredadores (δ > 0).
+    X0 : float
+        Población inicial de presas (X0 > 0).
+    Y0 : float
+        Población inicial de depredadores (Y0 > 0).
+    T : int
+        Número total de pasos de tiempo a simular.
+    paso : float, opcional
+        Tamaño del paso temporal Δt. Permite ajustar la resolución de la simulación
+        y obtener una representación más precisa de la dinámica.
+
+    Retorna
+    -------
+    X : np.ndarray
+        Serie temporal con la población de presas en cada paso (longitud T+1).
+    Y : np.ndarray
+        Serie temporal con la población de depredadores en cada paso (longitud T+1).
+    """
+    _validar_parametros(alpha, beta, gamma, delta, X0, Y0, T, paso)
+
+    X = np.zeros(T+1, dtype=float)
+    Y = np.zeros(T+1, dtype=float)
+    X[0], Y[0] = X0, Y0
+
+    for t in range(T):
+        dX = alpha*X[t] - beta*X[t]*Y[t]
+        dY = -gamma*Y[t] + delta*X[t]*Y[t]
+        X[t+1] = max(0.0, X[t] + paso * dX)  # actualiza con Δt
+        Y[t+1] = max(0.0, Y[t] + paso * dY)
+
+    return X, Y
+
+
+# =============================================================================
+# Trayectorias largas (Numba opcional)
+# =============================================================================
+# El paso de Euler depende del anterior, así que el ciclo en el tiempo no se
+# puede vectorizar. Si Numba está instalado se compila; si no, la misma
+# función corre en Python y el resultado es idéntico.
+def _compilar(f):
+    """Compila `f` con Numba si está disponible; si no, la regresa sin cambios."""
+    return njit(cache=True)(f) if njit is not None else f
+
+
+def _euler_lotka_volterra(alpha, beta, gamma, delta, X0, Y0, T, paso):
+    X = np.empty(T + 1)
+    Y = np.empty(T + 1)
+    X[0], Y[0] = X0, Y0
+    x, y = X0, Y0
+    for t in range(T):
+        dX = alpha*x - beta*x*y
+        dY = -gamma*y + delta*x*y
+        x, y = max(0.0, x + paso * dX), max(0.0, y + paso * dY)
+        X[t + 1] = x
+        Y[t + 1] = y
+    return X, Y
+
+
+_euler_lotka_volterra_compilado = _compilar(_euler_lotka_volterra)
+
+
+def simular_LotkaVolterra_rapido(alpha: float, beta: float, gamma: float, delta: float,
+                                 X0: float, Y0: float, T: int, paso: float = 0.1):
+    """
+    Igual que `simular_LotkaVolterra` pero con el ciclo compilado (si hay
+    Numba). Pensada para trayectorias de millones de pasos.
+    """
+    _validar_parametros(alpha, beta, gamma, delta, X0, Y0, T, paso)
+    return _euler_lotka_volterra_compilado(float(alpha), float(beta), float(gamma),
+                                           float(delta), float(X0), float(Y0), int(T),
+                                           float(paso))
+
+
+def verificar_simulacion_rapida(T: int = 5000) -> bool:
+    """Comprueba que `simular_LotkaVolterra_rapido` coincide con `simular_LotkaVolterra`."""
+    for params in [(0.3, 0.02, 0.4, 0.01, 40.0, 9.0), (1.0, 0.1, 1.5, 0.075, 10.0, 5.0)]:
+        lento = simular_LotkaVolterra(*params, T)
+        rapido = simular_LotkaVolterra_rapido(*params, T)
+        assert all(np.array_equal(a, b) for a, b in zip(lento, rapido)), \
+            f"No coincide con parámetros {params}."
+    return True
+
+
+# =============================================================================
+# Integradores de orden alto: RK4 y RK45 adaptativo con salida densa
+# =============================================================================
+# Euler necesita pasos muy pequeños para que las órbitas cerradas no se abran
+# en espiral. Los integradores de esta sección avanzan a la vez un conjunto de
+# condiciones iniciales (X0, Y0) de cualquier forma; el estado es un arreglo
+# (2, *forma) con presas y depredadores.
+def campo_LotkaVolterra(X, Y, alpha, beta, gamma, delta):
+    """Campo vectorial (dX/dt, dY/dt) del modelo, vectorizado sobre X e Y."""
+    return alpha*X - beta*X*Y, -gamma*Y + delta*X*Y
+
+
+def invariante_LotkaVolterra(X, Y, alpha, beta, gamma, delta):
+    """
+    Cantidad conservada V = δX − γ ln X + βY − α ln Y. Sobre la solución
+    exacta es constante, así que su variación mide el error del integrador.
+    """
+    return delta*X - gamma*np.log(X) + beta*Y - alpha*np.log(Y)
+
+
+# Coeficientes de Dormand–Prince 5(4) y de su interpolante de orden 4.
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+]
+_DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+_DP_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+_DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+class SolucionDensa:
+    """
+    Interpolante continuo de una solución por pasos.
+
+    En el paso k, con θ = (t - t_k)/h_k en [0, 1]:
+        y(t) = y_k + h_k * Σ_j Q_k[..., j] θ^(j+1)
+    Con RK45 es el interpolante de orden 4 de Dormand–Prince; con RK4 y Euler
+    es el polinomio cúbico de Hermite entre nodos.
+    """
+
+    def __init__(self, t: np.ndarray, y: np.ndarray, Q: np.ndarray):
+        self.t = t    # (n+1,)
+        self.y = y    # (n+1, 2, *forma)
+        self.Q = Q    # (n, 2, *forma, 4)
+
+    def __call__(self, t):
+        """Regresa (X, Y) evaluados en los tiempos `t` (escalar o arreglo)."""
+        t = np.asarray(t, dtype=float)
+        k = np.clip(np.searchsorted(self.t, t, side="right") - 1, 0, len(self.t) - 2)
+        h = self.t[k + 1] - self.t[k]
+        theta = (t - self.t[k]) / h
+        potencias = theta[..., None] ** np.arange(1, 5)            # (*t, 4)
+        forma = (1,) * (self.y.ndim - 1)
+        p = potencias.reshape(potencias.shape[:-1] + forma + (4,))
+        y = self.y[k] + h.reshape(h.shape + forma) * np.sum(self.Q[k] * p, axis=-1)
+        y = np.moveaxis(y, t.ndim, 0)                              # (2, *t, *forma)
+        return y[0], y[1]
+
+
+def _hermite(y0, y1, f0, f1, h):
+    """Coeficientes Q del cúbico de Hermite en la forma de `SolucionDensa`."""
+    d = (y1 - y0) / h
+    return np.stack([f0, 3*d - 2*f0 - f1, f0 + f1 - 2*d, np.zeros_like(f0)], axis=-1)
+
+
+def integrar_LotkaVolterra(alpha: float, beta: float, gamma: float, delta: float,
+                           X0, Y0, t_final: float, metodo: str = "rk45",
+                           paso: float = 0.1, rtol: float = 1e-6, atol: float = 1e-9,
+                           t_eval=None, densa: bool = True, max_pasos: int = 1_000_000) -> dict:
+    """
+    Integra el modelo de Lotka–Volterra para un conjunto de condiciones iniciales.
+
+    Parámetros
+    ----------
+    alpha, beta, gamma, delta : float
+        Parámetros del modelo (> 0), como en `simular_LotkaVolterra`.
+    X0, Y0 : float | array_like
+        Condiciones iniciales (> 0); se difunden entre sí y todas las
+        trayectorias se integran juntas.
+    t_final : float
+        Tiempo final (el inicial es 0).
+    metodo : str
+        'euler' (paso fijo, igual que `simular_LotkaVolterra`), 'rk4' (paso
+        fijo) o 'rk45' (Dormand–Prince con paso adaptativo).
+    paso : float
+        Tamaño de paso para 'euler' y 'rk4'; paso inicial para 'rk45'.
+    rtol, atol : float
+        Tolerancias relativa y absoluta de 'rk45'. El paso es común a todo el
+        conjunto y se ajusta con la trayectoria de mayor error.
+    t_eval : array_like | None
+        Si se da, la solución se regresa en estos tiempos usando la salida
+        densa; si no, en los nodos de la integración.
+    densa : bool
+        Guardar el interpolante (`SolucionDensa`) en el resultado.
+    max_pasos : int
+        Límite de pasos aceptados.
+
+    Regresa
+    -------
+    dict
+        't' : tiempos de salida.
+        'X', 'Y' : arreglos (len(t), *forma).
+        'pasos', 'rechazados', 'evaluaciones' : conteos de la integración.
+        'error_local' : suma de las estimaciones de error local (sólo 'rk45';
+        nan para los demás), por trayectoria.
+        'error_invariante' : máximo de |V(t) − V(0)| sobre los nodos, por
+        trayectoria (ver `invariante_LotkaVolterra`).
+        'densa' : `SolucionDensa` o None.
+    """
+    _validar_parametros(alpha, beta, gamma, delta, np.min(X0), np.min(Y0), 1, paso)
+    X0, Y0 = np.broadcast_arrays(np.asarray(X0, dtype=float), np.asarray(Y0, dtype=float))
+    y = np.stack([X0, Y0]).astype(float)
+
+    def f(y):
+        return np.stack(campo_LotkaVolterra(y[0], y[1], alpha, beta, gamma, delta))
+
+    tiempos, estados, coefs = [0.0], [y], []
+    rechazados = 0
+    evaluaciones = 0
+    error_local = np.full(X0.shape, np.nan)
+
+    if metodo in ("euler", "rk4"):
+        n = int(np.ceil(t_final / paso - 1e-12))
+        h = t_final / n
+        fy = f(y); evaluaciones += 1
+        for _ in range(n):
+            if metodo == "euler":
+                y_nuevo = np.maximum(0.0, y + h * fy)
+            else:
+                k2 = f(y + h/2 * fy)
+                k3 = f(y + h/2 * k2)
+                k4 = f(y + h * k3)
+                y_nuevo = y + h/6 * (fy + 2*k2 + 2*k3 + k4)
+                evaluaciones += 3
+            f_nuevo = f(y_nuevo); evaluaciones += 1
+            if densa:
+                coefs.append(_hermite(y, y_nuevo, fy, f_nuevo, h))
+            tiempos.append(tiempos[-1] + h)
+            estados.append(y_nuevo)
+            y, fy = y_nuevo, f_nuevo
+    elif metodo == "rk45":
+        error_local = np.zeros(X0.shape)
+        t, h = 0.0, min(paso, t_final)
+        k = np.empty((7, *y.shape))
+        k[0] = f(y); evaluaciones += 1
+        while t < t_final:
+            if len(tiempos) > max_pasos:
+                raise RuntimeError(f"Se excedieron {max_pasos} pasos en `integrar_LotkaVolterra`.")
+            h = min(h, t_final - t)
+            for i in range(1, 6):
+                k[i] = f(y + h * np.tensordot(_DP_A[i], k[:i], axes=1))
+            y_nuevo = y + h * np.tensordot(_DP_B[:6], k[:6], axes=1)
+            k[6] = f(y_nuevo)
+            evaluaciones += 6
+            err = h * np.tensordot(_DP_E, k, axes=1)
+            escala = atol + rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+            norma = np.sqrt(np.mean((err / escala)**2, axis=0))
+            peor = float(np.max(norma))
+            if peor <= 1.0:
+                if densa:
+                    coefs.append(np.tensordot(np.moveaxis(k, 0, -1), _DP_P, axes=1))
+                t += h
+                tiempos.append(t)
+                estados.append(y_nuevo)
+                error_local += np.max(np.abs(err), axis=0)
+                y = y_nuevo
+                k[0] = k[6]   # FSAL: la última etapa es la primera del siguiente paso
+            else:
+                rechazados += 1
+            h *= 10.0 if peor == 0 else min(10.0, max(0.2, 0.9 * peor**(-1/5)))
+    else:
+        raise ValueError("metodo debe ser 'euler', 'rk4' o 'rk45'.")
+
+    t_nodos = np.array(tiempos)
+    Ynodos = np.stack(estados)
+    solucion = SolucionDensa(t_nodos, Ynodos, np.stack(coefs)) if densa and coefs else None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        V = invariante_LotkaVolterra(Ynodos[:, 0], Ynodos[:, 1], alpha, beta, gamma, delta)
+    error_invariante = np.max(np.abs(V - V[0]), axis=0)
+
+    if t_eval is not None:
+        if solucion is None:
+            raise ValueError("`t_eval` requiere densa=True.")
+        t_salida = np.asarray(t_eval, dtype=float)
+        X, Y = solucion(t_salida)
+    else:
+        t_salida, X, Y = t_nodos, Ynodos[:, 0], Ynodos[:, 1]
+
+    return {"t": t_salida, "X": X, "Y": Y, "pasos": len(t_nodos) - 1,
+            "rechazados": rechazados, "evaluaciones": evaluaciones,
+            "error_local": error_local, "error_invariante": error_invariante,
+            "densa": solucion}
+
+
+def comparar_integradores(alpha: float = 0.3, beta: float = 0.02, gamma: float = 0.4,
+                          delta: float = 0.01, X0: float = 40.0, Y0: float = 9.0,
+                          t_final: float = 100.0) -> dict:
+    """
+    Imprime pasos, evaluaciones del campo y error en el invariante de Euler,
+    RK4 y RK45 para una misma órbita.
+
+    Regresa
+    -------
+    dict
+        {nombre: resultado de `integrar_LotkaVolterra`}
+    """
+    casos = {"euler (paso 0.1)": dict(metodo="euler", paso=0.1),
+             "euler (paso 0.001)": dict(metodo="euler", paso=0.001),
+             "rk4 (paso 0.5)": dict(metodo="rk4", paso=0.5),
+             "rk45 (rtol 1e-6)": dict(metodo="rk45", rtol=1e-6)}
+    resultados = {}
+    for nombre, opciones in casos.items():
+        r = integrar_LotkaVolterra(alpha, beta, gamma, delta, X0, Y0, t_final,
+                                   densa=False, **opciones)
+        resultados[nombre] = r
+        print(f"{nombre:20s} pasos: {r['pasos']:7d}  evaluaciones: {r['evaluaciones']:7d}"
+              f"  |ΔV|: {float(r['error_invariante']):.2e}")
+    return resultados
+
+
+# =============================================================================
+# Plano fase con caché
+# =============================================================================
+class PlanoFase:
+    """
+    Campo vectorial, nulclinas y trayectorias del plano fase, guardados en una
+    caché LRU con clave (alpha, beta, gamma, delta, limites, resolucion).
+
+    Al volver a pedir una combinación ya calculada (por ejemplo al regresar un
+    slider a un valor anterior) se dibuja desde la caché sin recalcular; si la
+    caché está llena se descarta la combinación usada hace más tiempo.
+
+    Parámetros
+    ----------
+    capacidad : int
+        Número máximo de combinaciones guardadas.
+    """
+
+    def __init__(self, capacidad: int = 32):
+        self.capacidad = capacidad
+        self._cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _entrada(self, alpha, beta, gamma, delta, limites, resolucion) -> dict:
+        clave = (float(alpha), float(beta), float(gamma), float(delta),
+                 tuple(float(v) for v in limites), int(resolucion))
+        if clave in self._cache:
+            self._cache.move_to_end(clave)
+            self.aciertos += 1
+            return self._cache[clave]
+        self.fallos += 1
+        xmin, xmax, ymin, ymax = clave[4]
+        X, Y = np.meshgrid(np.linspace(xmin, xmax, resolucion),
+                           np.linspace(ymin, ymax, resolucion))
+        U, V = campo_LotkaVolterra(X, Y, alpha, beta, gamma, delta)   # una sola pasada
+        entrada = {"X": X, "Y": Y, "U": U, "V": V,
+                   "nulclinas": self._nulclinas(alpha, beta, gamma, delta, clave[4]),
+                   "trayectorias": {}}
+        self._cache[clave] = entrada
+        if len(self._cache) > self.capacidad:
+            self._cache.popitem(last=False)
+        return entrada
+
+    @staticmethod
+    def _nulclinas(alpha, beta, gamma, delta, limites) -> dict:
+        """Segmentos de las nulclinas dentro de los límites."""
+        xmin, xmax, ymin, ymax = limites
+        return {"dX=0": [([0, 0], [ymin, ymax]), ([xmin, xmax], [alpha/beta] * 2)],
+                "dY=0": [([xmin, xmax], [0, 0]), ([gamma/delta] * 2, [ymin, ymax])]}
+
+    def campo(self, alpha, beta, gamma, delta, limites=(0, 100, 0, 50), resolucion=25):
+        """Regresa (X, Y, U, V): malla y campo (dX/dt, dY/dt) evaluado en ella."""
+        e = self._entrada(alpha, beta, gamma, delta, limites, resolucion)
+        return e["X"], e["Y"], e["U"], e["V"]
+
+    def nulclinas(self, alpha, beta, gamma, delta, limites=(0, 100, 0, 50), resolucion=25):
+        """Regresa {'dX=0': [(xs, ys), ...], 'dY=0': [...]}."""
+        return self._entrada(alpha, beta, gamma, delta, limites, resolucion)["nulclinas"]
+
+    def trayectorias(self, alpha, beta, gamma, delta, limites=(0, 100, 0, 50),
+                     resolucion=25, n_semillas=6, t_final=50.0, n_puntos=400):
+        """
+        Integra juntas (RK45) las órbitas que salen de una malla de
+        n_semillas x n_semillas puntos dentro de los límites.
+
+        Regresa
+        -------
+        (X, Y) : (np.ndarray, np.ndarray)
+            Arreglos (n_puntos, n_semillas, n_semillas) muestreados con la
+            salida densa.
+        """
+        e = self._entrada(alpha, beta, gamma, delta, limites, resolucion)
+        return self._trayectorias_en(e, alpha, beta, gamma, delta, limites,
+                                     n_semillas, t_final, n_puntos)
+
+    @staticmethod
+    def _trayectorias_en(e, alpha, beta, gamma, delta, limites, n_semillas, t_final, n_puntos):
+        """Órbitas de la entrada `e`, calculadas la primera vez que se piden."""
+        clave = (int(n_semillas), float(t_final), int(n_puntos))
+        if clave not in e["trayectorias"]:
+            xmin, xmax, ymin, ymax = limites
+            # Semillas en el interior: sobre los ejes las órbitas no se mueven del eje.
+            xs = np.linspace(xmin, xmax, n_semillas + 2)[1:-1]
+            ys = np.linspace(ymin, ymax, n_semillas + 2)[1:-1]
+            X0, Y0 = np.meshgrid(np.maximum(xs, 1e-6), np.maximum(ys, 1e-6))
+            r = integrar_LotkaVolterra(alpha, beta, gamma, delta, X0, Y0, t_final,
+                                       t_eval=np.linspace(0, t_final, n_puntos))
+            e["trayectorias"][clave] = (r["X"], r["Y"])
+        return e["trayectorias"][clave]
+
+    def vista(self, alpha, beta, gamma, delta, limites=(0, 100, 0, 50), resolucion=25,
+              n_semillas=6, t_final=50.0, n_puntos=400) -> dict:
+        """
+        Todo lo necesario para dibujar el plano fase con una sola consulta a la
+        caché (cuenta un acierto o un fallo por llamada).
+
+        Regresa
+        -------
+        dict
+            {'X', 'Y', 'U', 'V', 'nulclinas', 'trayectorias': (TX, TY)}.
+        """
+        e = self._entrada(alpha, beta, gamma, delta, limites, resolucion)
+        return {"X": e["X"], "Y": e["Y"], "U": e["U"], "V": e["V"],
+                "nulclinas": e["nulclinas"],
+                "trayectorias": self._trayectorias_en(e, alpha, beta, gamma, delta, limites,
+                                                      n_semillas, t_final, n_puntos)}
+
+    def info_cache(self) -> dict:
+        return {"entradas": len(self._cache), "capacidad": self.capacidad,
+                "aciertos": self.aciertos, "fallos": self.fallos}
+
+    def interactivo(self, limites=(0, 100, 0, 50), resolucion=25, n_semillas=6,
+                    t_final=50.0):
+        """
+        Plano fase con sliders para α, β, γ, δ. La figura se crea una vez: las
+        flechas (`set_UVC`), las nulclinas y las órbitas (`LineCollection`) sólo
+        cambian de datos, y cada combinación de parámetros se calcula una sola
+        vez gracias a la caché. `ipywidgets` sólo se necesita para este método.
+
+        Regresa
+        -------
+        El objeto de `interact` con los sliders.
+        """
+        from ipywidgets import interact, FloatSlider
+
+        fig, ax = plt.subplots(figsize=(6, 5))
+        X, Y, U, V = self.campo(0.3, 0.02, 0.4, 0.01, limites, resolucion)
+        norma = np.hypot(U, V) + 1e-12
+        flechas = ax.quiver(X, Y, U / norma, V / norma, norma, cmap="viridis", alpha=0.6)
+        orbitas = LineCollection([], linewidths=1, colors="k")
+        ax.add_collection(orbitas)
+        nul_x = [ax.plot([], [], "--", color="tab:blue")[0] for _ in range(2)]
+        nul_y = [ax.plot([], [], "--", color="tab:red")[0] for _ in range(2)]
+        nul_x[0].set_label("dX/dt = 0")
+        nul_y[0].set_label("dY/dt = 0")
+        ax.set_xlim(limites[0], limites[1])
+        ax.set_ylim(limites[2], limites[3])
+        ax.set_xlabel("Presas $X$")
+        ax.set_ylabel("Depredadores $Y$")
+        ax.legend(loc="upper right")
+        ax.grid(True)
+
+        def actualizar(alpha=0.3, beta=0.02, gamma=0.4, delta=0.01):
+            v = self.vista(alpha, beta, gamma, delta, limites, resolucion, n_semillas, t_final)
+            norma = np.hypot(v["U"], v["V"]) + 1e-12
+            flechas.set_UVC(v["U"] / norma, v["V"] / norma, norma)
+            for linea, (xs, ys) in zip(nul_x, v["nulclinas"]["dX=0"]):
+                linea.set_data(xs, ys)
+            for linea, (xs, ys) in zip(nul_y, v["nulclinas"]["dY=0"]):
+                linea.set_data(xs, ys)
+            TX, TY = v["trayectorias"]
+            puntos = np.stack([TX, TY], axis=-1).reshape(len(TX), -1, 2)
+            orbitas.set_segments(list(np.swapaxes(puntos, 0, 1)))
+            ax.set_title(f"Plano fase (α={alpha:.2f}, β={beta:.3f}, γ={gamma:.2f}, δ={delta:.3f})")
+            fig.canvas.draw_idle()
+
+        return interact(
+            actualizar,
+            alpha=FloatSlider(value=0.3, min=0.05, max=1.0, step=0.05, description="α"),
+            beta=FloatSlider(value=0.02, min=0.005, max=0.1, step=0.005, readout_format=".3f", description="β"),
+            gamma=FloatSlider(value=0.4, min=0.05, max=1.0, step=0.05, description="γ"),
+            delta=FloatSlider(value=0.01, min=0.002, max=0.05, step=0.002, readout_format=".3f", description="δ")
+        )
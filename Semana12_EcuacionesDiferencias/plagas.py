@@ -0,0 +1,588 @@
+# =============================================================================
+# Control de plagas por umbral (Clase 23)
+# =============================================================================
+# Funciones de la Clase 23 reunidas en un módulo para importarlas desde los
+# notebooks con `from plagas import *`.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional: sin él se usa la versión en Python
+    njit = None
+
+
+# =============================================================================
+# Código común para los tres modelos
+# =============================================================================
+def Calcular_metricas(series: np.ndarray, threshold: float, tail_frac: float = 0.3):
+    """
+    Calcula métricas simples sobre la serie simulada.
+
+    Parámetros
+    ----------
+    series : np.ndarray
+        Serie N_t de longitud Tpasos+1 (t = 0..Tpasos).
+    threshold : float
+        Umbral T usado para contar activaciones.
+    tail_frac : float, opcional (default=0.3)
+        Fracción final de la serie para el promedio 'en régimen'.
+
+    Returns
+    -------
+    dict
+        {'promedio_final': float, 'min_final': float, 'max_final': float, '% activaciones': float}
+    """
+    tail = series[int((1-tail_frac)*len(series)):]
+    activaciones = np.mean(series[:-1] >= threshold) * 100.0
+    return {
+        "promedio_final": float(np.mean(tail)),
+        "min_final": float(np.min(tail)),
+        "max_final": float(np.max(tail)),
+        "% activaciones": float(activaciones)
+    }
+
+
+def graficar_trayectoria(series: np.ndarray, params: list, title: str = "Serie temporal"):
+    """
+    Grafica la serie N_t y muestra líneas horizontales de K y T (si T es finito).
+    *No* establece estilos ni colores específicos.
+    """
+    plt.figure()
+    plt.plot(series, label="N_t")
+    if params[2] < 1e8:
+        plt.axhline(params[2], linestyle="--", label="Umbral T")
+    plt.axhline(params[1], linestyle=":", label="Capacidad K")
+    plt.title(title)
+    plt.xlabel("t (periodos)")
+    plt.ylabel("Población N_t")
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+
+# =============================================================================
+# Modelos A, B y C
+# =============================================================================
+def G(N: float, r: float, K: float) -> float:
+    """
+    Devuelve un paso de crecimiento logístico: G(N) = N + r*N*(1 - N/K).
+
+    Parámetros
+    ----------
+    N : float
+        Población actual N_t (debe ser no negativa).
+    r : float
+        Tasa intrínseca de crecimiento por periodo (r > 0).
+    K : float
+        Capacidad de carga (K > 0).
+
+    Returns
+    -------
+    float
+        Población al final del crecimiento (sin control aplicado aún).
+    """
+    return N + r * N * (1 - N / K)
+
+
+def paso_A(Nt: float, params: list) -> float:
+    """
+    Modelo A: umbral con 'solo control' (sin crecimiento en ese periodo cuando N_t >= T).
+
+    Reglas
+    ------
+    - Si N_t < T: aplicar crecimiento logístico G(N_t).
+    - Si N_t >= T: aplicar control instantáneo N_{t+1} = (1 - eta)*N_t.
+
+    Parámetros
+    ----------
+    Nt : float
+        Población actual N_t (debe ser no negativa).
+    params : list
+        Contiene [r, K, T, eta].
+
+    Returns
+    -------
+    float
+        Valor de N_{t+1} tras aplicar la regla del modelo A.
+    """
+    r, K, T, eta = params
+    if Nt < T:
+        return G(Nt, r, K)
+    else:
+        return (1 - eta) * Nt
+
+
+def step_B(Nt: float, params: list) -> float:
+    """
+    Modelo B: crecer y luego controlar.
+
+    Reglas
+    ------
+    - Si N_t < T: N_{t+1} = G(N_t).
+    - Si N_t >= T: N_{t+1} = (1 - eta) * G(N_t).
+    """
+    r, K, T, eta = params
+    if Nt < T:
+        return G(Nt, r, K)
+    else:
+        return (1 - eta) * G(Nt, r, K)
+
+
+def step_C(Nt: float, params: list) -> float:
+    """
+    Modelo C: controlar y luego crecer.
+
+    Reglas
+    ------
+    - Si N_t < T: N_{t+1} = G(N_t).
+    - Si N_t >= T: N_{t+1} = G((1 - eta) * N_t).
+    """
+    r, K, T, eta = params
+    if Nt < T:
+        return G(Nt, r, K)
+    else:
+        return G((1 - eta) * Nt, r, K)
+
+
+def simular(model_step, params: list) -> np.ndarray:
+    """
+    Simula Tpasos periodos usando una función de transición de un paso: model_step(N_t, params).
+
+    Parámetros
+    ----------
+    model_step : callable
+        Función de un paso (Nt: float, params: list) -> float.
+    params : list
+        Contiene r, K, T, eta, N0, Tpasos.
+
+    Returns
+    -------
+    np.ndarray
+        Serie N_t de longitud Tpasos+1 (incluye N_0).
+    """
+    r, K, T, eta = params[0:4]
+    N_t = params[4]  # N0
+    Tpasos = params[5]
+    series = np.zeros(Tpasos + 1)
+    series[0] = N_t
+
+    for t in range(1, Tpasos + 1):
+        N_t = model_step(N_t, params[0:4])
+        N_t = max(0, N_t)  # Forzar no-negatividad
+        series[t] = N_t
+
+    return series
+
+
+def contar_activaciones(series: np.ndarray, T: float) -> int:
+    """
+    Cuenta cuántos periodos activan el control, es decir, cuántos t cumplen N_t >= T.
+
+    Nota: evalúa sobre N_t (t=0..T-1), no incluye el último valor N_{Tpasos}.
+    """
+    return np.sum(series[:-1] >= T)
+
+
+# =============================================================================
+# Simulaciones largas (Numba opcional)
+# =============================================================================
+# Cada paso depende del anterior, así que el ciclo en el tiempo no se puede
+# vectorizar. Para los modelos A, B y C se usa un ciclo que Numba compila si
+# está instalado; si no, la misma función corre en Python.
+MODELOS = {paso_A: 0, step_B: 1, step_C: 2}
+
+
+def _compilar(f):
+    """Compila `f` con Numba si está disponible; si no, la regresa sin cambios."""
+    return njit(cache=True)(f) if njit is not None else f
+
+
+def _simular_modelo(modelo, r, K, T, eta, N0, Tpasos):
+    series = np.zeros(Tpasos + 1)
+    series[0] = N0
+    x = N0
+    for t in range(1, Tpasos + 1):
+        if x < T:
+            x = x + r * x * (1 - x / K)
+        elif modelo == 0:
+            x = (1 - eta) * x
+        elif modelo == 1:
+            x = (1 - eta) * (x + r * x * (1 - x / K))
+        else:
+            y = (1 - eta) * x
+            x = y + r * y * (1 - y / K)
+        x = max(0.0, x)
+        series[t] = x
+    return series
+
+
+_simular_modelo_compilado = _compilar(_simular_modelo)
+
+
+def simular_rapido(model_step, params: list) -> np.ndarray:
+    """
+    Igual que `simular`, con el ciclo compilado cuando `model_step` es
+    `paso_A`, `step_B` o `step_C`. Para otras funciones de paso se usa
+    `simular`.
+    """
+    if model_step not in MODELOS:
+        return simular(model_step, params)
+    r, K, T, eta, N0, Tpasos = params
+    return _simular_modelo_compilado(MODELOS[model_step], float(r), float(K), float(T),
+                                     float(eta), float(N0), int(Tpasos))
+
+
+def verificar_simular_rapido(Tpasos: int = 5000) -> bool:
+    """Comprueba que `simular_rapido` coincide con `simular` en los tres modelos."""
+    for params in ([0.8, 1000, 600, 0.30, 120, Tpasos], [2.7, 1000, 900, 0.5, 10, Tpasos]):
+        for model_step in MODELOS:
+            assert np.array_equal(simular(model_step, params), simular_rapido(model_step, params)), \
+                f"No coincide {model_step.__name__} con {params}."
+    return True
+
+
+# =============================================================================
+# Barrido de políticas (muchos parámetros a la vez)
+# =============================================================================
+# Para comparar políticas se avanza toda una malla de (r, K, T, eta) como un
+# arreglo: en cada periodo la regla del umbral se aplica con np.where. Las
+# métricas de `Calcular_metricas` se acumulan durante la simulación, así que
+# no se guardan las series.
+def _paso_vectorizado(modelo: int, x: np.ndarray, r, K, T, eta) -> np.ndarray:
+    """Un paso de los modelos A (0), B (1) o C (2) para un arreglo de poblaciones."""
+    crece = x < T
+    if modelo == 0:
+        x = np.where(crece, x + r * x * (1 - x / K), (1 - eta) * x)
+    elif modelo == 1:
+        g = x + r * x * (1 - x / K)
+        x = np.where(crece, g, (1 - eta) * g)
+    else:
+        y = np.where(crece, x, (1 - eta) * x)
+        x = y + r * y * (1 - y / K)
+    return np.maximum(x, 0.0)
+
+
+def _barrido_trozo(modelo: int, r, K, T, eta, N0, Tpasos: int, tail_frac: float):
+    """Simula un trozo (1D) de la malla y regresa sus métricas."""
+    inicio = int((1 - tail_frac) * (Tpasos + 1))
+    x = np.array(N0, dtype=float)
+    activaciones = np.zeros(x.shape)
+    suma = np.zeros(x.shape)
+    minimo = np.full(x.shape, np.inf)
+    maximo = np.full(x.shape, -np.inf)
+    for t in range(Tpasos + 1):
+        if t >= inicio:
+            suma += x
+            np.minimum(minimo, x, out=minimo)
+            np.maximum(maximo, x, out=maximo)
+        if t == Tpasos:
+            break
+        activaciones += x >= T
+        x = _paso_vectorizado(modelo, x, r, K, T, eta)
+    return (suma / (Tpasos + 1 - inicio), minimo, maximo,
+            activaciones / Tpasos * 100.0)
+
+
+def barrido_politicas(model_step, r, K, T, eta, N0, Tpasos: int, tail_frac: float = 0.3,
+                      trozo: int = 100_000, n_procesos: int = 1) -> dict:
+    """
+    Calcula las métricas de `Calcular_metricas` para una malla de parámetros.
+
+    `r`, `K`, `T`, `eta` y `N0` pueden ser escalares o arreglos que se
+    difunden entre sí (p. ej. T[:, None] y eta[None, :] dan una malla 2D). Es
+    equivalente a llamar `Calcular_metricas(simular(model_step, params), T)`
+    para cada combinación, pero todas avanzan juntas periodo a periodo.
+
+    Parámetros
+    ----------
+    model_step : callable
+        `paso_A`, `step_B` o `step_C`.
+    r, K, T, eta, N0 : float | array_like
+        Parámetros de los modelos y población inicial.
+    Tpasos : int
+        Número de periodos.
+    tail_frac : float
+        Fracción final de la serie para las métricas 'en régimen'.
+    trozo : int
+        Combinaciones que se simulan juntas; acota la memoria y es la unidad
+        que se reparte entre procesos.
+    n_procesos : int | None
+        Procesos a usar; None usa todos los núcleos, 1 no crea procesos.
+
+    Regresa
+    -------
+    dict
+        {'promedio_final', 'min_final', 'max_final', '% activaciones'}, cada
+        uno un arreglo con la forma de la malla.
+    """
+    if model_step not in MODELOS:
+        raise ValueError("model_step debe ser paso_A, step_B o step_C.")
+    r, K, T, eta, N0 = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                             for v in (r, K, T, eta, N0)))
+    forma = r.shape
+    planos = [v.ravel() for v in (r, K, T, eta, N0)]
+    argumentos = [(MODELOS[model_step], *(v[i:i + trozo] for v in planos), Tpasos, tail_frac)
+                  for i in range(0, max(r.size, 1), trozo)]
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    if n_procesos == 1:
+        partes = [_barrido_trozo(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            partes = list(ejecutor.map(_barrido_trozo, *zip(*argumentos)))
+
+    nombres = ("promedio_final", "min_final", "max_final", "% activaciones")
+    return {n: np.concatenate(c).reshape(forma) for n, c in zip(nombres, zip(*partes))}
+
+
+def mejor_umbral(resultado: dict, T, eta, metrica: str = "% activaciones",
+                 max_promedio: float = None) -> dict:
+    """
+    Busca en una malla (T, eta) la combinación que minimiza `metrica`.
+
+    Si se da `max_promedio`, sólo se consideran las combinaciones cuyo
+    promedio final no lo supera (p. ej. mantener la plaga bajo un nivel).
+    """
+    valores = np.array(resultado[metrica], dtype=float)
+    if max_promedio is not None:
+        valores[resultado["promedio_final"] > max_promedio] = np.inf
+    if not np.isfinite(valores).any():
+        raise ValueError("Ninguna combinación cumple la restricción.")
+    i = np.unravel_index(np.argmin(valores), valores.shape)
+    T = np.broadcast_to(np.asarray(T, dtype=float), valores.shape)
+    eta = np.broadcast_to(np.asarray(eta, dtype=float), valores.shape)
+    return {"T": float(T[i]), "eta": float(eta[i]), metrica: float(valores[i]),
+            "promedio_final": float(resultado["promedio_final"][i])}
+
+
+def graficar_mapas_metricas(resultado: dict, T_vals, eta_vals, title: str = "Barrido de políticas"):
+    """
+    Mapas de calor de las cuatro métricas sobre una malla T (filas) x eta (columnas),
+    como la que produce `barrido_politicas(..., T=T_vals[:, None], eta=eta_vals[None, :])`.
+    """
+    T_vals, eta_vals = np.asarray(T_vals), np.asarray(eta_vals)
+    fig, axes = plt.subplots(2, 2, figsize=(10, 8))
+    extent = [eta_vals[0], eta_vals[-1], T_vals[0], T_vals[-1]]
+    for ax, (nombre, valores) in zip(axes.ravel(), resultado.items()):
+        im = ax.imshow(valores, origin="lower", aspect="auto", extent=extent)
+        fig.colorbar(im, ax=ax)
+        ax.set_title(nombre)
+        ax.set_xlabel("eta")
+        ax.set_ylabel("Umbral T")
+    fig.suptitle(title)
+    fig.tight_layout()
+    plt.show()
+
+
+# =============================================================================
+# Métricas en streaming (memoria O(1))
+# =============================================================================
+class AcumuladorMetricas:
+    """
+    Métricas de `Calcular_metricas` y `contar_activaciones` calculadas en línea.
+
+    Se alimenta con `agregar(x, t)` en cada periodo t = 0..Tpasos, con un
+    valor o con un arreglo de valores (una réplica por entrada). La cola es
+    la misma que usa `Calcular_metricas`: los periodos
+    t >= int((1 - tail_frac) * (Tpasos + 1)). Las activaciones cuentan
+    N_t >= threshold para t < Tpasos. Los cuantiles salen de un histograma
+    fijo en `limites` (los valores fuera se cuentan en las cajas extremas;
+    el mínimo y el máximo sí son exactos).
+
+    Dos acumuladores con la misma configuración se combinan con `combinar`,
+    ya sea que cubran réplicas distintas o tramos distintos de la misma
+    serie, así que cada proceso puede resumir su parte por separado.
+
+    La media y la varianza de la cola se llevan como (n, media, M2) con el
+    método de Welford y se combinan con la fórmula de Chan, que no pierde
+    precisión como E[x²] - media² en series largas o ensambles grandes.
+    """
+
+    def __init__(self, threshold: float, Tpasos: int, tail_frac: float = 0.3,
+                 limites: tuple = (0.0, 1.0), bins: int = 1024):
+        self.threshold = threshold
+        self.Tpasos = Tpasos
+        self.inicio_cola = int((1 - tail_frac) * (Tpasos + 1))
+        self.limites = (float(limites[0]), float(limites[1]))
+        self.bins = bins
+        self.n = 0
+        self.suma = 0.0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.n_cola = 0
+        self.media_cola = 0.0
+        self.m2_cola = 0.0
+        self.min_cola = np.inf
+        self.max_cola = -np.inf
+        self.n_activables = 0
+        self.activaciones = 0
+        self.histograma = np.zeros(bins, dtype=np.int64)
+
+    def agregar(self, x, t: int) -> None:
+        """Registra el valor (o los valores) de N_t en el periodo t."""
+        x = np.asarray(x, dtype=float)
+        self.n += x.size
+        self.suma += float(x.sum())
+        self.minimo = min(self.minimo, float(x.min()))
+        self.maximo = max(self.maximo, float(x.max()))
+        if t < self.Tpasos:
+            self.n_activables += x.size
+            self.activaciones += int(np.count_nonzero(x >= self.threshold))
+        if t >= self.inicio_cola:
+            media = float(x.mean())
+            self._sumar_momentos(x.size, media, float(((x - media) ** 2).sum()))
+            self.min_cola = min(self.min_cola, float(x.min()))
+            self.max_cola = max(self.max_cola, float(x.max()))
+            lo, hi = self.limites
+            caja = ((x - lo) / (hi - lo) * self.bins).astype(np.int64)
+            self.histograma += np.bincount(np.clip(caja, 0, self.bins - 1).ravel(),
+                                           minlength=self.bins)
+
+    def _sumar_momentos(self, n: int, media: float, m2: float) -> None:
+        """Agrega (n, media, M2) de otro grupo de valores de la cola (Chan et al.)."""
+        if n == 0:
+            return
+        total = self.n_cola + n
+        delta = media - self.media_cola
+        self.media_cola += delta * n / total
+        self.m2_cola += m2 + delta * delta * self.n_cola * n / total
+        self.n_cola = total
+
+    def combinar(self, otro: "AcumuladorMetricas") -> "AcumuladorMetricas":
+        """Suma a este acumulador las observaciones de `otro` (misma configuración)."""
+        if (otro.threshold, otro.inicio_cola, otro.limites, otro.bins) != \
+                (self.threshold, self.inicio_cola, self.limites, self.bins):
+            raise ValueError("Sólo se combinan acumuladores con la misma configuración.")
+        self.n += otro.n
+        self.suma += otro.suma
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self._sumar_momentos(otro.n_cola, otro.media_cola, otro.m2_cola)
+        self.min_cola = min(self.min_cola, otro.min_cola)
+        self.max_cola = max(self.max_cola, otro.max_cola)
+        self.n_activables += otro.n_activables
+        self.activaciones += otro.activaciones
+        self.histograma += otro.histograma
+        return self
+
+    def cuantiles(self, qs) -> np.ndarray:
+        """Cuantiles aproximados de la cola (interpolando dentro de cada caja)."""
+        if self.n_cola == 0:
+            return np.full(np.atleast_1d(qs).shape, np.nan)
+        lo, hi = self.limites
+        acumulado = np.cumsum(self.histograma)
+        salida = []
+        for q in np.atleast_1d(qs):
+            objetivo = q * self.n_cola
+            i = min(int(np.searchsorted(acumulado, objetivo)), self.bins - 1)
+            previo = acumulado[i - 1] if i > 0 else 0
+            fraccion = (objetivo - previo) / max(self.histograma[i], 1)
+            salida.append(lo + (i + fraccion) * (hi - lo) / self.bins)
+        return np.clip(salida, self.min_cola, self.max_cola)
+
+    def resultado(self, qs=(0.05, 0.5, 0.95)) -> dict:
+        """
+        Las métricas de `Calcular_metricas` más estadísticas globales y
+        cuantiles de la cola. Si un tramo no tiene valores en la cola (o
+        ninguno), sus estadísticas valen nan, como `np.mean` de un corte vacío.
+        """
+        hay_cola, hay_datos = self.n_cola > 0, self.n > 0
+        return {
+            "promedio_final": self.media_cola if hay_cola else np.nan,
+            "min_final": self.min_cola if hay_cola else np.nan,
+            "max_final": self.max_cola if hay_cola else np.nan,
+            "% activaciones": (100.0 * self.activaciones / self.n_activables
+                               if self.n_activables else np.nan),
+            "activaciones": self.activaciones,
+            "std_final": float(np.sqrt(self.m2_cola / self.n_cola)) if hay_cola else np.nan,
+            "promedio": self.suma / self.n if hay_datos else np.nan,
+            "min": self.minimo if hay_datos else np.nan,
+            "max": self.maximo if hay_datos else np.nan,
+            "cuantiles_final": dict(zip(np.atleast_1d(qs).tolist(), self.cuantiles(qs).tolist())),
+        }
+
+
+def _limites_por_defecto(r, K, T, N0) -> tuple:
+    """Cota para el histograma: N0, T y el máximo de G, K(1+r)^2/(4r)."""
+    return (0.0, float(np.max([np.max(N0), np.max(T), np.max(K * (1 + r) ** 2 / (4 * r))])))
+
+
+def simular_acumulado(model_step, params: list, tail_frac: float = 0.3,
+                      acumulador: AcumuladorMetricas = None) -> AcumuladorMetricas:
+    """
+    Igual que `simular`, pero en vez de guardar la serie alimenta un
+    `AcumuladorMetricas`; la memoria no depende de Tpasos.
+
+    `acumulador.resultado()` da las mismas métricas que
+    `Calcular_metricas(simular(model_step, params), T, tail_frac)`.
+    """
+    r, K, T, eta, N_t, Tpasos = params
+    if acumulador is None:
+        acumulador = AcumuladorMetricas(T, Tpasos, tail_frac, _limites_por_defecto(r, K, T, N_t))
+    acumulador.agregar(N_t, 0)
+    for t in range(1, Tpasos + 1):
+        N_t = max(0, model_step(N_t, params[0:4]))
+        acumulador.agregar(N_t, t)
+    return acumulador
+
+
+def _ensamble_trozo(modelo: int, r, K, T, eta, N0, Tpasos: int, tail_frac: float, limites: tuple):
+    acumulador = AcumuladorMetricas(T, Tpasos, tail_frac, limites)
+    x = np.array(N0, dtype=float)
+    acumulador.agregar(x, 0)
+    for t in range(1, Tpasos + 1):
+        x = _paso_vectorizado(modelo, x, r, K, T, eta)
+        acumulador.agregar(x, t)
+    return acumulador
+
+
+def metricas_ensamble(model_step, params: list, N0s, tail_frac: float = 0.3,
+                      trozo: int = 100_000, n_procesos: int = 1) -> dict:
+    """
+    Métricas agregadas de un ensamble de condiciones iniciales sin guardar trayectorias.
+
+    Parámetros
+    ----------
+    model_step : callable
+        `paso_A`, `step_B` o `step_C`.
+    params : list
+        [r, K, T, eta, Tpasos] (sin N0).
+    N0s : array_like
+        Poblaciones iniciales, una por réplica.
+    tail_frac : float
+        Fracción final de cada serie para las métricas 'en régimen'.
+    trozo : int
+        Réplicas que se simulan juntas; cada trozo tiene su acumulador.
+    n_procesos : int | None
+        Procesos a usar; None usa todos los núcleos, 1 no crea procesos.
+
+    Regresa
+    -------
+    dict
+        `AcumuladorMetricas.resultado()` del ensamble completo.
+    """
+    if model_step not in MODELOS:
+        raise ValueError("model_step debe ser paso_A, step_B o step_C.")
+    r, K, T, eta, Tpasos = params
+    N0s = np.asarray(N0s, dtype=float).ravel()
+    limites = _limites_por_defecto(r, K, T, N0s)
+    argumentos = [(MODELOS[model_step], r, K, T, eta, N0s[i:i + trozo], Tpasos, tail_frac, limites)
+                  for i in range(0, len(N0s), trozo)]
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    if n_procesos == 1:
+        partes = [_ensamble_trozo(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            partes = list(ejecutor.map(_ensamble_trozo, *zip(*argumentos)))
+
+    total = partes[0]
+    for parte in partes[1:]:
+        total.combinar(parte)
+    return total.resultado()
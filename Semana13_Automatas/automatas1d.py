@@ -0,0 +1,651 @@
+# =============================================================================
+# Autómatas celulares elementales (1D) — versión vectorizada
+# =============================================================================
+# Este módulo reúne las funciones de la Clase 25 para poder importarlas desde
+# los notebooks con `from automatas1d import *`. La versión de `aplicar_regla`
+# con ciclo `for` se conserva como referencia; `paso_regla` calcula toda la
+# fila de una sola vez con operaciones de arreglos de NumPy.
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Historia en disco y detección de ciclos, compartidas con `vida` (Clase 27).
+# `detectar_ciclo` no se usa aquí: se reexporta a propósito para que
+# `from automatas1d import *` lo ofrezca junto con `evolucion_1d_iter`.
+from historia_automatas import IndiceEstados, detectar_ciclo, escribir_en_disco
+
+
+FRONTERAS = ("periodica", "cero", "reflejante")
+
+
+# =============================================================================
+# Regla y estados iniciales
+# =============================================================================
+def bits_regla(R: int) -> np.ndarray:
+    """
+    Regresa los bits b[0..7] de la regla R.
+    b_0 corresponde a 000 y b_7 a 111.
+
+    Parámetros
+    ----------
+    R : int
+        Número de la regla de Wolfram (0 ≤ R ≤ 255).
+
+    Regresa
+    -------
+    np.ndarray
+        Arreglo de 8 bits (uint8): [b0, b1, ..., b7].
+    """
+    R = int(R)
+    if R < 0 or R > 255:
+        raise ValueError("R debe estar entre 0 y 255.")
+    bits_str = format(R, "08b")       # p.ej. 30 -> '00011110'
+    bits = np.array(list(bits_str[::-1]), dtype=np.uint8)  # invertimos para que b_0 sea 000
+    return bits
+
+
+def estado_central(N: int) -> np.ndarray:
+    """Estado de N celdas en 0 con una sola celda encendida al centro."""
+    s = np.zeros(N, dtype=np.uint8)
+    s[N//2] = 1
+    return s
+
+
+def estado_aleatorio(N: int, p: float = 0.5) -> np.ndarray:
+    """Estado aleatorio de N celdas; cada celda vale 1 con probabilidad p."""
+    return (np.random.rand(N) < p).astype(np.uint8)
+
+
+# =============================================================================
+# Un paso de la regla
+# =============================================================================
+def aplicar_regla(estado: np.ndarray, bits: np.ndarray) -> np.ndarray:
+    """
+    Aplica un paso de la regla usando índices con módulo (%) para frontera periódica.
+    Versión celda por celda (referencia para comparar con `paso_regla`).
+    """
+    N = len(estado)
+    nuevo = np.zeros(N, dtype=np.uint8)
+    for i in range(N):
+        izquierda = estado[(i - 1) % N]
+        centro    = estado[i]
+        derecha   = estado[(i + 1) % N]
+        k = 4*izquierda + 2*centro + derecha
+        nuevo[i] = bits[k]
+    return nuevo
+
+
+def _vecinos(estado: np.ndarray, frontera: str):
+    """
+    Regresa los arreglos (izquierda, derecha) de vecinos según la frontera.
+
+    - 'periodica' : el anillo se cierra (la celda 0 es vecina de la N-1).
+    - 'cero'      : fuera del arreglo todas las celdas valen 0.
+    - 'reflejante': la celda del borde se refleja como su propio vecino.
+    """
+    if frontera == "periodica":
+        return np.roll(estado, 1, axis=-1), np.roll(estado, -1, axis=-1)
+    if frontera == "cero":
+        modo = "constant"
+    elif frontera == "reflejante":
+        modo = "symmetric"
+    else:
+        raise ValueError(f"frontera debe ser una de {FRONTERAS}.")
+    relleno = [(0, 0)] * (estado.ndim - 1) + [(1, 1)]
+    ext = np.pad(estado, relleno, mode=modo)
+    return ext[..., :-2], ext[..., 2:]
+
+
+def _indice_vecindario(estado: np.ndarray, frontera: str) -> np.ndarray:
+    """Índice k = 4*izquierda + 2*centro + derecha de cada celda (uint8)."""
+    izquierda, derecha = _vecinos(estado, frontera)
+    return (izquierda << 2) | (estado << 1) | derecha
+
+
+def paso_regla(estado: np.ndarray, bits: np.ndarray, frontera: str = "periodica") -> np.ndarray:
+    """
+    Aplica un paso de la regla a toda la fila a la vez.
+
+    Se forma el índice k = 4*izquierda + 2*centro + derecha para cada celda con
+    desplazamientos del arreglo y se consulta la tabla `bits` con indexación
+    avanzada, sin recorrer las celdas en Python.
+
+    Parámetros
+    ----------
+    estado : np.ndarray
+        Arreglo (..., N) de ceros y unos; se actualiza sobre el último eje.
+    bits : np.ndarray
+        Tabla de 8 bits de la regla (ver `bits_regla`).
+    frontera : str
+        'periodica', 'cero' o 'reflejante'.
+
+    Regresa
+    -------
+    np.ndarray
+        Nuevo estado (uint8) con la misma forma que `estado`.
+    """
+    estado = np.asarray(estado, dtype=np.uint8)
+    k = _indice_vecindario(estado, frontera)
+    return np.asarray(bits, dtype=np.uint8)[k]
+
+
+# =============================================================================
+# Evolución y visualización
+# =============================================================================
+def evolucion_1d(estado_inicial: np.ndarray, regla: int, pasos: int,
+                 frontera: str = "periodica") -> np.ndarray:
+    """
+    Devuelve una matriz (pasos+1, N) con la evolución en el tiempo.
+
+    Parámetros
+    ----------
+    estado_inicial : np.ndarray
+        Arreglo 1D con ceros y unos.
+    regla : int
+        Número de la regla (0..255).
+    pasos : int
+        Número de pasos de tiempo.
+    frontera : str
+        'periodica' (por defecto), 'cero' o 'reflejante'.
+
+    Regresa
+    -------
+    np.ndarray
+        Matriz (pasos+1, N) de tipo uint8; la fila 0 es el estado inicial.
+    """
+    estado = np.asarray(estado_inicial, dtype=np.uint8)
+    b = bits_regla(regla)
+    N = len(estado)
+    M = np.zeros((pasos+1, N), dtype=np.uint8)
+    M[0] = estado
+    for t in range(pasos):
+        estado = paso_regla(estado, b, frontera)
+        M[t+1] = estado
+    return M
+
+
+def evolucion_1d_iter(estado_inicial: np.ndarray, regla: int, pasos: int,
+                      frontera: str = "periodica"):
+    """
+    Versión generadora de `evolucion_1d`: produce un estado por paso
+    (t = 0, 1, ..., pasos) sin reservar la matriz completa.
+
+    Ejemplo
+    -------
+    >>> for t, x in enumerate(evolucion_1d_iter(ini, 30, 10**6)):
+    ...     densidad = x.mean()
+    """
+    estado = np.asarray(estado_inicial, dtype=np.uint8)
+    b = bits_regla(regla)
+    yield estado
+    for _ in range(pasos):
+        estado = paso_regla(estado, b, frontera)
+        yield estado
+
+
+# =============================================================================
+# Detección de ciclos y puntos fijos
+# =============================================================================
+def evolucion_1d_con_ciclos(estado_inicial: np.ndarray, regla: int, pasos: int,
+                            frontera: str = "periodica", parar: bool = True,
+                            memoria: int = 4096):
+    """
+    Como `evolucion_1d`, pero además detecta puntos fijos y ciclos.
+
+    Parámetros
+    ----------
+    parar : bool
+        Si True la evolución termina en el primer estado repetido y la matriz
+        tiene sólo las filas calculadas; si False se completan los `pasos`.
+    memoria : int
+        Número de huellas que guarda el índice (ver `IndiceEstados`).
+
+    Regresa
+    -------
+    (M, info) : (np.ndarray, dict)
+        Historia (filas calculadas, N) y el diccionario de `detectar_ciclo`.
+    """
+    indice = IndiceEstados(memoria)
+    filas = []
+    info = {"transitorio": None, "periodo": None, "pasos_calculados": pasos}
+    for t, x in enumerate(evolucion_1d_iter(estado_inicial, regla, pasos, frontera)):
+        filas.append(x)
+        if info["periodo"] is None:
+            t_previo = indice.registrar(x, t)
+            if t_previo is not None:
+                info.update(transitorio=t_previo, periodo=t - t_previo)
+                if parar:
+                    info["pasos_calculados"] = t
+                    break
+    return np.array(filas, dtype=np.uint8), info
+
+
+# =============================================================================
+# Historia en disco (np.memmap) con puntos de control
+# =============================================================================
+def evolucion_1d_a_disco(estado_inicial: np.ndarray, regla: int, pasos: int,
+                         ruta: str, frontera: str = "periodica",
+                         cada: int = 100) -> np.memmap:
+    """
+    Igual que `evolucion_1d`, pero la historia se escribe en `ruta` (.npy)
+    en lugar de reservarse en RAM. Ver `escribir_en_disco` para la reanudación.
+    """
+    b = bits_regla(regla)
+    return escribir_en_disco(ruta, estado_inicial, pasos,
+                             lambda x: paso_regla(x, b, frontera), cada=cada,
+                             identidad=f"regla={int(regla)}|frontera={frontera}")
+
+
+# =============================================================================
+# Representación empaquetada: 64 celdas por palabra uint64
+# =============================================================================
+# La celda i vive en la palabra i // 64, en el bit i % 64 (bit 0 = menos
+# significativo). Los bits sobrantes de la última palabra siempre valen 0.
+_UNO = np.uint64(1)
+_BITS_PALABRA = 64
+
+
+def empaquetar(estado: np.ndarray) -> np.ndarray:
+    """
+    Empaqueta un estado de ceros y unos en palabras de 64 bits.
+
+    Parámetros
+    ----------
+    estado : np.ndarray
+        Arreglo (..., N) de ceros y unos.
+
+    Regresa
+    -------
+    np.ndarray
+        Arreglo (..., ceil(N/64)) de tipo uint64.
+    """
+    estado = np.asarray(estado, dtype=np.uint8)
+    N = estado.shape[-1]
+    n_palabras = -(-N // _BITS_PALABRA)
+    octetos = np.packbits(estado, axis=-1, bitorder="little")
+    faltan = n_palabras * 8 - octetos.shape[-1]
+    if faltan:
+        relleno = [(0, 0)] * (octetos.ndim - 1) + [(0, faltan)]
+        octetos = np.pad(octetos, relleno)
+    return np.ascontiguousarray(octetos).view("<u8").astype(np.uint64, copy=False)
+
+
+def desempaquetar(palabras: np.ndarray, N: int) -> np.ndarray:
+    """
+    Operación inversa de `empaquetar`: regresa el arreglo (..., N) de uint8.
+
+    También acepta una historia empaquetada (pasos+1, n_palabras), de modo que
+    el resultado puede pasarse directamente a `visualizar_evolucion`.
+    """
+    palabras = np.ascontiguousarray(palabras, dtype="<u8")
+    octetos = palabras.view(np.uint8)
+    return np.unpackbits(octetos, axis=-1, count=N, bitorder="little")
+
+
+def _mascara_ultima(N: int) -> np.uint64:
+    """Máscara con los bits válidos de la última palabra."""
+    r = N % _BITS_PALABRA
+    return np.uint64(0xFFFFFFFFFFFFFFFF) if r == 0 else np.uint64((1 << r) - 1)
+
+
+def _vecinos_empaquetados(W: np.ndarray, N: int, frontera: str):
+    """
+    Regresa las palabras (izquierda, derecha) cuyo bit i contiene el vecino
+    izquierdo/derecho de la celda i, propagando el acarreo entre palabras.
+    """
+    ult = (N - 1) % _BITS_PALABRA
+    pos_ult = np.uint64(ult)
+    sesenta_y_tres = np.uint64(63)
+
+    izquierda = W << _UNO
+    izquierda[..., 1:] |= W[..., :-1] >> sesenta_y_tres
+    derecha = W >> _UNO
+    derecha[..., :-1] |= W[..., 1:] << sesenta_y_tres
+
+    if frontera == "periodica":
+        entra_izq = (W[..., -1] >> pos_ult) & _UNO      # celda N-1
+        entra_der = W[..., 0] & _UNO                    # celda 0
+    elif frontera == "cero":
+        entra_izq = np.zeros_like(W[..., 0])
+        entra_der = np.zeros_like(W[..., 0])
+    elif frontera == "reflejante":
+        entra_izq = W[..., 0] & _UNO
+        entra_der = (W[..., -1] >> pos_ult) & _UNO
+    else:
+        raise ValueError(f"frontera debe ser una de {FRONTERAS}.")
+
+    izquierda[..., 0] |= entra_izq
+    # El bit `ult` de la última palabra se limpia antes de meter el acarreo
+    derecha[..., -1] &= ~(_UNO << pos_ult)
+    derecha[..., -1] |= entra_der << pos_ult
+    return izquierda, derecha
+
+
+def paso_regla_empaquetado(W: np.ndarray, bits: np.ndarray, N: int,
+                           frontera: str = "periodica") -> np.ndarray:
+    """
+    Aplica un paso de la regla directamente sobre palabras de 64 celdas.
+
+    La salida es el OR de los vecindarios (a, b, c) con b_k = 1, donde cada
+    vecindario se evalúa con AND/NOT bit a bit sobre las palabras izquierda,
+    centro y derecha: 64 celdas por operación.
+
+    Parámetros
+    ----------
+    W : np.ndarray
+        Estado empaquetado (..., n_palabras) de tipo uint64.
+    bits : np.ndarray
+        Tabla de 8 bits de la regla (ver `bits_regla`).
+    N : int
+        Número real de celdas (para ubicar la frontera).
+    frontera : str
+        'periodica', 'cero' o 'reflejante'.
+
+    Regresa
+    -------
+    np.ndarray
+        Nuevo estado empaquetado (uint64) con los bits de relleno en 0.
+    """
+    W = np.asarray(W, dtype=np.uint64)
+    izquierda, derecha = _vecinos_empaquetados(W, N, frontera)
+    literales = {
+        (2, 1): izquierda, (2, 0): ~izquierda,
+        (1, 1): W,         (1, 0): ~W,
+        (0, 1): derecha,   (0, 0): ~derecha,
+    }
+    nuevo = np.zeros_like(W)
+    for k in range(8):
+        if not bits[k]:
+            continue
+        termino = literales[(2, (k >> 2) & 1)] & literales[(1, (k >> 1) & 1)]
+        termino &= literales[(0, k & 1)]
+        nuevo |= termino
+    nuevo[..., -1] &= _mascara_ultima(N)
+    return nuevo
+
+
+def evolucion_1d_empaquetada(estado_inicial: np.ndarray, regla: int, pasos: int,
+                             frontera: str = "periodica",
+                             guardar_historia: bool = True):
+    """
+    Igual que `evolucion_1d` pero trabajando con el estado empaquetado.
+
+    Parámetros
+    ----------
+    estado_inicial : np.ndarray
+        Arreglo 1D de ceros y unos (o ya empaquetado, ver `N`).
+    regla : int
+        Número de la regla (0..255).
+    pasos : int
+        Número de pasos de tiempo.
+    frontera : str
+        'periodica', 'cero' o 'reflejante'.
+    guardar_historia : bool
+        Si True regresa la historia empaquetada (pasos+1, n_palabras); si False
+        solo el último estado, lo que permite anillos de 10^7 celdas con unos
+        cuantos MB de memoria.
+
+    Regresa
+    -------
+    np.ndarray
+        Historia o último estado empaquetado. Use `desempaquetar(M, N)` para
+        visualizar.
+    """
+    estado = np.asarray(estado_inicial, dtype=np.uint8)
+    N = estado.shape[-1]
+    b = bits_regla(regla)
+    W = empaquetar(estado)
+    if not guardar_historia:
+        for _ in range(pasos):
+            W = paso_regla_empaquetado(W, b, N, frontera)
+        return W
+    M = np.zeros((pasos+1, W.shape[-1]), dtype=np.uint64)
+    M[0] = W
+    for t in range(pasos):
+        W = paso_regla_empaquetado(W, b, N, frontera)
+        M[t+1] = W
+    return M
+
+
+def visualizar_evolucion(M, titulo=None, max_filas=2000, max_columnas=2000):
+    """
+    Dibuja la historia M (tiempo x espacio). Si M es más grande que
+    (max_filas, max_columnas) se muestra una submuestra regular; así un
+    np.memmap grande sólo se lee parcialmente del disco.
+    """
+    paso_f = max(1, -(-M.shape[0] // max_filas))
+    paso_c = max(1, -(-M.shape[1] // max_columnas))
+    M = M[::paso_f, ::paso_c]
+    plt.figure(figsize=(6, 6))
+    plt.imshow(M, cmap="binary", interpolation="nearest", aspect="auto")
+    plt.xlabel("índice espacial i")
+    plt.ylabel("tiempo t (filas)")
+    if titulo:
+        plt.title(titulo)
+    plt.show()
+
+
+# =============================================================================
+# Barrido del espacio de reglas: (reglas × semillas × N) en una sola llamada
+# =============================================================================
+def _huella(X: np.ndarray) -> np.ndarray:
+    """
+    Huella de 64 bits de cada estado sobre el último eje (para detectar
+    repeticiones sin guardar los estados). Cada palabra empaquetada se mezcla
+    con su posición (splitmix64) y las mezclas se suman.
+    """
+    W = empaquetar(X)
+    pos = np.arange(W.shape[-1], dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    z = W + pos
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return z.sum(axis=-1, dtype=np.uint64)
+
+
+def _barrido_bloque(reglas, estados: np.ndarray, pasos: int, frontera: str,
+                    parar_en_ciclo: bool = True) -> dict:
+    """Evoluciona un bloque de reglas sobre todas las semillas (ver `barrido_reglas`)."""
+    reglas = np.asarray(reglas, dtype=int)
+    R, (S, N) = len(reglas), estados.shape
+    # Una fila por pareja (regla, semilla); cada fila consulta su propia tabla
+    tabla = np.repeat(np.stack([bits_regla(r) for r in reglas]), S, axis=0)   # (R*S, 8)
+    X = np.tile(estados, (R, 1))
+    activos = np.arange(R * S)
+
+    densidad = np.zeros((R * S, pasos+1))
+    entropia = np.zeros((R * S, pasos+1))
+    transitorio = np.full(R * S, -1)
+    periodo = np.full(R * S, -1)
+    calculados = np.full(R * S, pasos)
+    vistos = [{} for _ in range(R * S)]
+    for t in range(pasos+1):
+        k = _indice_vecindario(X, frontera)
+        densidad[activos, t] = X.mean(axis=-1)
+        # Entropía de bloques de 3 celdas (bits por celda)
+        frec = np.stack([(k == p).mean(axis=-1) for p in range(8)], axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            h = -np.where(frec > 0, frec * np.log2(frec), 0.0).sum(axis=-1) / 3
+        entropia[activos, t] = h
+
+        huellas = _huella(X).tolist()
+        sigue = np.ones(len(activos), dtype=bool)
+        for a, i in enumerate(activos.tolist()):
+            if vistos[i] is None:
+                continue
+            t_previo = vistos[i].get(huellas[a])
+            if t_previo is None:
+                vistos[i][huellas[a]] = t
+            else:
+                transitorio[i], periodo[i] = t_previo, t - t_previo
+                vistos[i] = None
+                if parar_en_ciclo:
+                    calculados[i] = t
+                    sigue[a] = False
+        if t == pasos:
+            break
+        # Las filas que ya entraron a su ciclo dejan de calcularse
+        activos, X, tabla, k = activos[sigue], X[sigue], tabla[sigue], k[sigue]
+        if len(activos) == 0:
+            break
+        X = np.take_along_axis(tabla, k, axis=-1)
+
+    # El resto de cada fila periódica se obtiene repitiendo su ciclo
+    ts = np.arange(pasos + 1)[None, :]
+    mu, per = transitorio[:, None], np.maximum(periodo, 1)[:, None]
+    fuente = np.where(ts > calculados[:, None], mu + (ts - mu) % per, ts)
+    densidad = np.take_along_axis(densidad, fuente, axis=-1)
+    entropia = np.take_along_axis(entropia, fuente, axis=-1)
+
+    return {"densidad": densidad.reshape(R, S, -1).mean(axis=1),
+            "entropia": entropia.reshape(R, S, -1).mean(axis=1),
+            "transitorio": transitorio.reshape(R, S),
+            "periodo": periodo.reshape(R, S),
+            "pasos_calculados": calculados.reshape(R, S)}
+
+
+def barrido_reglas(reglas=range(256), estados_iniciales: np.ndarray = None,
+                   n_semillas: int = 8, N: int = 256, p: float = 0.5,
+                   pasos: int = 200, frontera: str = "periodica",
+                   semilla: int = None, n_procesos: int = None,
+                   parar_en_ciclo: bool = True) -> dict:
+    """
+    Evoluciona varias reglas y varias condiciones iniciales a la vez y regresa
+    estadísticas resumidas por regla, sin guardar las trayectorias completas.
+
+    El estado es un tensor (reglas × semillas × N); en cada paso se calcula el
+    índice de vecindario una vez y cada regla consulta su propia tabla de bits.
+    Si `n_procesos` > 1 las reglas se reparten entre procesos. Con
+    `parar_en_ciclo` cada trayectoria deja de calcularse en cuanto repite un
+    estado, y sus estadísticas restantes se completan repitiendo el ciclo.
+
+    Parámetros
+    ----------
+    reglas : iterable de int
+        Reglas a evaluar (por defecto las 256).
+    estados_iniciales : np.ndarray | None
+        Arreglo (semillas, N) de ceros y unos. Si es None se generan
+        `n_semillas` estados aleatorios de N celdas con densidad p.
+    n_semillas, N, p : int, int, float
+        Parámetros para generar los estados iniciales.
+    pasos : int
+        Número de pasos de tiempo.
+    frontera : str
+        'periodica', 'cero' o 'reflejante'.
+    semilla : int | None
+        Semilla del generador aleatorio (reproducibilidad).
+    n_procesos : int | None
+        Número de procesos; None usa todos los núcleos, 1 no crea procesos.
+    parar_en_ciclo : bool
+        Si True se omiten los pasos posteriores a la primera repetición.
+
+    Regresa
+    -------
+    dict
+        - 'reglas'      : (R,) reglas evaluadas.
+        - 'densidad'    : (R, pasos+1) fracción de unos, promedio sobre semillas.
+        - 'entropia'    : (R, pasos+1) entropía espacial de bloques de 3 celdas
+                          (bits por celda), promedio sobre semillas.
+        - 'transitorio' : (R, S) pasos antes de entrar al ciclo (-1 si no se
+                          detectó repetición).
+        - 'periodo'     : (R, S) periodo del ciclo final (-1 si no se detectó).
+        - 'pasos_calculados' : (R, S) pasos realmente simulados.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    reglas = np.asarray(list(reglas), dtype=int)
+    if estados_iniciales is None:
+        rng = np.random.default_rng(semilla)
+        estados_iniciales = (rng.random((n_semillas, N)) < p).astype(np.uint8)
+    estados = np.atleast_2d(np.asarray(estados_iniciales, dtype=np.uint8))
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    n_procesos = max(1, min(n_procesos, len(reglas)))
+    bloques = np.array_split(reglas, n_procesos)
+
+    if n_procesos == 1:
+        partes = [_barrido_bloque(reglas, estados, pasos, frontera, parar_en_ciclo)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            futuros = [ejecutor.submit(_barrido_bloque, b, estados, pasos, frontera,
+                                       parar_en_ciclo)
+                       for b in bloques]
+            partes = [f.result() for f in futuros]
+
+    resultado = {clave: np.concatenate([parte[clave] for parte in partes])
+                 for clave in partes[0]}
+    resultado["reglas"] = reglas
+    return resultado
+
+
+# =============================================================================
+# Verificación y comparación de tiempos
+# =============================================================================
+def verificar_reglas(N: int = 64, pasos: int = 32, semilla: int = 0) -> bool:
+    """
+    Comprueba que `paso_regla` (frontera periódica) y `paso_regla_empaquetado`
+    producen exactamente los mismos bits que `aplicar_regla` para las 256 reglas,
+    partiendo de un estado aleatorio.
+
+    Regresa
+    -------
+    bool
+        True si todas las reglas coinciden; lanza AssertionError en otro caso.
+    """
+    rng = np.random.default_rng(semilla)
+    x0 = (rng.random(N) < 0.5).astype(np.uint8)
+    for R in range(256):
+        b = bits_regla(R)
+        x_ciclo = x0.copy()
+        x_vect = x0.copy()
+        W = empaquetar(x0)
+        for _ in range(pasos):
+            x_ciclo = aplicar_regla(x_ciclo, b)
+            x_vect = paso_regla(x_vect, b)
+            W = paso_regla_empaquetado(W, b, N)
+            assert np.array_equal(x_ciclo, x_vect), f"La regla {R} no coincide."
+            assert np.array_equal(x_ciclo, desempaquetar(W, N)), \
+                f"La regla {R} no coincide (empaquetada)."
+    return True
+
+
+def comparar_tiempos(N: int = 2000, pasos: int = 200, regla: int = 30,
+                     frontera: str = "periodica") -> dict:
+    """
+    Mide el tiempo de `pasos` iteraciones con el ciclo celda por celda y con la
+    versión vectorizada sobre el mismo estado inicial aleatorio.
+
+    Regresa
+    -------
+    dict
+        {'ciclo': s, 'vectorizado': s, 'aceleracion': veces}
+    """
+    x0 = estado_aleatorio(N)
+    b = bits_regla(regla)
+
+    inicio = time.perf_counter()
+    x = x0
+    for _ in range(pasos):
+        x = aplicar_regla(x, b)
+    t_ciclo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    y = x0
+    for _ in range(pasos):
+        y = paso_regla(y, b, frontera)
+    t_vect = time.perf_counter() - inicio
+
+    resultado = {"ciclo": t_ciclo, "vectorizado": t_vect,
+                 "aceleracion": t_ciclo / t_vect if t_vect > 0 else float("inf")}
+    print(f"N={N}, pasos={pasos}, regla={regla}")
+    print(f"  ciclo for:    {t_ciclo:.4f} s")
+    print(f"  vectorizado:  {t_vect:.4f} s  (x{resultado['aceleracion']:.1f})")
+    return resultado
+
+
+if __name__ == "__main__":
+    verificar_reglas()
+    comparar_tiempos()
@@ -0,0 +1,177 @@
+# =============================================================================
+# Historia de autómatas celulares: disco con puntos de control y ciclos
+# =============================================================================
+# Código común a `automatas1d` (Clase 25) y `vida` (Clase 27): escribir una
+# trayectoria en un `.npy` mapeado a memoria con reanudación, y detectar
+# puntos fijos y ciclos con un índice acotado de huellas. Los estados pueden
+# ser filas (N,) o tableros (N, M).
+#
+# Cada semana es una carpeta independiente (los notebooks importan desde su
+# propia carpeta), así que este archivo está, idéntico, en Semana13_Automatas
+# y en Semana14_Automatas2D. Si se cambia uno, hay que copiarlo al otro.
+import hashlib
+import json
+import os
+from collections import deque
+
+import numpy as np
+
+
+# =============================================================================
+# Historia en disco (np.memmap) con puntos de control
+# =============================================================================
+def _ruta_control(ruta: str) -> str:
+    """Archivo auxiliar donde se guarda el último paso escrito."""
+    return ruta + ".control.json"
+
+
+def _identidad_paso(paso) -> str:
+    """
+    Descripción estable de la función de paso para la huella de la corrida:
+    su nombre calificado más el contenido de su cierre (p. ej. la regla y la
+    frontera de `regla_BS` o de una lambda con los bits de la regla).
+    """
+    partes = [getattr(paso, "__module__", ""), getattr(paso, "__qualname__", repr(paso))]
+    for celda in getattr(paso, "__closure__", None) or ():
+        valor = celda.cell_contents
+        if isinstance(valor, np.ndarray):
+            partes.append(f"{valor.dtype}{valor.shape}{valor.tobytes().hex()}")
+        else:
+            partes.append(repr(valor))
+    return "|".join(partes)
+
+
+def huella_corrida(estado_inicial: np.ndarray, pasos: int, identidad: str) -> str:
+    """Hash del estado inicial, el número de pasos y la identidad de la regla."""
+    x = np.ascontiguousarray(estado_inicial, dtype=np.uint8)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(x.tobytes())
+    h.update(f"{x.shape}|{pasos}|{identidad}".encode())
+    return h.hexdigest()
+
+
+def escribir_en_disco(ruta: str, estado_inicial: np.ndarray, pasos: int, paso,
+                      cada: int = 100, identidad: str = None,
+                      reanudar: bool = True) -> np.memmap:
+    """
+    Escribe una trayectoria (pasos+1, ...) en un archivo `.npy` mapeado a
+    memoria, guardando un punto de control cada `cada` pasos.
+
+    El archivo de control guarda el último paso escrito y una huella de la
+    corrida (estado inicial, `pasos` y regla). Si el archivo y su control ya
+    existen con la misma huella, la simulación se reanuda desde el último
+    paso guardado (o se regresa el archivo tal cual si ya estaba completo);
+    si la huella es otra, se empieza de cero y se sobreescribe.
+
+    Parámetros
+    ----------
+    ruta : str
+        Archivo de salida (se recomienda extensión '.npy').
+    estado_inicial : np.ndarray
+        Estado en t = 0.
+    pasos : int
+        Número de pasos de tiempo.
+    paso : callable
+        Función x_t -> x_{t+1}.
+    cada : int
+        Frecuencia (en pasos) de los puntos de control.
+    identidad : str | None
+        Texto que identifica la regla en la huella. Si es None se deriva de
+        `paso` (nombre y valores de su cierre).
+    reanudar : bool
+        Si False siempre se empieza de cero.
+
+    Regresa
+    -------
+    np.memmap
+        Historia de sólo lectura; se puede indexar por tiempo sin cargarla
+        completa en memoria.
+    """
+    if cada < 1:
+        raise ValueError("cada debe ser un entero positivo.")
+    x = np.asarray(estado_inicial, dtype=np.uint8)
+    forma = (pasos + 1, *x.shape)
+    control = _ruta_control(ruta)
+    huella = huella_corrida(x, pasos, _identidad_paso(paso) if identidad is None else identidad)
+
+    t0 = None
+    if reanudar and os.path.exists(ruta) and os.path.exists(control):
+        with open(control) as f:
+            info = json.load(f)
+        if info.get("huella") == huella:
+            M = np.lib.format.open_memmap(ruta, mode="r+")
+            if tuple(M.shape) == forma and M.dtype == np.uint8:
+                t0 = int(info["t"])
+                x = np.array(M[t0])
+            else:
+                del M
+    if t0 is None:
+        # Corrida nueva: el control anterior ya no describe el archivo.
+        if os.path.exists(control):
+            os.remove(control)
+        t0 = 0
+        M = np.lib.format.open_memmap(ruta, mode="w+", dtype=np.uint8, shape=forma)
+        M[0] = x
+
+    for t in range(t0, pasos):
+        x = np.asarray(paso(x), dtype=np.uint8)
+        M[t+1] = x
+        if (t + 1) % cada == 0 or t + 1 == pasos:
+            M.flush()
+            with open(control, "w") as f:
+                json.dump({"t": t + 1, "pasos": pasos, "huella": huella,
+                           "completo": t + 1 == pasos}, f)
+    M.flush()
+    del M
+    return np.load(ruta, mmap_mode="r")
+
+
+# =============================================================================
+# Detección de ciclos y puntos fijos
+# =============================================================================
+class IndiceEstados:
+    """
+    Índice acotado huella -> tiempo de los últimos `memoria` estados vistos.
+
+    Cada estado se resume con un hash de 128 bits de sus bytes, así que el
+    índice no guarda los estados. Si el periodo del ciclo es ≤ `memoria`, el
+    transitorio y el periodo reportados son exactos.
+    """
+    def __init__(self, memoria: int = 4096):
+        self.memoria = memoria
+        self._tiempos = {}
+        self._orden = deque()
+
+    def registrar(self, x: np.ndarray, t: int):
+        """Registra el estado x en el tiempo t; si ya se había visto regresa ese tiempo."""
+        h = hashlib.blake2b(np.ascontiguousarray(x).tobytes(), digest_size=16).digest()
+        t_previo = self._tiempos.get(h)
+        if t_previo is not None:
+            return t_previo
+        self._tiempos[h] = t
+        self._orden.append(h)
+        if len(self._orden) > self.memoria:
+            del self._tiempos[self._orden.popleft()]
+        return None
+
+
+def detectar_ciclo(estados, memoria: int = 4096) -> dict:
+    """
+    Recorre un iterable de estados (p. ej. `evolucion_1d_iter` o
+    `evolucion_iter`) hasta el primer estado repetido y se detiene ahí, sin
+    calcular los pasos restantes.
+
+    Regresa
+    -------
+    dict
+        {'transitorio': μ, 'periodo': p, 'pasos_calculados': t}; el estado en
+        t = μ + p es igual al de t = μ (p = 1 es un punto fijo). Si no hubo
+        repetición, 'transitorio' y 'periodo' valen None.
+    """
+    indice = IndiceEstados(memoria)
+    t = -1
+    for t, x in enumerate(estados):
+        t_previo = indice.registrar(x, t)
+        if t_previo is not None:
+            return {"transitorio": t_previo, "periodo": t - t_previo, "pasos_calculados": t}
+    return {"transitorio": None, "periodo": None, "pasos_calculados": t}
@@ -0,0 +1,229 @@
+# =============================================================================
+# Modelos de tráfico (Clase 26) — versión vectorizada
+# =============================================================================
+# Generaliza el modelo `paso_trafico_v2` (velocidad máxima 2) a cualquier
+# velocidad máxima `vmax` al estilo Nagel–Schreckenberg:
+#   1. Aceleración:  v <- min(v + 1, vmax)
+#   2. Frenado:      v <- min(v, hueco)        (hueco = celdas libres al frente)
+#   3. Azar:         v <- max(v - 1, 0) con probabilidad p_frenado
+#   4. Movimiento:   x <- (x + v) mod L
+# Los autos se guardan como arreglos de posiciones y velocidades, de modo que
+# un paso cuesta O(número de autos) y no hay ciclos en Python sobre la pista.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+# =============================================================================
+# Paso sobre el arreglo de ocupación (como en el notebook)
+# =============================================================================
+def paso_trafico(x: np.ndarray, vmax: int = 2) -> np.ndarray:
+    """
+    Un paso del modelo de la Clase 26 para una velocidad máxima general.
+
+    Cada auto avanza min(hueco, vmax) celdas, donde `hueco` es el número de
+    celdas vacías frente a él (sin memoria de velocidad). Con vmax = 2 es la
+    regla de `paso_trafico_v2`. Frontera periódica.
+
+    Parámetros
+    ----------
+    x : np.ndarray
+        Arreglo 1D con 0 (vacío) y 1 (auto).
+    vmax : int
+        Velocidad máxima en celdas por paso.
+
+    Regresa
+    -------
+    np.ndarray
+        Nuevo arreglo de ocupación (uint8).
+    """
+    x = np.asarray(x, dtype=np.uint8)
+    N = len(x)
+    pos = np.flatnonzero(x)
+    y = np.zeros(N, dtype=np.uint8)
+    if len(pos) == 0:
+        return y
+    hueco = (np.roll(pos, -1) - pos - 1) % N
+    if len(pos) == 1:
+        hueco[:] = N - 1
+    y[(pos + np.minimum(hueco, vmax)) % N] = 1
+    return y
+
+
+# =============================================================================
+# Nagel–Schreckenberg sobre posiciones y velocidades
+# =============================================================================
+def paso_nasch(pos: np.ndarray, vel: np.ndarray, L: int, vmax: int = 5,
+               p_frenado: float = 0.0, rng=None):
+    """
+    Un paso del modelo Nagel–Schreckenberg sobre una pista circular de L celdas.
+
+    Parámetros
+    ----------
+    pos : np.ndarray
+        Posiciones de los autos, (..., n), en orden cíclico sobre el último eje.
+        Las dimensiones iniciales permiten avanzar varias réplicas a la vez.
+    vel : np.ndarray
+        Velocidades (..., n).
+    L : int
+        Longitud de la pista.
+    vmax : int
+        Velocidad máxima.
+    p_frenado : float
+        Probabilidad de frenado aleatorio.
+    rng : np.random.Generator | None
+        Generador aleatorio (sólo se usa si p_frenado > 0).
+
+    Regresa
+    -------
+    (pos, vel) : (np.ndarray, np.ndarray)
+        Nuevas posiciones y velocidades; el orden cíclico de los autos se
+        conserva porque ningún auto rebasa al de enfrente.
+    """
+    n = pos.shape[-1]
+    if n == 0:
+        return pos, vel
+    hueco = (np.roll(pos, -1, axis=-1) - pos - 1) % L
+    if n == 1:
+        hueco = np.full_like(pos, L - 1)
+    vel = np.minimum(np.minimum(vel + 1, vmax), hueco)
+    if p_frenado > 0:
+        if rng is None:
+            rng = np.random.default_rng()
+        frena = rng.random(vel.shape) < p_frenado
+        vel = np.where(frena, np.maximum(vel - 1, 0), vel)
+    return (pos + vel) % L, vel
+
+
+def autos_aleatorios(L: int, n: int, replicas: int = 1, rng=None) -> np.ndarray:
+    """
+    Posiciones ordenadas de n autos distintos en una pista de L celdas, para
+    cada réplica. Regresa un arreglo (replicas, n).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    return np.stack([np.sort(rng.choice(L, size=n, replace=False)) for _ in range(replicas)])
+
+
+def ocupacion(pos: np.ndarray, L: int) -> np.ndarray:
+    """Arreglo de ocupación (0/1) de longitud L a partir de las posiciones."""
+    x = np.zeros(L, dtype=np.uint8)
+    x[pos] = 1
+    return x
+
+
+def evolucion_nasch(estado_inicial: np.ndarray, pasos: int, vmax: int = 5,
+                    p_frenado: float = 0.0, semilla: int = None) -> np.ndarray:
+    """
+    Evolución del modelo Nagel–Schreckenberg a partir de un arreglo de
+    ocupación. Regresa la matriz (pasos+1, N) como `evolucion_trafico_v2`,
+    lista para `visualizar_evolucion`. Todos los autos parten con velocidad 0.
+    """
+    rng = np.random.default_rng(semilla)
+    x = np.asarray(estado_inicial, dtype=np.uint8)
+    L = len(x)
+    pos = np.flatnonzero(x)
+    vel = np.zeros_like(pos)
+    M = np.zeros((pasos+1, L), dtype=np.uint8)
+    M[0] = x
+    for t in range(pasos):
+        pos, vel = paso_nasch(pos, vel, L, vmax, p_frenado, rng)
+        M[t+1, pos] = 1
+    return M
+
+
+# =============================================================================
+# Diagrama fundamental: flujo contra densidad con muchas réplicas
+# =============================================================================
+def _flujo_una_densidad(densidad: float, L: int, pasos: int, calentamiento: int,
+                        replicas: int, vmax: int, p_frenado: float, semilla) -> tuple:
+    """
+    Simula `replicas` pistas con la misma densidad a la vez y regresa
+    (densidad real, flujo medio, desviación del flujo entre réplicas,
+    velocidad media).
+    """
+    rng = np.random.default_rng(semilla)
+    n = int(round(densidad * L))
+    if n == 0:
+        return 0.0, 0.0, 0.0, float(vmax)
+    pos = autos_aleatorios(L, n, replicas, rng)
+    vel = np.zeros_like(pos)
+    suma_v = np.zeros(replicas)
+    for t in range(calentamiento + pasos):
+        pos, vel = paso_nasch(pos, vel, L, vmax, p_frenado, rng)
+        if t >= calentamiento:
+            suma_v += vel.sum(axis=-1)
+    # Flujo = autos que cruzan un punto por paso = (suma de velocidades) / L
+    flujo = suma_v / (pasos * L)
+    return n / L, float(flujo.mean()), float(flujo.std()), float(suma_v.mean() / (pasos * n))
+
+
+def diagrama_fundamental(densidades, L: int = 1000, pasos: int = 500,
+                         calentamiento: int = 500, replicas: int = 8,
+                         vmax: int = 5, p_frenado: float = 0.1,
+                         semilla: int = None, n_procesos: int = None) -> dict:
+    """
+    Calcula la curva flujo–densidad del modelo Nagel–Schreckenberg.
+
+    Para cada densidad se avanzan todas las réplicas juntas como un arreglo
+    (replicas, autos); las densidades se reparten entre procesos. Cada
+    densidad recibe su propia semilla derivada con `SeedSequence.spawn`, por lo
+    que el resultado no depende del número de procesos.
+
+    Parámetros
+    ----------
+    densidades : array_like
+        Densidades de autos p (fracción de celdas ocupadas) a evaluar.
+    L : int
+        Longitud de la pista (celdas).
+    pasos : int
+        Pasos promediados para medir el flujo.
+    calentamiento : int
+        Pasos iniciales que se descartan (régimen transitorio).
+    replicas : int
+        Réplicas independientes por densidad.
+    vmax : int
+        Velocidad máxima.
+    p_frenado : float
+        Probabilidad de frenado aleatorio.
+    semilla : int | None
+        Semilla raíz para reproducibilidad.
+    n_procesos : int | None
+        Procesos a usar; None usa todos los núcleos, 1 no crea procesos.
+
+    Regresa
+    -------
+    dict
+        {'densidad', 'flujo', 'flujo_std', 'velocidad_media'}, arreglos de la
+        misma longitud que `densidades`.
+    """
+    densidades = np.asarray(densidades, dtype=float)
+    semillas = np.random.SeedSequence(semilla).spawn(len(densidades))
+    argumentos = [(d, L, pasos, calentamiento, replicas, vmax, p_frenado, s)
+                  for d, s in zip(densidades, semillas)]
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    if n_procesos == 1:
+        filas = [_flujo_una_densidad(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            filas = list(ejecutor.map(_flujo_una_densidad, *zip(*argumentos)))
+
+    rho, flujo, flujo_std, v_media = (np.array(c) for c in zip(*filas))
+    return {"densidad": rho, "flujo": flujo, "flujo_std": flujo_std,
+            "velocidad_media": v_media}
+
+
+def graficar_diagrama_fundamental(resultado: dict, titulo: str = None):
+    """Grafica flujo contra densidad con barras de la desviación entre réplicas."""
+    plt.figure()
+    plt.errorbar(resultado["densidad"], resultado["flujo"],
+                 yerr=resultado["flujo_std"], marker="o", markersize=3, linewidth=1)
+    plt.xlabel("Densidad de autos p")
+    plt.ylabel("Flujo (autos / paso)")
+    plt.title(titulo or "Diagrama fundamental")
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,493 @@
+# =============================================================================
+# Incendio forestal (Clase 28)
+# =============================================================================
+# Funciones de la Clase 28 reunidas en un módulo para importarlas desde los
+# notebooks con `from bosque import *`.
+# Estados: 0 = sano, 1 = en llamas, 2 = quemado. Bordes abiertos.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import ListedColormap, BoundaryNorm
+from matplotlib.animation import FuncAnimation
+
+# Colores: 0=verde (sano), 1=rojo (en llamas), 2=negro (quemado)
+cmap = ListedColormap(['#2ca02c', '#d62728', '#000000'])
+norm = BoundaryNorm([-0.5, 0.5, 1.5, 2.5], cmap.N)
+
+DIRECCIONES = {
+    "Moore": [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if not (di == 0 and dj == 0)],
+    "VonNeumann": [(-1, 0), (1, 0), (0, -1), (0, 1)],
+}
+
+
+def _direcciones(neighborhood: str):
+    if neighborhood not in DIRECCIONES:
+        raise ValueError("neighborhood debe ser 'Moore' u 'VonNeumann'")
+    return DIRECCIONES[neighborhood]
+
+
+def bosque_inicial(N, densidad_fuego=0.01, semilla=None):
+    """
+    Crea un bosque N x N con todos los árboles sanos (0),
+    y enciende aleatoriamente una fracción 'densidad_fuego' de celdas (estado 1).
+
+    Parámetros
+    ----------
+    N : int
+        Tamaño del bosque (N x N).
+    densidad_fuego : float in [0,1]
+        Fracción inicial de árboles encendidos (focos).
+    semilla : int | None
+        Semilla para la reproducibilidad.
+    """
+    rng = np.random.default_rng(semilla)
+    x = np.zeros((N, N), dtype=np.uint8)  # 0 = sano
+    mascara_fuego = rng.random((N, N)) < densidad_fuego
+    x[mascara_fuego] = 1  # 1 = en llamas
+    return x
+
+
+# =============================================================================
+# Paso sobre la malla completa (como en el notebook)
+# =============================================================================
+def _vecinos_en_llamas(x, neighborhood='Moore'):
+    """
+    Devuelve, para cada celda, la cantidad de vecinos en llamas (estado 1).
+    Bordes abiertos (no periódicos). Suma rebanadas desplazadas en lugar de
+    recorrer celda por celda.
+    """
+    burning = (np.asarray(x) == 1).astype(np.uint8)
+    N, M = burning.shape
+    nb = np.zeros((N, M), dtype=np.uint8)
+    for di, dj in _direcciones(neighborhood):
+        # nb[i, j] += burning[i+di, j+dj] donde el vecino existe
+        nb[max(-di, 0):N - max(di, 0), max(-dj, 0):M - max(dj, 0)] += \
+            burning[max(di, 0):N - max(-di, 0), max(dj, 0):M - max(-dj, 0)]
+    return nb
+
+
+def paso_incendio(x, p=0.5, neighborhood='Moore', rng=None):
+    """
+    Un paso de tiempo del autómata de incendio.
+    - 1 -> 2 (en llamas -> quemado)
+    - 0 con vecinos en llamas -> 1 con probabilidad 1 - (1-p)^nb
+    - 2 -> 2
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    x = np.asarray(x, dtype=np.uint8)
+    y = x.copy()
+
+    # Primero: los que están en llamas pasan a quemados
+    y[x == 1] = 2
+
+    # Segundo: sanos con vecinos en llamas pueden encenderse
+    nb = _vecinos_en_llamas(x, neighborhood=neighborhood)
+    susceptibles = (x == 0) & (nb > 0)
+    prob_ignite = 1.0 - (1.0 - p)**nb
+    ignites = susceptibles & (rng.random(x.shape) < prob_ignite)
+    y[ignites] = 1
+    return y
+
+
+# =============================================================================
+# Paso sobre el frente de fuego
+# =============================================================================
+# Sólo las celdas sanas vecinas de una celda en llamas pueden cambiar, así que
+# basta guardar el frente (índices planos de las celdas en llamas). Un paso
+# cuesta O(tamaño del frente) y no O(N^2); el bosque se modifica en el lugar.
+def frente_inicial(x) -> np.ndarray:
+    """Índices planos (ordenados) de las celdas en llamas."""
+    return np.flatnonzero(np.asarray(x) == 1)
+
+
+def _vecinos_planos(forma, frente: np.ndarray, neighborhood: str) -> np.ndarray:
+    """
+    Índices planos de los vecinos (dentro del bosque) de las celdas `frente`.
+    `forma` puede ser (N, M) o (R, N, M): con varias réplicas apiladas los
+    vecinos nunca cruzan de una réplica a otra.
+    """
+    N, M = forma[-2:]
+    base, resto = np.divmod(frente, N * M)
+    i, j = np.divmod(resto, M)
+    vecinos = []
+    for di, dj in _direcciones(neighborhood):
+        ii, jj = i + di, j + dj
+        dentro = (ii >= 0) & (ii < N) & (jj >= 0) & (jj < M)
+        vecinos.append(base[dentro] * (N * M) + ii[dentro] * M + jj[dentro])
+    return np.concatenate(vecinos)
+
+
+def _candidatos(x: np.ndarray, frente: np.ndarray, neighborhood: str):
+    """Celdas sanas vecinas del frente y su número de vecinos en llamas."""
+    vecinos = _vecinos_planos(x.shape, frente, neighborhood)
+    vecinos = vecinos[x.reshape(-1)[vecinos] == 0]
+    return np.unique(vecinos, return_counts=True)
+
+
+def paso_frente(x: np.ndarray, frente: np.ndarray, p=0.5, neighborhood='Moore',
+                rng=None) -> np.ndarray:
+    """
+    Un paso del autómata de incendio que sólo visita el frente de fuego.
+
+    Misma regla que `paso_incendio`: las celdas en llamas se queman y cada
+    celda sana con nb vecinos en llamas se enciende con probabilidad
+    1 - (1-p)^nb. Se sortea un número aleatorio por candidato, en orden de
+    índice, de modo que la corrida es reproducible con el mismo `rng`.
+
+    Parámetros
+    ----------
+    x : np.ndarray
+        Bosque (N, M) de uint8, o varias réplicas (R, N, M) que avanzan
+        juntas; se actualiza en el lugar.
+    frente : np.ndarray
+        Índices planos de las celdas en llamas de `x` (ver `frente_inicial`).
+    p : float
+        Probabilidad de propagación por vecino en llamas.
+    neighborhood : str
+        'Moore' u 'VonNeumann'.
+    rng : np.random.Generator | None
+        Generador aleatorio.
+
+    Regresa
+    -------
+    np.ndarray
+        Nuevo frente (índices planos de las celdas que se encendieron).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if len(frente) == 0:
+        return frente
+    candidatos, nb = _candidatos(x, frente, neighborhood)
+    prob_ignite = 1.0 - (1.0 - p)**nb
+    nuevo = candidatos[rng.random(len(candidatos)) < prob_ignite]
+    plano = x.reshape(-1)
+    plano[frente] = 2
+    plano[nuevo] = 1
+    return nuevo
+
+
+def simular_incendio(estado_inicial, pasos, p=0.5, neighborhood='Moore', rng=None):
+    """
+    Avanza el incendio con `paso_frente` hasta `pasos` pasos o hasta que se
+    apague, sin guardar la trayectoria.
+
+    Regresa
+    -------
+    (x, duracion) : (np.ndarray, int)
+        Estado final y número de pasos con fuego activo.
+    """
+    x = np.array(estado_inicial, dtype=np.uint8)
+    frente = frente_inicial(x)
+    t = 0
+    while t < pasos and len(frente) > 0:
+        frente = paso_frente(x, frente, p, neighborhood, rng)
+        t += 1
+    return x, t
+
+
+# =============================================================================
+# Trayectorias empacadas a 2 bits con cola estacionaria
+# =============================================================================
+_DESPLAZAMIENTOS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+
+def empacar_2bits(x: np.ndarray) -> np.ndarray:
+    """Empaca estados 0..3 a 4 celdas por byte (la celda k va en los bits 2k, 2k+1)."""
+    plano = np.asarray(x, dtype=np.uint8).reshape(-1)
+    relleno = (-len(plano)) % 4
+    if relleno:
+        plano = np.concatenate((plano, np.zeros(relleno, dtype=np.uint8)))
+    v = plano.reshape(-1, 4)
+    return v[:, 0] | (v[:, 1] << 2) | (v[:, 2] << 4) | (v[:, 3] << 6)
+
+
+def desempacar_2bits(b: np.ndarray, forma) -> np.ndarray:
+    """Inverso de `empacar_2bits`: regresa el arreglo de uint8 con forma `forma`."""
+    n = int(np.prod(forma))
+    plano = ((b[:, None] >> _DESPLAZAMIENTOS) & 3).reshape(-1)[:n]
+    return plano.reshape(forma)
+
+
+class TrayectoriaIncendio:
+    """
+    Trayectoria (pasos+1, N, M) del incendio con cada estado empacado a 2 bits.
+
+    Sólo se guardan los cuadros t = 0, ..., t_parada; cuando el fuego se apaga
+    antes de `pasos` los cuadros posteriores son iguales al último y se
+    sirven de él sin copiarlo. Se indexa como el arreglo que regresaba
+    `evolucion_incendio` (`M[t]`, `M[-1]`, `M[a:b]`, `M.shape`), así que
+    `animar_evolucion` y `mostrar_mapa` la aceptan directamente.
+    """
+
+    def __init__(self, forma, pasos: int):
+        self.forma = tuple(forma)
+        self.pasos = int(pasos)
+        self._cuadros = []
+
+    def agregar(self, x: np.ndarray) -> None:
+        """Agrega el estado del siguiente paso de tiempo."""
+        if len(self._cuadros) > self.pasos:
+            raise ValueError("La trayectoria ya tiene pasos+1 estados.")
+        self._cuadros.append(empacar_2bits(x))
+
+    @property
+    def t_parada(self) -> int:
+        """Último paso guardado; después de él el estado ya no cambia."""
+        return len(self._cuadros) - 1
+
+    @property
+    def shape(self):
+        return (self.pasos + 1, *self.forma)
+
+    @property
+    def ndim(self):
+        return 1 + len(self.forma)
+
+    @property
+    def dtype(self):
+        return np.dtype(np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self._cuadros)
+
+    def __len__(self):
+        return self.pasos + 1
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            tiempos = range(*indice.indices(len(self)))
+            salida = np.empty((len(tiempos), *self.forma), dtype=np.uint8)
+            for k, t in enumerate(tiempos):
+                salida[k] = self[t]
+            return salida
+        t = int(indice)
+        if t < 0:
+            t += len(self)
+        if not 0 <= t < len(self):
+            raise IndexError(f"t = {indice} fuera de rango para {len(self)} pasos.")
+        return desempacar_2bits(self._cuadros[min(t, self.t_parada)], self.forma)
+
+    def __iter__(self):
+        for t in range(len(self)):
+            yield self[t]
+
+    def __array__(self, dtype=None, copy=None):
+        M = self[:]
+        return M if dtype is None else M.astype(dtype)
+
+
+def evolucion_incendio(estado_inicial, pasos, p=0.5, neighborhood='Moore', semilla=None,
+                       parada_temprana=True) -> TrayectoriaIncendio:
+    """
+    Evoluciona el sistema y devuelve una `TrayectoriaIncendio` de forma
+    (pasos+1, N, N). Con `parada_temprana` la simulación termina cuando ya no
+    hay fuego activo y los estados restantes se sirven del último; sin ella
+    se guardan explícitamente todos los pasos.
+    """
+    rng = np.random.default_rng(semilla)
+    x = np.array(estado_inicial, dtype=np.uint8)
+    trayectoria = TrayectoriaIncendio(x.shape, pasos)
+    trayectoria.agregar(x)
+    frente = frente_inicial(x)
+    for t in range(pasos):
+        frente = paso_frente(x, frente, p=p, neighborhood=neighborhood, rng=rng)
+        trayectoria.agregar(x)
+        if parada_temprana and len(frente) == 0:  # ya no hay fuego activo
+            break
+    return trayectoria
+
+
+def verificar_frente(N=60, pasos=40, semilla=0) -> bool:
+    """
+    Comprueba `paso_frente` contra `paso_incendio` en ambas vecindades:
+    con p = 0 y p = 1 la evolución es determinista y debe coincidir paso a
+    paso; con p intermedia se comparan los conteos de vecinos en llamas de los
+    candidatos, que fijan la probabilidad de encendido.
+    """
+    rng = np.random.default_rng(semilla)
+    for neighborhood in DIRECCIONES:
+        for p in (0.0, 1.0, 0.4):
+            x = bosque_inicial(N, 0.02, semilla)
+            y, frente = x.copy(), frente_inicial(x)
+            for _ in range(pasos):
+                if p in (0.0, 1.0):
+                    x = paso_incendio(x, p, neighborhood, rng)
+                    frente = paso_frente(y, frente, p, neighborhood, rng)
+                    assert np.array_equal(x, y), f"No coincide ({neighborhood}, p={p})."
+                else:
+                    nb = _vecinos_en_llamas(y, neighborhood)
+                    candidatos, cuenta = _candidatos(y, frente, neighborhood)
+                    esperados = np.flatnonzero((y.reshape(-1) == 0) & (nb.reshape(-1) > 0))
+                    assert np.array_equal(candidatos, esperados)
+                    assert np.array_equal(cuenta, nb.reshape(-1)[candidatos])
+                    frente = paso_frente(y, frente, p, neighborhood, rng)
+    return True
+
+
+# =============================================================================
+# Barrido Monte Carlo de percolación
+# =============================================================================
+def _percola(x: np.ndarray, neighborhood: str) -> np.ndarray:
+    """
+    Para bosques (R, N, M) indica si algún grupo conexo de celdas tocadas por
+    el fuego une la fila superior con la inferior. El grupo se recorre por
+    capas desde la fila superior, visitando sólo celdas tocadas por el fuego.
+    """
+    R, N, M = x.shape
+    quemado = x.reshape(-1) != 0
+    visitado = np.zeros_like(quemado)
+    frente = np.flatnonzero(quemado.reshape(R, N, M)[:, 0, :])
+    frente = (frente // M) * (N * M) + frente % M
+    visitado[frente] = True
+    while len(frente) > 0:
+        vecinos = _vecinos_planos(x.shape, frente, neighborhood)
+        frente = np.unique(vecinos[quemado[vecinos] & ~visitado[vecinos]])
+        visitado[frente] = True
+    return visitado.reshape(R, N, M)[:, -1, :].any(axis=1)
+
+
+def _replicas_incendio(p, densidad_fuego, N, replicas, pasos, neighborhood, semilla):
+    """
+    Corre `replicas` incendios independientes apilados en un solo arreglo
+    (replicas, N, N) y regresa (fraccion_quemada, duracion, percola), con
+    la misma duración que daría `simular_incendio` para cada réplica.
+    """
+    rng = np.random.default_rng(semilla)
+    x = (rng.random((replicas, N, N)) < densidad_fuego).astype(np.uint8)
+    frente = frente_inicial(x)
+    # Último paso t en que cada réplica tenía celdas en llamas (-1 = nunca).
+    ultimo = np.full(replicas, -1, dtype=np.int64)
+    ultimo[np.unique(frente // (N * N))] = 0
+    t = 0
+    while len(frente) > 0 and (pasos is None or t < pasos):
+        frente = paso_frente(x, frente, p, neighborhood, rng)
+        t += 1
+        ultimo[np.unique(frente // (N * N))] = t
+    duracion = ultimo + 1
+    if pasos is not None:
+        duracion = np.minimum(duracion, pasos)
+    fraccion = (x != 0).reshape(replicas, -1).mean(axis=1)
+    return fraccion, duracion, _percola(x, neighborhood)
+
+
+def barrido_percolacion(ps, densidades_fuego, N=100, replicas=100, pasos=None,
+                        neighborhood='Moore', semilla=None, n_procesos=None) -> dict:
+    """
+    Barrido Monte Carlo del modelo de incendio sobre una malla de valores de
+    p y densidad_fuego, para estimar la probabilidad crítica de propagación.
+
+    Para cada par (p, densidad_fuego) las réplicas avanzan juntas como un
+    arreglo (replicas, N, N) con `paso_frente`; los pares se reparten entre
+    procesos. Cada par recibe su propia semilla derivada con
+    `SeedSequence.spawn`, así que el resultado no depende del número de
+    procesos. No se guardan trayectorias, sólo el estado final.
+
+    Parámetros
+    ----------
+    ps : array_like
+        Probabilidades de propagación.
+    densidades_fuego : array_like
+        Fracciones iniciales de celdas en llamas.
+    N : int
+        Tamaño del bosque (N x N).
+    replicas : int
+        Corridas independientes por par (p, densidad_fuego).
+    pasos : int | None
+        Máximo de pasos por corrida (None = hasta que se apague).
+    neighborhood : str
+        'Moore' u 'VonNeumann'.
+    semilla : int | None
+        Semilla raíz para reproducibilidad.
+    n_procesos : int | None
+        Procesos a usar; None usa todos los núcleos, 1 no crea procesos.
+
+    Regresa
+    -------
+    dict
+        {'p', 'densidad_fuego'} con los valores barridos y
+        {'fraccion_quemada', 'duracion', 'percola'}, arreglos de forma
+        (len(ps), len(densidades_fuego), replicas). `percola` indica si el
+        fuego formó un grupo conexo de la fila superior a la inferior.
+    """
+    ps = np.asarray(ps, dtype=float)
+    densidades_fuego = np.asarray(densidades_fuego, dtype=float)
+    pares = [(p, d) for p in ps for d in densidades_fuego]
+    semillas = np.random.SeedSequence(semilla).spawn(len(pares))
+    argumentos = [(p, d, N, replicas, pasos, neighborhood, s)
+                  for (p, d), s in zip(pares, semillas)]
+
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    if n_procesos == 1:
+        filas = [_replicas_incendio(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as ejecutor:
+            filas = list(ejecutor.map(_replicas_incendio, *zip(*argumentos)))
+
+    forma = (len(ps), len(densidades_fuego), replicas)
+    fraccion, duracion, percola = (np.array(c).reshape(forma) for c in zip(*filas))
+    return {"p": ps, "densidad_fuego": densidades_fuego, "fraccion_quemada": fraccion,
+            "duracion": duracion, "percola": percola}
+
+
+def graficar_percolacion(resultado: dict, titulo: str = None):
+    """
+    Grafica la probabilidad de percolación y la fracción quemada media contra
+    p, una curva por densidad inicial de fuego.
+    """
+    fig, axs = plt.subplots(1, 2, figsize=(10, 4))
+    for k, d in enumerate(resultado["densidad_fuego"]):
+        axs[0].plot(resultado["p"], resultado["percola"][:, k].mean(axis=1),
+                    marker="o", markersize=3, label=f"densidad = {d:g}")
+        axs[1].plot(resultado["p"], resultado["fraccion_quemada"][:, k].mean(axis=1),
+                    marker="o", markersize=3, label=f"densidad = {d:g}")
+    axs[0].set_ylabel("Probabilidad de percolación")
+    axs[1].set_ylabel("Fracción quemada media")
+    for ax in axs:
+        ax.set_xlabel("p")
+        ax.grid(True)
+        ax.legend()
+    fig.suptitle(titulo or "Barrido de percolación")
+    plt.show()
+
+
+# =============================================================================
+# Visualización
+# =============================================================================
+def mostrar_mapa(x, ax=None, titulo=None, grid=False, t=-1):
+    """
+    Muestra un mapa de estados con la paleta verde/rojo/negro. Si `x` es una
+    trayectoria (pasos+1, N, N) se muestra el estado del paso `t`.
+    """
+    if np.ndim(x) == 3 or getattr(x, "ndim", 2) == 3:
+        x = x[t]
+    if ax is None:
+        fig, ax = plt.subplots()
+    im = ax.imshow(x, cmap=cmap, norm=norm, interpolation='nearest', origin='upper')
+    if titulo:
+        ax.set_title(titulo)
+    ax.set_xticks([]); ax.set_yticks([])
+    if grid:
+        ax.set_xticks(np.arange(-.5, x.shape[1], 1), minor=True)
+        ax.set_yticks(np.arange(-.5, x.shape[0], 1), minor=True)
+        ax.grid(which='minor', linewidth=0.2)
+    return im
+
+
+def animar_evolucion(M, interval=120, guardar_como=None):
+    fig, ax = plt.subplots()
+    im = ax.imshow(M[0], cmap=cmap, norm=norm, interpolation='nearest')
+    ax.set_xticks([]); ax.set_yticks([])
+    def update(frame):
+        im.set_data(M[frame])
+        ax.set_title(f"t = {frame}")
+        return im,
+    anim = FuncAnimation(fig, update, frames=M.shape[0], interval=interval, blit=True)
+    if guardar_como:
+        anim.save(guardar_como)
+    plt.close(fig)
+    return anim
@@ -0,0 +1,239 @@
+# =============================================================================
+# Trayectorias comprimidas con acceso aleatorio
+# =============================================================================
+# Entre una generación y la siguiente del Juego de la Vida cambian pocas
+# celdas. En lugar de guardar el arreglo (pasos+1, N, M) completo se guardan:
+#   - un cuadro clave completo cada `cada_clave` pasos, y
+#   - para los demás pasos, el XOR con el cuadro anterior codificado por
+#     corridas (inicio, largo, bytes) de los bytes distintos de cero.
+# Leer T[t] cuesta decodificar un cuadro clave y a lo más cada_clave-1 deltas;
+# al avanzar de uno en uno (slider, Play) sólo se aplica un delta por cuadro.
+import numpy as np
+
+
+def _corridas(d: np.ndarray):
+    """
+    Corridas de bytes distintos de cero en `d`: (inicios, largos, datos).
+
+    Si las corridas son tantas que ocupan más que `d`, se regresa una sola
+    corrida con todo el arreglo (delta denso).
+    """
+    nz = d != 0
+    if not nz.any():
+        vacio = np.zeros(0, dtype=np.int32)
+        return vacio, vacio, np.zeros(0, dtype=np.uint8)
+    bordes = np.diff(np.concatenate(([False], nz, [False])).astype(np.int8))
+    inicios = np.flatnonzero(bordes == 1).astype(np.int32)
+    largos = (np.flatnonzero(bordes == -1) - inicios).astype(np.int32)
+    datos = d[nz]
+    if inicios.nbytes + largos.nbytes + datos.nbytes >= d.nbytes:
+        return np.zeros(1, np.int32), np.array([len(d)], np.int32), d
+    return inicios, largos, datos
+
+
+def _aplicar_corridas(b: np.ndarray, inicios, largos, datos) -> None:
+    """Aplica (XOR) en el lugar un delta codificado por corridas."""
+    if len(inicios) == 0:
+        return
+    # Posición de cada byte de `datos`: inicio de su corrida + desplazamiento.
+    fin = np.cumsum(largos)
+    idx = np.arange(fin[-1]) - np.repeat(fin - largos - inicios, largos)
+    b[idx] ^= datos
+
+
+class TrayectoriaComprimida:
+    """
+    Trayectoria (pasos+1, N, M) de uint8 guardada como cuadros clave y deltas.
+
+    Se comporta como un arreglo de sólo lectura para `ver_con_slider` y
+    `ver_con_slider_play`: tiene `shape`, `len` y acepta `T[t]` y `T[a:b:c]`.
+
+    Parámetros
+    ----------
+    forma : tuple
+        Forma (N, M) de cada estado.
+    cada_clave : int
+        Distancia entre cuadros clave (cota del costo de `T[t]`).
+    binario : bool
+        Si los estados sólo tienen 0 y 1 se empacan a 1 bit por celda; con
+        False se guardan los bytes tal cual (por ejemplo, estados 0..3).
+        Con True, `agregar` rechaza estados con valores mayores que 1.
+    """
+
+    def __init__(self, forma, cada_clave: int = 32, binario: bool = True):
+        self.forma = tuple(forma)
+        self.cada_clave = int(cada_clave)
+        self.binario = binario
+        self._claves = []   # bytes de los cuadros t = 0, k, 2k, ...
+        self._deltas = []   # (inicios, largos, datos) o None para cuadros clave
+        self._ultimo = None
+        self._cache = (-1, None)   # (t, bytes) del último cuadro decodificado
+
+    # --- Codificación ---
+    def _a_bytes(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.uint8).reshape(-1)
+        if not self.binario:
+            return x.copy()
+        if x.max(initial=0) > 1:
+            raise ValueError("El estado tiene valores mayores que 1; usa binario=False.")
+        return np.packbits(x)
+
+    def _de_bytes(self, b: np.ndarray) -> np.ndarray:
+        n = int(np.prod(self.forma))
+        x = np.unpackbits(b, count=n) if self.binario else b.copy()
+        return x.reshape(self.forma)
+
+    def agregar(self, x: np.ndarray) -> None:
+        """Agrega el estado del siguiente paso de tiempo."""
+        if np.shape(x) != self.forma:
+            raise ValueError(f"Se esperaba un estado de forma {self.forma}, no {np.shape(x)}.")
+        b = self._a_bytes(x)
+        if len(self._deltas) % self.cada_clave == 0:
+            self._claves.append(b)
+            self._deltas.append(None)
+        else:
+            self._deltas.append(_corridas(b ^ self._ultimo))
+        self._ultimo = b
+
+    @classmethod
+    def desde_arreglo(cls, T: np.ndarray, cada_clave: int = 32, binario: bool = None):
+        """Comprime un arreglo (pasos+1, N, M) ya calculado."""
+        if binario is None:
+            binario = bool(np.max(T) <= 1)
+        tr = cls(T.shape[1:], cada_clave, binario)
+        for x in T:
+            tr.agregar(x)
+        return tr
+
+    @classmethod
+    def desde_iterador(cls, estados, cada_clave: int = 32, binario: bool = True):
+        """
+        Comprime los estados producidos por un iterable (p. ej. `evolucion_iter`).
+        Con binario=True, un estado con valores mayores que 1 lanza ValueError.
+        """
+        tr = None
+        for x in estados:
+            if tr is None:
+                tr = cls(np.shape(x), cada_clave, binario)
+            tr.agregar(x)
+        return tr
+
+    # --- Acceso ---
+    @property
+    def shape(self):
+        return (len(self._deltas), *self.forma)
+
+    @property
+    def ndim(self):
+        return 1 + len(self.forma)
+
+    @property
+    def dtype(self):
+        return np.dtype(np.uint8)
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def _bytes_en(self, t: int) -> np.ndarray:
+        """Bytes del cuadro t, reutilizando el último cuadro decodificado si sirve."""
+        k = t - t % self.cada_clave
+        tc, bc = self._cache
+        if k <= tc <= t:
+            b, desde = bc.copy(), tc + 1
+        else:
+            b, desde = self._claves[k // self.cada_clave].copy(), k + 1
+        for s in range(desde, t + 1):
+            _aplicar_corridas(b, *self._deltas[s])
+        self._cache = (t, b)
+        return b
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            tiempos = range(*indice.indices(len(self)))
+            salida = np.empty((len(tiempos), *self.forma), dtype=np.uint8)
+            for i, t in enumerate(tiempos):
+                salida[i] = self._de_bytes(self._bytes_en(t))
+            return salida
+        t = int(indice)
+        if t < 0:
+            t += len(self)
+        if not 0 <= t < len(self):
+            raise IndexError(f"t = {indice} fuera de rango para {len(self)} pasos.")
+        return self._de_bytes(self._bytes_en(t))
+
+    def __iter__(self):
+        for t in range(len(self)):
+            yield self[t]
+
+    # --- Tamaño ---
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los datos comprimidos."""
+        total = sum(c.nbytes for c in self._claves)
+        for d in self._deltas:
+            if d is not None:
+                total += sum(a.nbytes for a in d)
+        return total
+
+    def razon_compresion(self) -> float:
+        """Tamaño del arreglo sin comprimir entre el tamaño comprimido."""
+        return len(self) * int(np.prod(self.forma)) / max(self.nbytes, 1)
+
+    # --- Archivo ---
+    def guardar(self, ruta: str) -> None:
+        """Guarda la trayectoria en un solo archivo `.npz`."""
+        deltas = [d for d in self._deltas if d is not None]
+        n_corridas = np.array([len(d[0]) for d in deltas], dtype=np.int64)
+        n_datos = np.array([len(d[2]) for d in deltas], dtype=np.int64)
+        np.savez(ruta,
+                 forma=np.array(self.forma), cada_clave=self.cada_clave,
+                 binario=self.binario, pasos=len(self),
+                 claves=np.stack(self._claves) if self._claves else np.zeros((0, 0), np.uint8),
+                 n_corridas=n_corridas, n_datos=n_datos,
+                 inicios=np.concatenate([d[0] for d in deltas] or [np.zeros(0, np.int32)]),
+                 largos=np.concatenate([d[1] for d in deltas] or [np.zeros(0, np.int32)]),
+                 datos=np.concatenate([d[2] for d in deltas] or [np.zeros(0, np.uint8)]))
+
+    @classmethod
+    def cargar(cls, ruta: str):
+        """Lee una trayectoria escrita con `guardar`."""
+        with np.load(ruta) as f:
+            tr = cls(tuple(f["forma"]), int(f["cada_clave"]), bool(f["binario"]))
+            pasos = int(f["pasos"])
+            claves = list(f["claves"])
+            cr = np.concatenate(([0], np.cumsum(f["n_corridas"])))
+            cd = np.concatenate(([0], np.cumsum(f["n_datos"])))
+            inicios, largos, datos = f["inicios"], f["largos"], f["datos"]
+        tr._claves = claves
+        j = 0
+        for t in range(pasos):
+            if t % tr.cada_clave == 0:
+                tr._deltas.append(None)
+            else:
+                tr._deltas.append((inicios[cr[j]:cr[j+1]], largos[cr[j]:cr[j+1]],
+                                   datos[cd[j]:cd[j+1]]))
+                j += 1
+        if pasos:
+            tr._ultimo = tr._bytes_en(pasos - 1)
+        return tr
+
+
+def evolucion_comprimida(estado_inicial: np.ndarray, pasos: int, regla,
+                         cada_clave: int = 32, binario: bool = None) -> TrayectoriaComprimida:
+    """
+    Igual que `evolucion`, pero guarda la trayectoria comprimida. El resultado
+    se puede pasar directo a `ver_con_slider` o `ver_con_slider_play`.
+
+    Si `binario` es None se decide con el estado inicial; si un paso posterior
+    produce valores mayores que 1 se lanza ValueError (usa binario=False
+    para reglas con más de dos estados).
+    """
+    x = np.asarray(estado_inicial, dtype=np.uint8)
+    if binario is None:
+        binario = bool(x.max(initial=0) <= 1)
+    tr = TrayectoriaComprimida(x.shape, cada_clave, binario=binario)
+    tr.agregar(x)
+    for _ in range(pasos):
+        x = regla(x).astype(np.uint8)
+        tr.agregar(x)
+    return tr
@@ -0,0 +1,323 @@
+# =============================================================================
+# Juego de la Vida (Clase 27)
+# =============================================================================
+# Funciones de la Clase 27 reunidas en un módulo para importarlas desde los
+# notebooks con `from vida import *`.
+import re
+import threading
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Historia en disco y detección de ciclos, compartidas con `automatas1d`
+# (Clase 25). `detectar_ciclo` no se usa aquí: se reexporta a propósito para
+# que `from vida import *` lo ofrezca junto con `evolucion_iter`.
+from historia_automatas import IndiceEstados, detectar_ciclo, escribir_en_disco
+
+
+# =============================================================================
+# Regla de Conway
+# =============================================================================
+def vecinos8(x: np.ndarray) -> np.ndarray:
+    """
+    Suma de vecinos (Moore) con condiciones periódicas,
+    usando índices con módulo.
+
+    Es la versión celda por celda de la clase; es lenta y sólo se usa como
+    referencia en `verificar_vecinos`.
+    """
+    N, M = x.shape
+    n = np.zeros_like(x, dtype=int)
+    for i in range(N):
+        for j in range(M):
+            s = 0
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    if di == 0 and dj == 0:
+                        continue
+                    s += x[(i + di) % N, (j + dj) % M]
+            n[i, j] = s
+    return n
+
+
+def contar_vecinos(x: np.ndarray, vecindad: str = "Moore",
+                   frontera: str = "periodica") -> np.ndarray:
+    """
+    Cuenta los vecinos vivos de cada celda con desplazamientos del arreglo
+    (sin ciclos en Python).
+
+    Para Moore se suman primero tres filas desplazadas y luego tres columnas
+    desplazadas (suma 3x3 separable) y se resta la celda central.
+
+    Parámetros
+    ----------
+    x : np.ndarray
+        Tablero binario (N, M).
+    vecindad : str
+        'Moore' (8 vecinos) o 'VonNeumann' (4 vecinos).
+    frontera : str
+        'periodica' (toro) o 'abierta' (fuera del tablero todo está muerto).
+
+    Regresa
+    -------
+    np.ndarray
+        Arreglo (N, M) de tipo uint8 con el número de vecinos vivos.
+    """
+    x = np.asarray(x, dtype=np.uint8)
+    if frontera == "periodica":
+        ext = np.pad(x, 1, mode="wrap")
+    elif frontera == "abierta":
+        ext = np.pad(x, 1)
+    else:
+        raise ValueError("frontera debe ser 'periodica' o 'abierta'")
+
+    if vecindad == "Moore":
+        col = ext[:-2] + ext[1:-1]
+        col += ext[2:]
+        n = col[:, :-2] + col[:, 1:-1]
+        n += col[:, 2:]
+        n -= x
+        return n
+    if vecindad == "VonNeumann":
+        n = ext[:-2, 1:-1] + ext[2:, 1:-1]
+        n += ext[1:-1, :-2]
+        n += ext[1:-1, 2:]
+        return n
+    raise ValueError("vecindad debe ser 'Moore' o 'VonNeumann'")
+
+
+def parsear_regla(regla: str):
+    """
+    Convierte una regla en notación B/S (p. ej. 'B3/S23' para Conway,
+    'B36/S23' para HighLife) en las tuplas (nace, sobrevive).
+    """
+    m = re.fullmatch(r"B(\d*)/S(\d*)", regla.replace(" ", ""), re.I)
+    if m is None:
+        raise ValueError(f"Regla inválida: {regla!r} (use la notación 'B3/S23').")
+    return tuple(int(c) for c in m.group(1)), tuple(int(c) for c in m.group(2))
+
+
+def _en(n: np.ndarray, valores) -> np.ndarray:
+    """Máscara booleana de las celdas cuyo conteo está en `valores`."""
+    m = np.zeros(n.shape, dtype=bool)
+    for v in valores:
+        m |= (n == v)
+    return m
+
+
+def regla_vida(x: np.ndarray, regla: str = "B3/S23", vecindad: str = "Moore",
+               frontera: str = "periodica") -> np.ndarray:
+    """
+    Un paso de un autómata tipo Vida con regla B/S.
+    Por defecto es Conway Life: nace con 3, sobrevive con 2 o 3.
+    x es binaria (0/1).
+
+    Parámetros
+    ----------
+    regla : str
+        Regla en notación B/S (ver `parsear_regla`).
+    vecindad : str
+        'Moore' o 'VonNeumann'.
+    frontera : str
+        'periodica' o 'abierta'.
+    """
+    nace, sobrevive = parsear_regla(regla)
+    n = contar_vecinos(x, vecindad, frontera)
+    vivo = np.asarray(x, dtype=bool)
+    return (vivo & _en(n, sobrevive)) | (~vivo & _en(n, nace))
+
+
+def regla_BS(regla: str = "B3/S23", vecindad: str = "Moore",
+             frontera: str = "periodica"):
+    """
+    Regresa una función x -> x' con la regla fija, lista para `evolucion`.
+
+    Ejemplo
+    -------
+    >>> T = evolucion(x0, pasos=200, regla=regla_BS("B36/S23"))
+    """
+    def regla_fija(x: np.ndarray) -> np.ndarray:
+        return regla_vida(x, regla, vecindad, frontera)
+    return regla_fija
+
+
+def generaciones_por_segundo(N: int = 2000, pasos: int = 100, regla: str = "B3/S23") -> float:
+    """Mide cuántas generaciones por segundo se calculan en un tablero N x N."""
+    x = (np.random.rand(N, N) < 0.3).astype(np.uint8)
+    inicio = time.perf_counter()
+    for _ in range(pasos):
+        x = regla_vida(x, regla).view(np.uint8)
+    gps = pasos / (time.perf_counter() - inicio)
+    print(f"{N}x{N}: {gps:.1f} generaciones/s")
+    return gps
+
+
+def verificar_vecinos(N: int = 23, M: int = 17, semilla: int = 0) -> bool:
+    """Comprueba que `contar_vecinos` coincide con `vecinos8` (Moore, periódica)."""
+    rng = np.random.default_rng(semilla)
+    for p in (0.1, 0.5, 0.9):
+        x = (rng.random((N, M)) < p).astype(np.uint8)
+        assert np.array_equal(contar_vecinos(x), vecinos8(x)), f"No coincide con p = {p}."
+    return True
+
+
+# =============================================================================
+# Evolución: en memoria, como generador o hacia disco
+# =============================================================================
+def evolucion(estado_inicial: np.ndarray, pasos: int, regla) -> np.ndarray:
+    """
+    Devuelve un arreglo (pasos+1, N, M) con la trayectoria completa.
+    """
+    x = estado_inicial.astype(np.uint8)
+    T = np.zeros((pasos+1, *x.shape), dtype=np.uint8)
+    T[0] = x
+    for t in range(pasos):
+        x = regla(x).astype(np.uint8)
+        T[t+1] = x
+    return T
+
+
+def evolucion_iter(estado_inicial: np.ndarray, pasos: int, regla):
+    """
+    Versión generadora de `evolucion`: produce un estado (N, M) por paso,
+    t = 0, 1, ..., pasos, sin reservar el arreglo (pasos+1, N, M).
+    """
+    x = estado_inicial.astype(np.uint8)
+    yield x
+    for _ in range(pasos):
+        x = regla(x).astype(np.uint8)
+        yield x
+
+
+def evolucion_a_disco(estado_inicial: np.ndarray, pasos: int, regla, ruta: str,
+                      cada: int = 100, identidad: str = None) -> np.memmap:
+    """
+    Igual que `evolucion`, pero escribe la trayectoria en `ruta` (.npy).
+    El resultado se puede pasar directo a `ver_con_slider`. Sólo se reanuda
+    una corrida previa con el mismo estado inicial, `pasos` y regla (ver
+    `escribir_en_disco`; `identidad` describe la regla si no es de `regla_BS`).
+    """
+    return escribir_en_disco(ruta, estado_inicial, pasos, regla, cada=cada,
+                             identidad=identidad)
+
+
+# =============================================================================
+# Detección de puntos fijos y ciclos
+# =============================================================================
+def evolucion_con_ciclos(estado_inicial: np.ndarray, pasos: int, regla,
+                         parar: bool = True, memoria: int = 4096):
+    """
+    Como `evolucion`, pero además detecta puntos fijos y osciladores globales.
+
+    Parámetros
+    ----------
+    parar : bool
+        Si True la evolución termina en el primer tablero repetido y el arreglo
+        tiene sólo los pasos calculados; si False se completan los `pasos`.
+    memoria : int
+        Número de huellas que guarda el índice (ver `IndiceEstados`).
+
+    Regresa
+    -------
+    (T, info) : (np.ndarray, dict)
+        Trayectoria (pasos calculados + 1, N, M) y el diccionario de
+        `detectar_ciclo`.
+    """
+    indice = IndiceEstados(memoria)
+    cuadros = []
+    info = {"transitorio": None, "periodo": None, "pasos_calculados": pasos}
+    for t, x in enumerate(evolucion_iter(estado_inicial, pasos, regla)):
+        cuadros.append(x)
+        if info["periodo"] is None:
+            t_previo = indice.registrar(x, t)
+            if t_previo is not None:
+                info.update(transitorio=t_previo, periodo=t - t_previo)
+                if parar:
+                    info["pasos_calculados"] = t
+                    break
+    return np.array(cuadros, dtype=np.uint8), info
+
+
+# =============================================================================
+# Visualización
+# =============================================================================
+# Ambas funciones sólo leen `trayectoria[t]` del cuadro visible, así que
+# aceptan un np.memmap (ver `evolucion_a_disco`) sin cargarlo completo.
+# `ipywidgets` se importa dentro de cada una para que la simulación (y los
+# procesos de `vida_paralela`) funcionen sin Jupyter.
+def ver_con_slider(trayectoria: np.ndarray, cmap='binary'):
+    """
+    Muestra un frame con slider de tiempo.
+    """
+    from ipywidgets import interact, IntSlider
+
+    pasos, n, m = trayectoria.shape[0]-1, *trayectoria.shape[1:]
+    fig, ax = plt.subplots()
+    im = ax.imshow(trayectoria[0], cmap=cmap, interpolation='nearest')
+    ax.set_title("t = 0"); ax.set_axis_off()
+
+    def actualizar(t=0):
+        im.set_data(trayectoria[t])
+        ax.set_title(f"t = {t}")
+
+    interact(actualizar, t=IntSlider(min=0, max=pasos, value=0, step=1));
+
+
+def ver_con_slider_play(trayectoria: np.ndarray, cmap='binary'):
+    """
+    Visualiza la evolución con un slider y un botón Play/Pausa.
+    """
+    from ipywidgets import IntSlider, Button, HBox, VBox, Output
+    from IPython.display import display
+
+    pasos, n, m = trayectoria.shape[0]-1, *trayectoria.shape[1:]
+    fig, ax = plt.subplots()
+    im = ax.imshow(trayectoria[0], cmap=cmap, interpolation='nearest')
+    ax.set_title("t = 0")
+    ax.set_axis_off()
+
+    # --- Widgets ---
+    slider = IntSlider(min=0, max=pasos, value=0, step=1, description='t')
+    boton = Button(description='▶ Play', button_style='success')
+    out = Output()
+
+    # --- Estado ---
+    estado = {'reproduciendo': False}
+
+    # --- Función de actualización ---
+    def actualizar(change=None):
+        t = slider.value
+        im.set_data(trayectoria[t])
+        ax.set_title(f"t = {t}")
+        fig.canvas.draw_idle()
+
+    slider.observe(actualizar, names='value')
+
+    # --- Reproducción automática ---
+    def reproducir():
+        while estado['reproduciendo']:
+            time.sleep(0.1)  # velocidad (en segundos)
+            if slider.value < pasos:
+                slider.value += 1
+            else:
+                estado['reproduciendo'] = False
+                boton.description = '▶ Play'
+                boton.button_style = 'success'
+                break
+
+    def on_click(b):
+        if not estado['reproduciendo']:
+            estado['reproduciendo'] = True
+            boton.description = '⏸ Pause'
+            boton.button_style = 'warning'
+            threading.Thread(target=reproducir, daemon=True).start()
+        else:
+            estado['reproduciendo'] = False
+            boton.description = '▶ Play'
+            boton.button_style = 'success'
+
+    boton.on_click(on_click)
+
+    display(VBox([HBox([boton, slider]), out]))
+    actualizar()
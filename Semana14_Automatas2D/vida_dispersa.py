@@ -0,0 +1,351 @@
+# =============================================================================
+# Juego de la Vida en un tablero no acotado: conjunto de celdas vivas y HashLife
+# =============================================================================
+# Para planeadores, cañones o "matusalenes" casi todo el tablero está vacío.
+# Aquí el estado es un arreglo (K, 2) con las coordenadas (fila, columna) de
+# las K celdas vivas, sin límites de tablero. Hay dos motores:
+#   - 'conjunto': un paso a la vez, con costo proporcional a las celdas vivas.
+#   - 'hashlife': árbol cuaternario con memorización (Gosper) que avanza 2^k
+#     generaciones de un salto cuando el patrón es repetitivo.
+# `ventana_densa` recorta una región a un arreglo (pasos+1, N, M) para
+# `ver_con_slider`.
+import numpy as np
+
+from vida import parsear_regla
+
+
+# =============================================================================
+# Conversión entre tableros densos y listas de celdas
+# =============================================================================
+_DESP = 1 << 30                      # desplazamiento para codificar negativos
+_VECINDAD = np.array([(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                      if not (di == 0 and dj == 0)], dtype=np.int64)
+
+
+def celdas_de_arreglo(x: np.ndarray, fila0: int = 0, col0: int = 0) -> np.ndarray:
+    """Coordenadas (K, 2) de las celdas vivas de un tablero denso."""
+    return np.argwhere(np.asarray(x) != 0).astype(np.int64) + np.array([fila0, col0])
+
+
+def _codificar(celdas: np.ndarray) -> np.ndarray:
+    """Cada (fila, columna) -> un entero int64 (ordena por fila y luego columna)."""
+    return ((celdas[:, 0] + _DESP) << 31) | (celdas[:, 1] + _DESP)
+
+
+def _decodificar(claves: np.ndarray) -> np.ndarray:
+    filas = (claves >> 31) - _DESP
+    cols = (claves & ((1 << 31) - 1)) - _DESP
+    return np.stack([filas, cols], axis=1)
+
+
+def ventana_densa(estados, fila0: int, col0: int, N: int, M: int) -> np.ndarray:
+    """
+    Recorta la ventana [fila0, fila0+N) x [col0, col0+M) de cada estado.
+
+    Parámetros
+    ----------
+    estados : list de np.ndarray | np.ndarray
+        Lista de arreglos (K, 2) (como la que regresa `evolucion_dispersa`) o un
+        solo arreglo (K, 2).
+
+    Regresa
+    -------
+    np.ndarray
+        Arreglo (len(estados), N, M) de uint8, listo para `ver_con_slider`;
+        (N, M) si se pasó un solo estado.
+    """
+    uno = isinstance(estados, np.ndarray)
+    lista = [estados] if uno else list(estados)
+    T = np.zeros((len(lista), N, M), dtype=np.uint8)
+    for t, c in enumerate(lista):
+        if len(c) == 0:
+            continue
+        i, j = c[:, 0] - fila0, c[:, 1] - col0
+        dentro = (i >= 0) & (i < N) & (j >= 0) & (j < M)
+        T[t, i[dentro], j[dentro]] = 1
+    return T[0] if uno else T
+
+
+# =============================================================================
+# Motor 'conjunto': un paso sobre la lista de celdas vivas
+# =============================================================================
+def _regla_sin_b0(regla: str):
+    """
+    `parsear_regla` para tableros no acotados. Con B0 cada celda vacía del
+    plano infinito nacería, lo que no cabe en una lista de celdas vivas.
+    """
+    nace, sobrevive = parsear_regla(regla)
+    if 0 in nace:
+        raise ValueError("Las reglas con B0 no se pueden simular en un tablero no acotado.")
+    return nace, sobrevive
+
+
+def paso_disperso(celdas: np.ndarray, regla: str = "B3/S23") -> np.ndarray:
+    """
+    Un paso de Vida sobre la lista de celdas vivas.
+
+    Cada celda viva "reparte" un voto a sus 8 vecinas; `np.unique` cuenta los
+    votos y la regla B/S decide quién vive. El costo es O(K log K) con K celdas
+    vivas, independiente del tamaño del tablero. Las reglas con B0 lanzan
+    ValueError.
+    """
+    nace, sobrevive = _regla_sin_b0(regla)
+    if len(celdas) == 0:
+        return celdas
+    vivas = np.unique(_codificar(celdas))
+    vecinas = (celdas[:, None, :] + _VECINDAD[None, :, :]).reshape(-1, 2)
+    candidatas, cuenta = np.unique(_codificar(vecinas), return_counts=True)
+    viva = np.isin(candidatas, vivas, assume_unique=True)
+    nuevas = candidatas[(viva & np.isin(cuenta, sobrevive)) | (~viva & np.isin(cuenta, nace))]
+    if 0 in sobrevive:
+        aisladas = vivas[~np.isin(vivas, candidatas, assume_unique=True)]
+        nuevas = np.union1d(nuevas, aisladas)
+    return _decodificar(nuevas)
+
+
+# =============================================================================
+# Motor 'hashlife': árbol cuaternario con memorización
+# =============================================================================
+class _Nodo:
+    """
+    Cuadrado de 2^k x 2^k celdas. Los cuadrantes son a (noroeste),
+    b (noreste), c (suroeste) y d (sureste); n es la población.
+    Los nodos son únicos (se internan), así que se comparan por identidad.
+    """
+    __slots__ = ("k", "a", "b", "c", "d", "n", "_hash")
+
+    def __init__(self, k, a, b, c, d, n):
+        self.k, self.a, self.b, self.c, self.d, self.n = k, a, b, c, d, n
+        self._hash = hash((k, id(a), id(b), id(c), id(d), n))
+
+    def __hash__(self):
+        return self._hash
+
+
+class HashLife:
+    """
+    Motor HashLife para una regla B/S (sin B0).
+
+    Ejemplo
+    -------
+    >>> motor = HashLife()
+    >>> celdas = motor.avanzar(celdas_iniciales, 2**20)
+    """
+    def __init__(self, regla: str = "B3/S23"):
+        self.nace, self.sobrevive = _regla_sin_b0(regla)
+        self.muerta = _Nodo(0, None, None, None, None, 0)
+        self.viva = _Nodo(0, None, None, None, None, 1)
+        self._nodos = {}
+        self._ceros = {0: self.muerta}
+        self._sucesor = {}
+
+    # --- construcción de nodos -------------------------------------------------
+    def _unir(self, a, b, c, d) -> _Nodo:
+        clave = (a, b, c, d)
+        nodo = self._nodos.get(clave)
+        if nodo is None:
+            nodo = _Nodo(a.k + 1, a, b, c, d, a.n + b.n + c.n + d.n)
+            self._nodos[clave] = nodo
+        return nodo
+
+    def _cero(self, k: int) -> _Nodo:
+        if k not in self._ceros:
+            z = self._cero(k - 1)
+            self._ceros[k] = self._unir(z, z, z, z)
+        return self._ceros[k]
+
+    def _centrar(self, m: _Nodo) -> _Nodo:
+        """Nodo de nivel k+1 con m en el centro (rodeado de celdas muertas)."""
+        z = self._cero(m.k - 1)
+        return self._unir(self._unir(z, z, z, m.a), self._unir(z, z, m.b, z),
+                          self._unir(z, m.c, z, z), self._unir(m.d, z, z, z))
+
+    @staticmethod
+    def _borde_vacio(m: _Nodo) -> bool:
+        """True si todas las celdas vivas están en el cuadrado central de nivel k-1."""
+        return m.n == m.a.d.n + m.b.c.n + m.c.b.n + m.d.a.n
+
+    def _recortar(self, m: _Nodo) -> _Nodo:
+        return self._unir(m.a.d, m.b.c, m.c.b, m.d.a)
+
+    # --- evolución -------------------------------------------------------------
+    def _vida_4x4(self, m: _Nodo) -> _Nodo:
+        """Centro 2x2 de un nodo 4x4 tras una generación."""
+        celdas = [[m.a.a, m.a.b, m.b.a, m.b.b],
+                  [m.a.c, m.a.d, m.b.c, m.b.d],
+                  [m.c.a, m.c.b, m.d.a, m.d.b],
+                  [m.c.c, m.c.d, m.d.c, m.d.d]]
+        nuevas = []
+        for i in (1, 2):
+            for j in (1, 2):
+                s = sum(celdas[i + di][j + dj].n for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                        if not (di == 0 and dj == 0))
+                vive = s in self.sobrevive if celdas[i][j].n else s in self.nace
+                nuevas.append(self.viva if vive else self.muerta)
+        return self._unir(*nuevas)
+
+    def _siguiente(self, m: _Nodo, j: int) -> _Nodo:
+        """
+        Centro (nivel k-1) del nodo m tras 2^j generaciones, con j ≤ k-2.
+        Es la recursión de Gosper: nueve subcuadrados traslapados avanzan la
+        mitad del tiempo y sus centros se combinan.
+        """
+        clave = (m, j)
+        if clave in self._sucesor:
+            return self._sucesor[clave]
+        if m.n == 0:
+            r = m.a
+        elif m.k == 2:
+            r = self._vida_4x4(m)
+        else:
+            u = self._unir
+            c1 = self._siguiente(m.a, j)
+            c2 = self._siguiente(u(m.a.b, m.b.a, m.a.d, m.b.c), j)
+            c3 = self._siguiente(m.b, j)
+            c4 = self._siguiente(u(m.a.c, m.a.d, m.c.a, m.c.b), j)
+            c5 = self._siguiente(u(m.a.d, m.b.c, m.c.b, m.d.a), j)
+            c6 = self._siguiente(u(m.b.c, m.b.d, m.d.a, m.d.b), j)
+            c7 = self._siguiente(m.c, j)
+            c8 = self._siguiente(u(m.c.b, m.d.a, m.c.d, m.d.c), j)
+            c9 = self._siguiente(m.d, j)
+            if j < m.k - 2:
+                # Ya se avanzaron 2^j generaciones: sólo se toman los centros
+                r = u(u(c1.d, c2.c, c4.b, c5.a), u(c2.d, c3.c, c5.b, c6.a),
+                      u(c4.d, c5.c, c7.b, c8.a), u(c5.d, c6.c, c8.b, c9.a))
+            else:
+                # Segundo medio salto
+                r = u(self._siguiente(u(c1, c2, c4, c5), j),
+                      self._siguiente(u(c2, c3, c5, c6), j),
+                      self._siguiente(u(c4, c5, c7, c8), j),
+                      self._siguiente(u(c5, c6, c8, c9), j))
+        self._sucesor[clave] = r
+        return r
+
+    # --- conversión ------------------------------------------------------------
+    def _construir(self, celdas: np.ndarray, k: int, f0: int, c0: int) -> _Nodo:
+        if len(celdas) == 0:
+            return self._cero(k)
+        if k == 0:
+            return self.viva
+        h = 1 << (k - 1)
+        arriba = celdas[:, 0] < f0 + h
+        izq = celdas[:, 1] < c0 + h
+        return self._unir(self._construir(celdas[arriba & izq], k - 1, f0, c0),
+                          self._construir(celdas[arriba & ~izq], k - 1, f0, c0 + h),
+                          self._construir(celdas[~arriba & izq], k - 1, f0 + h, c0),
+                          self._construir(celdas[~arriba & ~izq], k - 1, f0 + h, c0 + h))
+
+    def desde_celdas(self, celdas: np.ndarray):
+        """Construye (nodo, (fila0, col0)) con la esquina superior izquierda."""
+        celdas = np.asarray(celdas, dtype=np.int64).reshape(-1, 2)
+        if len(celdas) == 0:
+            return self._cero(3), (0, 0)
+        f0, c0 = celdas.min(axis=0)
+        extension = int((celdas.max(axis=0) - (f0, c0)).max()) + 1
+        k = max(3, int(np.ceil(np.log2(extension))))
+        return self._construir(celdas, k, int(f0), int(c0)), (int(f0), int(c0))
+
+    def a_celdas(self, nodo: _Nodo, origen) -> np.ndarray:
+        """Lista (K, 2) de celdas vivas de un nodo ubicado en `origen`."""
+        salida = []
+        pila = [(nodo, origen[0], origen[1])]
+        while pila:
+            m, f, c = pila.pop()
+            if m.n == 0:
+                continue
+            if m.k == 0:
+                salida.append((f, c))
+                continue
+            h = 1 << (m.k - 1)
+            pila.extend([(m.a, f, c), (m.b, f, c + h), (m.c, f + h, c), (m.d, f + h, c + h)])
+        if not salida:
+            return np.zeros((0, 2), dtype=np.int64)
+        return _decodificar(np.unique(_codificar(np.array(salida, dtype=np.int64))))
+
+    def avanzar(self, celdas: np.ndarray, generaciones: int) -> np.ndarray:
+        """
+        Avanza `generaciones` pasos. Se descompone el número en potencias de 2
+        y cada una se da como un solo salto de `_siguiente`.
+        """
+        nodo, (f0, c0) = self.desde_celdas(celdas)
+        j = 0
+        while generaciones > 0:
+            if generaciones & 1:
+                # Agrandar hasta que el patrón quepa con margen ≥ 2^j
+                while nodo.k < j + 2 or not self._borde_vacio(nodo):
+                    h = 1 << (nodo.k - 1)
+                    nodo, f0, c0 = self._centrar(nodo), f0 - h, c0 - h
+                h = 1 << (nodo.k - 1)
+                nodo, f0, c0 = self._centrar(nodo), f0 - h, c0 - h
+                # El resultado es el centro de nivel k-1
+                desplazamiento = 1 << (nodo.k - 2)
+                nodo, f0, c0 = self._siguiente(nodo, j), f0 + desplazamiento, c0 + desplazamiento
+                # Recortar el borde vacío para mantener el árbol pequeño
+                while nodo.k > 3 and nodo.n > 0 and self._borde_vacio(nodo):
+                    desplazamiento = 1 << (nodo.k - 2)
+                    nodo, f0, c0 = self._recortar(nodo), f0 + desplazamiento, c0 + desplazamiento
+            generaciones >>= 1
+            j += 1
+        return self.a_celdas(nodo, (f0, c0))
+
+
+# =============================================================================
+# API tipo `evolucion`
+# =============================================================================
+def evolucion_celdas(celdas: np.ndarray, pasos: int, regla: str = "B3/S23",
+                     modo: str = "conjunto", cada: int = 1) -> list:
+    """
+    Evolución en un tablero no acotado a partir de una lista de celdas vivas.
+
+    Parámetros
+    ----------
+    celdas : np.ndarray
+        Coordenadas (K, 2) de las celdas vivas.
+    pasos : int
+        Número de generaciones.
+    regla : str
+        Regla en notación B/S, sin B0.
+    modo : str
+        'conjunto' (un paso a la vez) o 'hashlife' (saltos memorizados; conviene
+        con `cada` grande, p. ej. potencias de 2).
+    cada : int
+        Se guarda un estado cada `cada` generaciones (entero ≥ 1).
+
+    Regresa
+    -------
+    list de np.ndarray
+        Estados (K, 2) en t = 0, cada, 2*cada, ..., ≤ pasos. Use
+        `ventana_densa` para verlos con `ver_con_slider`.
+    """
+    if modo not in ("conjunto", "hashlife"):
+        raise ValueError("modo debe ser 'conjunto' o 'hashlife'")
+    if cada < 1:
+        raise ValueError("cada debe ser un entero positivo.")
+    _regla_sin_b0(regla)
+    celdas = np.asarray(celdas, dtype=np.int64).reshape(-1, 2)
+    estados = [celdas]
+    if modo == "conjunto":
+        for t in range(1, pasos + 1):
+            celdas = paso_disperso(celdas, regla)
+            if t % cada == 0:
+                estados.append(celdas)
+    elif modo == "hashlife":
+        motor = HashLife(regla)
+        for _ in range(pasos // cada):
+            celdas = motor.avanzar(celdas, cada)
+            estados.append(celdas)
+    return estados
+
+
+def evolucion_dispersa(estado_inicial: np.ndarray, pasos: int, regla: str = "B3/S23",
+                       modo: str = "conjunto", cada: int = 1) -> list:
+    """
+    Como `evolucion`, pero el tablero denso inicial se coloca en un plano no
+    acotado (sin frontera periódica) y se evoluciona con `evolucion_celdas`.
+
+    Ejemplo
+    -------
+    >>> estados = evolucion_dispersa(x0, pasos=1000, modo="hashlife", cada=10)
+    >>> ver_con_slider(ventana_densa(estados, -50, -50, 200, 200))
+    """
+    return evolucion_celdas(celdas_de_arreglo(estado_inicial), pasos, regla, modo, cada)
@@ -0,0 +1,162 @@
+# =============================================================================
+# Juego de la Vida en varios núcleos con memoria compartida
+# =============================================================================
+# El tablero vive en dos bloques de `multiprocessing.shared_memory` (estado
+# actual y siguiente). Cada proceso es dueño de una franja horizontal de filas;
+# en cada generación lee su franja más una fila de halo arriba y abajo (que
+# pertenecen a sus vecinos), escribe su franja en el otro bloque y espera en
+# una barrera. Después se intercambian los papeles de los bloques, sin copiar
+# el tablero entre procesos.
+import os
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import numpy as np
+
+from vida import regla_vida
+
+
+def _franjas(N: int, partes: int):
+    """Divide las filas 0..N-1 en `partes` franjas contiguas (inicio, fin)."""
+    limites = np.linspace(0, N, partes + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:])]
+
+
+def _paso_franja(fuente: np.ndarray, destino: np.ndarray, i0: int, i1: int,
+                 regla: str, vecindad: str, frontera: str) -> None:
+    """Calcula las filas [i0, i1) de la siguiente generación usando un halo de una fila."""
+    N = fuente.shape[0]
+    if frontera == "periodica":
+        filas = np.arange(i0 - 1, i1 + 1) % N
+        bloque = fuente[filas]
+    else:
+        bloque = np.zeros((i1 - i0 + 2, fuente.shape[1]), dtype=np.uint8)
+        a, b = max(i0 - 1, 0), min(i1 + 1, N)
+        bloque[a - (i0 - 1): b - (i0 - 1)] = fuente[a:b]
+    # Las filas del halo se descartan, así que la frontera vertical del bloque
+    # no afecta el resultado; la horizontal sí es la del tablero completo.
+    destino[i0:i1] = regla_vida(bloque, regla, vecindad, frontera)[1:-1]
+
+
+def _trabajador(nombres, forma, i0, i1, pasos, regla, vecindad, frontera, barrera):
+    bloques = [shared_memory.SharedMemory(name=n) for n in nombres]
+    tableros = [np.ndarray(forma, dtype=np.uint8, buffer=b.buf) for b in bloques]
+    for t in range(pasos):
+        _paso_franja(tableros[t % 2], tableros[(t + 1) % 2], i0, i1,
+                     regla, vecindad, frontera)
+        barrera.wait()
+    del tableros
+    for b in bloques:
+        b.close()
+
+
+def evolucion_paralela(estado_inicial: np.ndarray, pasos: int, n_procesos: int = None,
+                       regla: str = "B3/S23", vecindad: str = "Moore",
+                       frontera: str = "periodica") -> np.ndarray:
+    """
+    Avanza `pasos` generaciones repartiendo el tablero en franjas entre procesos.
+
+    El resultado es idéntico al de aplicar `regla_vida` `pasos` veces en serie.
+    Sólo se regresa el último estado: para tableros de decenas de millones de
+    celdas la trayectoria completa no cabría en memoria. Si un proceso
+    falla, la barrera se aborta para liberar a los demás y se lanza
+    RuntimeError; la memoria compartida se libera en cualquier caso.
+
+    Parámetros
+    ----------
+    estado_inicial : np.ndarray
+        Tablero binario (N, M).
+    pasos : int
+        Número de generaciones.
+    n_procesos : int | None
+        Número de procesos (None = todos los núcleos).
+    regla, vecindad, frontera : str
+        Igual que en `regla_vida`.
+
+    Regresa
+    -------
+    np.ndarray
+        Tablero (N, M) de uint8 tras `pasos` generaciones.
+    """
+    x = np.asarray(estado_inicial, dtype=np.uint8)
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    n_procesos = max(1, min(n_procesos, x.shape[0]))
+
+    bloques, procesos = [], []
+    try:
+        for _ in range(2):
+            bloques.append(shared_memory.SharedMemory(create=True, size=x.nbytes))
+        np.ndarray(x.shape, dtype=np.uint8, buffer=bloques[0].buf)[:] = x
+        barrera = mp.Barrier(n_procesos)
+        for i0, i1 in _franjas(x.shape[0], n_procesos):
+            p = mp.Process(target=_trabajador,
+                           args=([b.name for b in bloques], x.shape, i0, i1, pasos,
+                                 regla, vecindad, frontera, barrera))
+            p.start()
+            procesos.append(p)
+        pendientes = {p.sentinel: p for p in procesos}
+        while pendientes:
+            for listo in wait(list(pendientes)):
+                p = pendientes.pop(listo)
+                p.join()
+                if p.exitcode != 0:
+                    # Sin esto los demás procesos esperarían para siempre en la
+                    # barrera; con abort() reciben BrokenBarrierError y terminan.
+                    barrera.abort()
+        if any(p.exitcode != 0 for p in procesos):
+            raise RuntimeError("Algún proceso de `evolucion_paralela` terminó con error.")
+        final = np.ndarray(x.shape, dtype=np.uint8, buffer=bloques[pasos % 2].buf).copy()
+    finally:
+        # También si el proceso principal se interrumpe (p. ej. Ctrl+C): no
+        # deben quedar trabajadores vivos ni bloques de memoria sin liberar.
+        for p in procesos:
+            if p.is_alive():
+                p.terminate()
+            p.join()
+        for b in bloques:
+            b.close()
+            b.unlink()
+    return final
+
+
+# =============================================================================
+# Verificación y escalamiento
+# =============================================================================
+def verificar_paralela(N: int = 97, M: int = 83, pasos: int = 20, n_procesos: int = 3,
+                       semilla: int = 0) -> bool:
+    """Comprueba que la versión paralela coincide con `regla_vida` en serie."""
+    rng = np.random.default_rng(semilla)
+    x0 = (rng.random((N, M)) < 0.3).astype(np.uint8)
+    for frontera in ("periodica", "abierta"):
+        x = x0
+        for _ in range(pasos):
+            x = regla_vida(x, frontera=frontera).astype(np.uint8)
+        y = evolucion_paralela(x0, pasos, n_procesos, frontera=frontera)
+        assert np.array_equal(x, y), f"No coincide con frontera {frontera}."
+    return True
+
+
+def escalamiento(N: int = 4000, pasos: int = 20, procesos=None) -> dict:
+    """
+    Mide el tiempo de `evolucion_paralela` en un tablero N x N con 1, 2, ...
+    procesos e imprime la aceleración respecto a un solo proceso.
+
+    Regresa
+    -------
+    dict
+        {n_procesos: segundos}
+    """
+    if procesos is None:
+        total = os.cpu_count() or 1
+        procesos = sorted({1, *[2**k for k in range(1, total.bit_length()) if 2**k <= total], total})
+    x0 = (np.random.rand(N, N) < 0.3).astype(np.uint8)
+    tiempos = {}
+    for p in procesos:
+        inicio = time.perf_counter()
+        evolucion_paralela(x0, pasos, p)
+        tiempos[p] = time.perf_counter() - inicio
+        print(f"{p:3d} procesos: {tiempos[p]:.3f} s  (x{tiempos[procesos[0]] / tiempos[p]:.2f})")
+    return tiempos
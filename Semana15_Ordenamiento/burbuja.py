@@ -0,0 +1,369 @@
+# Trazas de Bubble Sort (Clase 29) y visualizacion con slider
+import json
+from typing import List, Dict, Any
+import numpy as np
+
+def bubble_sort_trace(a: List[int], early_stop: bool = True, diferencial: bool = False, cada: int = None):
+    """
+    Ejecuta Bubble Sort sobre una copia de 'a' registrando cuadros (frames) de evolucion.
+    Cada frame es un diccionario con:
+      - 'arr': copia del arreglo en ese momento
+      - 'i': indice de la pasada externa (0..)
+      - 'j': indice actual de comparacion (puede ser None al inicio de una pasada)
+      - 'action': 'start', 'compare', o 'swap'
+      - 'n': longitud del arreglo
+    Con diferencial=True regresa una `TrazaBurbuja`: guarda solo los eventos
+    (action, i, j) y copias del arreglo cada ~`cada` eventos, y da los mismos
+    frames al indexarla. Sirve para arreglos de miles de elementos.
+    """
+    if diferencial:
+        return TrazaBurbuja(a, early_stop=early_stop, cada=cada)
+    arr = list(a)
+    n = len(arr)
+    frames: List[Dict[str, Any]] = []
+
+    # Frame inicial
+    frames.append({
+        "arr": arr.copy(),
+        "i": 0,
+        "j": None,
+        "action": "start",
+        "n": n
+    })
+
+    i = 0
+    for i in range(n - 1):
+        swapped_in_pass = False
+        # Marcamos inicio de la pasada i
+        frames.append({
+            "arr": arr.copy(),
+            "i": i,
+            "j": None,
+            "action": "start_pass",
+            "n": n
+        })
+        for j in range(n - 1 - i):
+            # Frame de comparacion j vs j+1
+            frames.append({
+                "arr": arr.copy(),
+                "i": i,
+                "j": j,
+                "action": "compare",
+                "n": n
+            })
+            if arr[j] > arr[j+1]:
+                arr[j], arr[j+1] = arr[j+1], arr[j]
+                swapped_in_pass = True
+                # Frame despues del swap
+                frames.append({
+                    "arr": arr.copy(),
+                    "i": i,
+                    "j": j,
+                    "action": "swap",
+                    "n": n
+                })
+        if early_stop and not swapped_in_pass:
+            # Si no hubo swaps en una pasada, el arreglo ya esta ordenado
+            break
+
+    # Frame final
+    frames.append({
+        "arr": arr.copy(),
+        "i": i,
+        "j": None,
+        "action": "end",
+        "n": n
+    })
+    return frames
+
+# Registro de eventos con puntos de control
+ACCIONES = ("start", "start_pass", "compare", "swap", "end")
+_START, _START_PASS, _COMPARE, _SWAP, _END = range(len(ACCIONES))
+
+class TrazaBurbuja:
+    """
+    Trazas de Bubble Sort como registro de eventos.
+
+    Por cada frame se guarda la accion (1 byte) y j (entero sin signo, con
+    el maximo como None); i se obtiene del inicio de cada pasada. Ademas se
+    guarda una copia del arreglo al inicio de la primera pasada que empieza
+    despues de cada `cada` eventos, asi que `traza[paso]` repite a lo mas
+    ~`cada` + n eventos desde la copia anterior (o desde el ultimo frame
+    pedido, si esta mas cerca, como al avanzar con el slider).
+
+    Los valores originales se guardan una vez, ordenados de forma estable;
+    la traza trabaja con la posicion de cada elemento en ese orden (enteros
+    0..n-1 sin empates). Como Bubble Sort solo intercambia si arr[j] > arr[j+1],
+    nunca cruza elementos iguales, asi que comparar esas posiciones da los
+    mismos intercambios que comparar los valores, y los frames traen los
+    mismos objetos que la version con listas (p. ej. 2 sigue siendo int).
+
+    Las pasadas se calculan con NumPy: en la pasada, la posicion j recibe
+    min(max(arr[:j+1]), arr[j+1]), la ultima recibe el maximo y hay
+    intercambio en j si max(arr[:j+1]) > arr[j+1].
+    """
+    def __init__(self, a, early_stop: bool = True, cada: int = None):
+        a = list(a)
+        n = len(a)
+        orden = sorted(range(n), key=a.__getitem__)
+        self._valores = [a[k] for k in orden]
+        arr = np.empty(n, dtype=np.int32 if n < 2**31 else np.int64)
+        arr[orden] = np.arange(n)
+        self.n = n
+        self.cada = cada if cada is not None else max(1024, 16 * n)
+        tipo_j = np.uint16 if n < np.iinfo(np.uint16).max else np.uint32
+        self._sin_j = np.iinfo(tipo_j).max
+        acciones = [np.array([_START], dtype=np.uint8)]
+        sin_j = np.array([self._sin_j], dtype=tipo_j)
+        js = [sin_j]
+        self._inicios = []                       # frame donde empieza cada pasada
+        self._claves = [0]                       # frames con copia del arreglo
+        self._arreglos = [arr.copy()]
+        total, ultima_clave = 1, 0
+        for i in range(n - 1):
+            if total - ultima_clave >= self.cada:
+                self._claves.append(total); self._arreglos.append(arr.copy())
+                ultima_clave = total
+            self._inicios.append(total)
+            m = n - 1 - i
+            acarreo = np.maximum.accumulate(arr[:m])
+            swap = acarreo > arr[1:m + 1]
+            ultimo = max(acarreo[-1], arr[m])
+            arr[:m] = np.minimum(acarreo, arr[1:m + 1])
+            arr[m] = ultimo
+            # Por cada j: 'compare' y, si hubo intercambio, 'swap'.
+            por_j = 1 + swap.astype(np.int64)
+            bloque = np.full(int(por_j.sum()) + 1, _COMPARE, dtype=np.uint8)
+            bloque[0] = _START_PASS
+            bloque[np.cumsum(por_j)[swap]] = _SWAP
+            acciones.append(bloque)
+            js.append(np.concatenate((sin_j, np.repeat(np.arange(m, dtype=tipo_j), por_j))))
+            total += len(bloque)
+            if early_stop and not swap.any():
+                break
+        acciones.append(np.array([_END], dtype=np.uint8))
+        js.append(sin_j)
+        self._acciones = np.concatenate(acciones)
+        self._j = np.concatenate(js)
+        self._inicios = np.array(self._inicios, dtype=np.int64)
+        self._claves = np.array(self._claves, dtype=np.int64)
+        self._cursor = None                      # (paso, arreglo) del ultimo frame pedido
+
+    def __len__(self):
+        return len(self._acciones)
+
+    def __iter__(self):
+        for paso in range(len(self)):
+            yield self[paso]
+
+    def _i(self, paso: int) -> int:
+        if self._acciones[paso] == _START or len(self._inicios) == 0:
+            return 0
+        return int(np.searchsorted(self._inicios, paso, side="right")) - 1
+
+    def _arreglo(self, paso: int) -> np.ndarray:
+        c = int(np.searchsorted(self._claves, paso, side="right")) - 1
+        desde, arr = int(self._claves[c]), self._arreglos[c]
+        if self._cursor is not None and desde <= self._cursor[0] <= paso:
+            desde, arr = self._cursor
+        arr = arr.copy()
+        tramo = slice(desde + 1, paso + 1)
+        for j in self._j[tramo][self._acciones[tramo] == _SWAP].tolist():
+            arr[j], arr[j+1] = arr[j+1], arr[j]
+        self._cursor = (paso, arr)
+        return arr
+
+    def __getitem__(self, paso: int) -> Dict[str, Any]:
+        if paso < 0:
+            paso += len(self)
+        if not 0 <= paso < len(self):
+            raise IndexError("paso fuera de rango")
+        j = int(self._j[paso])
+        return {
+            "arr": [self._valores[k] for k in self._arreglo(paso).tolist()],
+            "i": self._i(paso),
+            "j": None if j == self._sin_j else j,
+            "action": ACCIONES[self._acciones[paso]],
+            "n": self.n
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return (self._acciones.nbytes + self._j.nbytes + self._inicios.nbytes
+                + self._claves.nbytes + sum(a.nbytes for a in self._arreglos))
+
+    def guardar(self, ruta: str):
+        """
+        Guarda la traza en un archivo binario .npz comprimido. Los valores van
+        como texto JSON (sin pickle), asi que deben ser numeros o cadenas.
+        """
+        if not all(isinstance(v, (int, float, str)) for v in self._valores):
+            raise TypeError("Solo se pueden guardar trazas de numeros o cadenas.")
+        valores = json.dumps(self._valores)
+        np.savez_compressed(ruta, n=self.n, cada=self.cada, acciones=self._acciones, j=self._j,
+                            inicios=self._inicios, claves=self._claves,
+                            arreglos=np.stack(self._arreglos), valores=np.array(valores))
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "TrazaBurbuja":
+        traza = cls.__new__(cls)
+        with np.load(ruta) as datos:
+            traza.n = int(datos["n"]); traza.cada = int(datos["cada"])
+            traza._acciones = datos["acciones"]; traza._j = datos["j"]
+            traza._sin_j = np.iinfo(traza._j.dtype).max
+            traza._inicios = datos["inicios"]; traza._claves = datos["claves"]
+            traza._arreglos = list(datos["arreglos"])
+            traza._valores = json.loads(str(datos["valores"]))
+        traza._cursor = None
+        return traza
+
+# Visualizacion interactiva
+import matplotlib.pyplot as plt
+from ipywidgets import VBox, HBox, IntSlider, Button, Layout, Text, Checkbox, Output
+
+# Nota: El entorno requiere ipywidgets para interactividad.
+# Se utilizan colores para resaltar:
+# - 'orange' para los elementos comparados (j y j+1)
+# - 'red' para los elementos que se acaban de intercambiar
+# - 'green' para la cola ya ordenada al final del arreglo
+# - 'lightgray' para el resto
+
+def plot_frame(frame, total_frames):
+    arr = frame["arr"]
+    i = frame["i"]
+    j = frame["j"]
+    action = frame["action"]
+    n = frame["n"]
+
+    # Determinar indices resaltados y segmento ordenado
+    compare_pair = (j, j+1) if j is not None and j+1 < n else None
+    # Ajuste: durante la pasada i (0-indexada), al terminar, los ultimos i+1 quedan fijos;
+    # mientras comparamos, marcamos como "ordenados" los ultimos i elementos.
+    if action in ("compare", "swap", "start_pass"):
+        sorted_tail_start = n - i
+    else:
+        sorted_tail_start = n - (i + 1 if i is not None else 0)
+    sorted_tail_start = max(0, sorted_tail_start)
+
+    colors = ["lightgray"] * n
+    # Marcar segmento ya ordenado
+    for idx in range(sorted_tail_start, n):
+        colors[idx] = "green"
+    # Marcar comparacion
+    if compare_pair is not None:
+        cj, ck = compare_pair
+        if 0 <= cj < n:
+            colors[cj] = "orange"
+        if 0 <= ck < n:
+            colors[ck] = "orange"
+        if action == "swap":
+            # En swap, pintamos de rojo para enfatizar
+            if 0 <= cj < n:
+                colors[cj] = "red"
+            if 0 <= ck < n:
+                colors[ck] = "red"
+
+    # Graficar
+    fig, ax = plt.subplots(figsize=(8, 4))
+    xs = np.arange(n)
+    bars = ax.bar(xs, arr, align="center")
+    for idx, b in enumerate(bars):
+        b.set_color(colors[idx])
+        # Poner el valor encima de la barra
+        ax.text(b.get_x() + b.get_width()/2.0, b.get_height() + max(arr)*0.03 if n>0 else 0.3,
+                str(arr[idx]), ha="center", va="bottom", fontsize=10)
+        # Etiquetas bajo cada barra con indices de variables
+        under = []
+        if j is not None:
+            if idx == j:
+                under.append("j")
+            if idx == j + 1:
+                under.append("j+1")
+        # Unimos etiquetas bajo la barra
+        under_label = ",".join(under)
+        ax.text(b.get_x() + b.get_width()/2.0, - (max(arr)*0.08 if n>0 else 0.2),
+                under_label, ha="center", va="top", fontsize=10)
+
+    ax.set_xticks(xs)
+    ax.set_xticklabels([str(k) for k in xs])
+    ax.set_ylim(-(max(arr)*0.12 if n>0 else 0.3), (max(arr)*1.25 if n>0 else 1.0))
+    ax.set_xlabel("indice")
+    ax.set_ylabel("valor")
+    ax.grid(True, axis="y", alpha=0.3)
+    plt.show()
+
+# Widgets globales
+array_text = Text(
+    value="5, 1, 4, 2, 8",
+    placeholder="Ej: 5, 1, 4, 2, 8",
+    description="Arreglo:",
+    layout=Layout(width="400px")
+)
+
+randomize_btn = Button(description="Arreglo aleatorio", button_style="")
+rebuild_btn   = Button(description="Construir trazas", button_style="success")
+next_btn      = Button(description="Siguiente", button_style="")
+prev_btn      = Button(description="Anterior", button_style="")
+early_stop_cb = Checkbox(value=True, description="Parada temprana (mejor caso O(n))")
+
+current_step = IntSlider(value=0, min=0, max=0, step=1, description="Paso:")
+out = Output()
+
+# Estado
+_frames = []
+
+def parse_array(txt):
+    try:
+        items = [int(x.strip()) for x in txt.split(",") if x.strip() != ""]
+        if len(items) == 0:
+            raise ValueError("El arreglo no puede ser vacio")
+        return items
+    except Exception as e:
+        raise ValueError("Entrada invalida. Usa enteros separados por coma.") from e
+
+def on_randomize(_):
+    # Genera un arreglo aleatorio de tamano 8 con valores 1..20
+    rng = np.random.default_rng()
+    arr = list(rng.integers(1, 21, size=8))
+    array_text.value = ", ".join(str(v) for v in arr)
+
+def rebuild_frames(_=None):
+    global _frames
+    try:
+        arr = parse_array(array_text.value)
+    except Exception as e:
+        with out:
+            out.clear_output()
+            print("Error:", e)
+        return
+    _frames = bubble_sort_trace(arr, early_stop=early_stop_cb.value, diferencial=True)
+    current_step.max = max(0, len(_frames) - 1)
+    current_step.value = 0
+    redraw()
+
+def redraw(*_):
+    if not _frames:
+        with out:
+            out.clear_output()
+            print("Sin trazas. Da clic en 'Construir trazas'.")
+        return
+    step = current_step.value
+    frame = _frames[step]
+    with out:
+        out.clear_output()
+        plot_frame(frame, total_frames=len(_frames))
+
+def on_next(_):
+    if current_step.value < current_step.max:
+        current_step.value += 1
+
+def on_prev(_):
+    if current_step.value > current_step.min:
+        current_step.value -= 1
+
+randomize_btn.on_click(on_randomize)
+rebuild_btn.on_click(rebuild_frames)
+next_btn.on_click(on_next)
+prev_btn.on_click(on_prev)
+current_step.observe(redraw, names="value")
+early_stop_cb.observe(rebuild_frames, names="value")
@@ -9,14 +9,103 @@ class Node:
         self.arr = list(arr); self.color = color; self.parent_id = parent_id
         self.x = (l + (r-1)) / 2.0
 
-def merge_sort_trace(arr: List[int]) -> List[Dict[str, Any]]:
+class TrazaMergeSort:
+    """
+    Trazas de `merge_sort_trace` guardadas como cambios por evento.
+
+    Cada paso guarda solo lo que cambio (nodo creado, color cambiado, arreglo
+    mezclado) y cuantas aristas hay; los frames se reconstruyen al pedirlos
+    con `traza[paso]`, a partir del frame clave anterior (cada `cada_clave`
+    pasos). Los frames clave guardan referencias a los arreglos de los nodos,
+    que nunca se modifican en su lugar, asi que no copian los datos.
+    Se usa igual que la lista de frames: len(traza), traza[paso], for ...
+    """
+    def __init__(self, n: int, cada_clave: int = 64):
+        self.n = n
+        self.cada_clave = max(1, cada_clave)
+        self._cambios: List[List[tuple]] = []
+        self._captions: List[str] = []
+        self._n_aristas: List[int] = []
+        self._aristas: List[Tuple[int, int]] = []
+        self._claves: Dict[int, Dict[int, tuple]] = {}
+        self._estado: Dict[int, tuple] = {}      # id -> (x, nivel, arr, color) al final de la traza
+        self._cursor = None                      # (paso, estado) del ultimo frame reconstruido
+
+    def _agregar(self, caption: str, cambios: List[tuple], aristas: List[Tuple[int, int]]):
+        paso = len(self._captions)
+        self._captions.append(caption)
+        self._cambios.append(list(cambios))
+        self._aristas.extend(aristas[len(self._aristas):])
+        self._n_aristas.append(len(aristas))
+        self._aplicar(self._estado, cambios)
+        if paso % self.cada_clave == 0:
+            self._claves[paso] = dict(self._estado)
+
+    @staticmethod
+    def _aplicar(estado: Dict[int, tuple], cambios: List[tuple]):
+        for cambio in cambios:
+            tipo, nid = cambio[0], cambio[1]
+            if tipo == "nodo":
+                estado[nid] = cambio[2:]
+            elif tipo == "color":
+                x, y, arr, _ = estado[nid]
+                estado[nid] = (x, y, arr, cambio[2])
+            else:  # "arr"
+                x, y, _, color = estado[nid]
+                estado[nid] = (x, y, cambio[2], color)
+
+    def __len__(self):
+        return len(self._captions)
+
+    def __iter__(self):
+        for paso in range(len(self)):
+            yield self[paso]
+
+    def __getitem__(self, paso: int) -> Dict[str, Any]:
+        if paso < 0:
+            paso += len(self)
+        if not 0 <= paso < len(self):
+            raise IndexError("paso fuera de rango")
+        clave = paso - paso % self.cada_clave
+        if self._cursor is not None and clave <= self._cursor[0] <= paso:
+            desde, estado = self._cursor[0], dict(self._cursor[1])
+        else:
+            desde, estado = clave, dict(self._claves[clave])
+        for t in range(desde + 1, paso + 1):
+            self._aplicar(estado, self._cambios[t])
+        self._cursor = (paso, estado)
+        orden = sorted(estado.items(), key=lambda e: (e[1][1], e[1][0]))
+        return {
+            "nodes": [{"id": nid, "x": x, "y": y, "arr": list(arr), "color": color}
+                      for nid, (x, y, arr, color) in orden],
+            "edges": self._aristas[:self._n_aristas[paso]],
+            "caption": self._captions[paso],
+            "n": self.n,
+            "max_level": max((y for (_, y, _, _) in estado.values()), default=0)
+        }
+
+def merge_sort_trace(arr: List[int], diferencial: bool = False, cada_clave: int = 64):
+    """
+    Trazas del arbol de Merge Sort, un frame por evento.
+
+    Con diferencial=False regresa la lista de frames (cada uno copia todos los
+    nodos, memoria ~ O(n^2 log n)). Con diferencial=True regresa una
+    `TrazaMergeSort`, que guarda solo los cambios de cada evento y da los
+    mismos frames al indexarla; sirve para arreglos de cientos de elementos.
+    """
     Node._next_id = 0
     n = len(arr)
     frames: List[Dict[str, Any]] = []
     nodes: Dict[int, Node] = {}
     edges: List[Tuple[int, int]] = []
+    traza = TrazaMergeSort(n, cada_clave) if diferencial else None
+    cambios: List[tuple] = []
     
     def snapshot(caption: str):
+        if diferencial:
+            traza._agregar(caption, cambios, edges)
+            cambios.clear()
+            return
         frames.append({
             "nodes": [
                 {"id": nd.id, "x": nd.x, "y": nd.level, "arr": list(nd.arr), "color": nd.color}
@@ -34,10 +123,12 @@ def merge_sort_trace(arr: List[int]) -> List[Dict[str, Any]]:
         nodes[nd.id] = nd
         if parent_id is not None:
             edges.append((parent_id, nd.id))
+        cambios.append(("nodo", nd.id, nd.x, nd.level, nd.arr, nd.color))
         snapshot(f"crear nodo [{l}:{r})")
         
         if r - l <= 1:
             nd.color = "seagreen"
+            cambios.append(("color", nd.id, nd.color))
             snapshot(f"hoja ordenada [{l}:{r})")
             return nd.id
         
@@ -57,12 +148,14 @@ def merge_sort_trace(arr: List[int]) -> List[Dict[str, Any]]:
         
         nd.arr = merged
         nd.color = "seagreen"
+        cambios.append(("arr", nd.id, nd.arr))
+        cambios.append(("color", nd.id, nd.color))
         snapshot(f"mezclar [{l}:{mid}) y [{mid}:{r}) -> [{l}:{r})")
         return nd.id
     
     dfs(0, n, 0, None, "root")
     snapshot("resultado final ordenado")
-    return frames
+    return traza if diferencial else frames
 
 # Visualizacion interactiva
 import numpy as np
@@ -123,7 +216,7 @@ def rebuild_frames(_=None):
     except Exception as e:
         with out:
             out.clear_output(); print("Error:", e); return
-    _frames = merge_sort_trace(arr)
+    _frames = merge_sort_trace(arr, diferencial=True)
     current_step.max = max(0, len(_frames) - 1); current_step.value = 0; redraw()
 
 def redraw(*_):
@@ -162,7 +255,37 @@ def parse_array(txt):
         return []
     return [int(x.strip()) for x in txt.split(",") if x.strip() != ""]
 
-def construir_trazas_merge(A, B):
+class TrazaMerge:
+    """
+    Trazas de `construir_trazas_merge` guardadas como cambios por paso.
+
+    Solo se guardan (accion, i, j, k) de cada paso y el arreglo C final: en
+    el paso t, C tiene llenas sus primeras k casillas, que coinciden con las
+    de C final. Cada frame se reconstruye en O(m + n) al pedirlo con
+    `traza[paso]`, sin necesidad de frames clave.
+    """
+    def __init__(self, A, B):
+        self.A = list(A); self.B = list(B)
+        self.m, self.n = len(self.A), len(self.B)
+        self.C = [None] * (self.m + self.n)
+        self._pasos = []
+
+    def __len__(self):
+        return len(self._pasos)
+
+    def __iter__(self):
+        for paso in range(len(self)):
+            yield self[paso]
+
+    def __getitem__(self, paso):
+        accion, i, j, k = self._pasos[paso]
+        return {
+            "A": self.A[:], "B": self.B[:], "C": self.C[:k] + [None] * (len(self.C) - k),
+            "i": i, "j": j, "k": k, "accion": accion,
+            "m": self.m, "n": self.n
+        }
+
+def construir_trazas_merge(A, B, diferencial=False):
     """
     Devuelve una lista de 'frames' para animar el merge paso a paso.
     Cada frame es un dict con:
@@ -170,14 +293,22 @@ def construir_trazas_merge(A, B):
       - C: lista con None en posiciones aún vacías
       - i, j, k: índices (pueden estar en los límites)
       - accion: 'start' | 'compare' | 'take_A' | 'take_B' | 'copy_A' | 'copy_B' | 'done'
+    Con diferencial=True regresa una `TrazaMerge`, que se indexa igual que la
+    lista pero guarda solo los índices de cada paso.
     """
     A = list(A); B = list(B)
     m, n = len(A), len(B)
     C = [None] * (m + n)
     i = j = k = 0
     frames = []
+    traza = TrazaMerge(A, B) if diferencial else None
+    if diferencial:
+        C = traza.C
 
     def push(accion):
+        if diferencial:
+            traza._pasos.append((accion, i, j, k))
+            return
         frames.append({
             "A": A[:], "B": B[:], "C": C[:],
             "i": i, "j": j, "k": k, "accion": accion,
@@ -209,7 +340,7 @@ def construir_trazas_merge(A, B):
         push("copy_B")
 
     push("done")
-    return frames
+    return traza if diferencial else frames
 
 # -----------------------------
 # Dibujo
@@ -330,7 +461,7 @@ def construir(_=None):
             salida.clear_output()
             print("Error al parsear:", e)
         return
-    _frames = construir_trazas_merge(A, B)
+    _frames = construir_trazas_merge(A, B, diferencial=True)
     slider_paso.max = max(0, len(_frames) - 1)
     slider_paso.value = 0
     redibujar()
@@ -0,0 +1,302 @@
+# Merge Sort para uso real: iterativo, adaptativo y con ruta NumPy
+#
+# `merge_sort_iterativo` ordena de abajo hacia arriba sobre un solo buffer
+# auxiliar (sin crear sublistas en cada nivel), aprovecha las corridas ya
+# ordenadas de la entrada y es estable. `ordenar` elige la ruta de NumPy
+# para arreglos numericos. Al final hay un comparativo de tiempos contra la
+# version recursiva de la Clase 30 y contra `sorted()`.
+import time
+import random
+from bisect import bisect_right
+import numpy as np
+import matplotlib.pyplot as plt
+
+MINRUN = 32
+
+# -----------------------------
+# Corridas naturales
+# -----------------------------
+def _corridas(a: list, minrun: int = MINRUN) -> list:
+    """
+    Divide `a` (en su lugar) en corridas ordenadas y regresa sus fronteras
+    [0, b1, b2, ..., n].
+
+    Una corrida es un tramo no decreciente, o estrictamente decreciente (que
+    se invierte; al ser estricto no se altera el orden de elementos iguales).
+    Las corridas de menos de `minrun` elementos se extienden con insercion
+    binaria, que tambien es estable.
+    """
+    n = len(a)
+    fronteras = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and a[j] < a[j-1]:
+            while j < n and a[j] < a[j-1]:
+                j += 1
+            a[i:j] = a[i:j][::-1]
+        else:
+            while j < n and not a[j] < a[j-1]:
+                j += 1
+        fin = min(i + minrun, n)
+        while j < fin:
+            x = a[j]
+            pos = bisect_right(a, x, i, j)
+            a[pos+1:j+1] = a[pos:j]
+            a[pos] = x
+            j += 1
+        fronteras.append(j)
+        i = j
+    return fronteras
+
+def _mezclar(src: list, dst: list, lo: int, mid: int, hi: int):
+    """Mezcla estable de src[lo:mid] y src[mid:hi] en dst[lo:hi]."""
+    if not src[mid] < src[mid-1]:
+        dst[lo:hi] = src[lo:hi]       # ya estan en orden
+        return
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]; j += 1
+        else:
+            dst[k] = src[i]; i += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+def _merge_sort_lista(a: list, minrun: int = MINRUN) -> list:
+    """Ordena la lista `a` en su lugar y la regresa."""
+    if len(a) < 2:
+        return a
+    fronteras = _corridas(a, minrun)
+    src, dst = a, [None] * len(a)
+    while len(fronteras) > 2:
+        nuevas = [0]
+        for t in range(0, len(fronteras) - 2, 2):
+            _mezclar(src, dst, fronteras[t], fronteras[t+1], fronteras[t+2])
+            nuevas.append(fronteras[t+2])
+        if len(fronteras) % 2 == 0:       # numero impar de corridas: la ultima pasa igual
+            dst[fronteras[-2]:] = src[fronteras[-2]:]
+            nuevas.append(fronteras[-1])
+        fronteras = nuevas
+        src, dst = dst, src
+    if src is not a:
+        a[:] = src
+    return a
+
+def merge_sort_iterativo(arr, key=None, reverse: bool = False, minrun: int = MINRUN) -> list:
+    """
+    Ordena y regresa una nueva lista con Merge Sort de abajo hacia arriba.
+
+    Parametros
+    ----------
+    arr : iterable
+        Elementos a ordenar (no se modifica).
+    key : callable | None
+        Funcion que da la clave de comparacion, como en `sorted()`. Se evalua
+        una vez por elemento.
+    reverse : bool
+        Orden descendente. Igual que en `sorted()`, los elementos con claves
+        iguales conservan su orden original.
+    minrun : int
+        Longitud minima de las corridas iniciales (se completan con insercion).
+
+    Regresa
+    -------
+    list
+        Los elementos ordenados. El ordenamiento es estable y toma tiempo
+        O(n) si la entrada ya esta ordenada (o en orden inverso estricto) y
+        O(n log n) en general.
+    """
+    a = list(arr)
+    if reverse:
+        # Ordenar la entrada invertida y volver a invertir mantiene la estabilidad.
+        a.reverse()
+    if key is None:
+        _merge_sort_lista(a, minrun)
+    else:
+        # Se ordenan pares (clave, posicion): las posiciones desempatan, asi
+        # que nunca se comparan los elementos mismos.
+        pares = [(key(x), i) for i, x in enumerate(a)]
+        _merge_sort_lista(pares, minrun)
+        a = [a[i] for _, i in pares]
+    if reverse:
+        a.reverse()
+    return a
+
+# -----------------------------
+# Ruta NumPy
+# -----------------------------
+def _es_numerico(arr) -> bool:
+    return isinstance(arr, np.ndarray) and arr.ndim == 1 and _dtype_real(arr.dtype)
+
+def _dtype_real(dtype) -> bool:
+    """Tipos que NumPy ordena igual que Python: enteros, flotantes y booleanos."""
+    return (np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)
+            or dtype == bool)
+
+def _claves_numpy(claves: list):
+    """Arreglo 1D numerico con las claves, o None si no lo forman (tuplas, textos, ...)."""
+    try:
+        c = np.array(claves)
+    except ValueError:        # p. ej. tuplas de distinto largo
+        return None
+    return c if c.ndim == 1 and _dtype_real(c.dtype) else None
+
+def ordenar(arr, key=None, reverse: bool = False):
+    """
+    Ordena con la mejor ruta disponible.
+
+    - Arreglos NumPy numericos 1D: `np.sort` / `np.argsort` con kind="stable"
+      (radix sort para enteros pequenos, timsort para el resto). Regresa un
+      arreglo NumPy. Si `key` no da claves numericas escalares (p. ej.
+      tuplas), el orden se calcula con `merge_sort_iterativo` sobre las
+      posiciones y tambien se regresa un arreglo.
+    - Cualquier otra entrada: `merge_sort_iterativo`. Regresa una lista.
+
+    En ambos casos el resultado es estable y `key`/`reverse` funcionan como
+    en `sorted()`.
+    """
+    if not _es_numerico(arr):
+        return merge_sort_iterativo(arr, key=key, reverse=reverse)
+    if key is None and not reverse:
+        return np.sort(arr, kind="stable")
+    if key is None:
+        claves = arr
+    else:
+        lista = [key(x) for x in arr]
+        claves = _claves_numpy(lista)
+        if claves is None:
+            orden = merge_sort_iterativo(range(len(arr)), key=lista.__getitem__, reverse=reverse)
+            return arr[np.array(orden, dtype=np.intp)]
+    if reverse:
+        # Estable descendente: ordenar la entrada invertida y voltear el resultado.
+        orden = np.argsort(claves[::-1], kind="stable")[::-1]
+        return arr[::-1][orden]
+    return arr[np.argsort(claves, kind="stable")]
+
+# -----------------------------
+# Version recursiva (Clase 30)
+# -----------------------------
+def merge_contador(left, right):
+    i = j = 0
+    resultado = []
+    operaciones = 0
+
+    while i < len(left) and j < len(right):
+        operaciones += 1  # comparación
+        if left[i] <= right[j]:
+            resultado.append(left[i])
+            i += 1
+        else:
+            resultado.append(right[j])
+            j += 1
+
+    resultado.extend(left[i:])
+    resultado.extend(right[j:])
+
+    return resultado, operaciones
+
+def merge_sort_contador(arr):
+    if len(arr) <= 1:
+        return arr, 0
+
+    mid = len(arr) // 2
+    izquierda, op_i = merge_sort_contador(arr[:mid])
+    derecha, op_d = merge_sort_contador(arr[mid:])
+
+    combinado, op_m = merge_contador(izquierda, derecha)
+
+    return combinado, op_i + op_d + op_m
+
+# -----------------------------
+# Verificacion y comparativo
+# -----------------------------
+def generar_entrada(tipo: str, n: int, rng=None) -> list:
+    """Entradas de prueba: 'aleatorio', 'ordenado', 'invertido' o 'pocos_unicos'."""
+    rng = rng or random.Random(0)
+    if tipo == "aleatorio":
+        return [rng.randint(0, 10**6) for _ in range(n)]
+    if tipo == "ordenado":
+        return list(range(n))
+    if tipo == "invertido":
+        return list(range(n, 0, -1))
+    if tipo == "pocos_unicos":
+        return [rng.randint(0, 9) for _ in range(n)]
+    raise ValueError(f"Tipo de entrada desconocido: {tipo}")
+
+def verificar_ordenamiento(n: int = 2000) -> bool:
+    """Comprueba que `merge_sort_iterativo` y `ordenar` coinciden con `sorted()`, incluida la estabilidad."""
+    rng = random.Random(1)
+    for tipo in ("aleatorio", "ordenado", "invertido", "pocos_unicos"):
+        for m in (0, 1, 2, 31, 33, 100, n):
+            a = generar_entrada(tipo, m, rng)
+            assert merge_sort_iterativo(a) == sorted(a), (tipo, m)
+            assert merge_sort_iterativo(a, reverse=True) == sorted(a, reverse=True), (tipo, m)
+            # Estabilidad: pares (clave, posicion original) ordenados solo por la clave.
+            registros = [(x % 7, i) for i, x in enumerate(a)]
+            for reverse in (False, True):
+                esperado = sorted(registros, key=lambda r: r[0], reverse=reverse)
+                assert merge_sort_iterativo(registros, key=lambda r: r[0], reverse=reverse) == esperado
+            v = np.array(a, dtype=np.int64)
+            assert ordenar(v).tolist() == sorted(a)
+            assert ordenar(v, reverse=True).tolist() == sorted(a, reverse=True)
+            assert ordenar(v, key=lambda x: x % 7).tolist() == sorted(a, key=lambda x: x % 7)
+            assert ordenar(v, key=lambda x: x % 7, reverse=True).tolist() == \
+                sorted(a, key=lambda x: x % 7, reverse=True)
+            # Claves que no son escalares numericos: tuplas y textos.
+            for clave in (lambda x: (x % 2, x % 5), lambda x: str(x % 13)):
+                for reverse in (False, True):
+                    r = ordenar(v, key=clave, reverse=reverse)
+                    assert r.ndim == 1 and r.tolist() == sorted(a, key=clave, reverse=reverse)
+    return True
+
+def comparar_ordenamientos(ns=(1000, 10000, 100000),
+                           tipos=("aleatorio", "ordenado", "invertido", "pocos_unicos"),
+                           repeticiones: int = 3) -> dict:
+    """
+    Mide el mejor tiempo (s) de cada metodo para cada tipo de entrada y tamano.
+
+    Metodos: 'recursivo' (`merge_sort_contador`), 'iterativo'
+    (`merge_sort_iterativo`), 'sorted' y 'numpy' (`ordenar` sobre un arreglo).
+
+    Regresa
+    -------
+    dict
+        {tipo: {metodo: lista de tiempos, uno por n}}.
+    """
+    metodos = {
+        "recursivo": lambda a, v: merge_sort_contador(a),
+        "iterativo": lambda a, v: merge_sort_iterativo(a),
+        "sorted": lambda a, v: sorted(a),
+        "numpy": lambda a, v: ordenar(v),
+    }
+    resultados = {tipo: {m: [] for m in metodos} for tipo in tipos}
+    for tipo in tipos:
+        for n in ns:
+            a = generar_entrada(tipo, n)
+            v = np.array(a)
+            for nombre, f in metodos.items():
+                mejor = np.inf
+                for _ in range(repeticiones):
+                    inicio = time.perf_counter()
+                    f(a, v)
+                    mejor = min(mejor, time.perf_counter() - inicio)
+                resultados[tipo][nombre].append(mejor)
+    return resultados
+
+def graficar_comparacion(resultados: dict, ns=(1000, 10000, 100000)):
+    """Un panel por tipo de entrada con el tiempo de cada metodo contra n (escala log-log)."""
+    fig, axs = plt.subplots(1, len(resultados), figsize=(4 * len(resultados), 4), sharey=True)
+    for ax, (tipo, tiempos) in zip(np.atleast_1d(axs), resultados.items()):
+        for nombre, ts in tiempos.items():
+            ax.loglog(ns, ts, marker="o", label=nombre)
+        ax.set_title(tipo)
+        ax.set_xlabel("n")
+        ax.grid(True, alpha=0.3)
+    np.atleast_1d(axs)[0].set_ylabel("Tiempo (s)")
+    np.atleast_1d(axs)[0].legend()
+    plt.tight_layout()
+    plt.show()
@@ -395,3 +395,189 @@ def generar_frames_traslado_luego_rotacion(
 
         fig.savefig(ruta_frame(carpeta_frames, i), dpi=120, bbox_inches="tight")
         plt.close(fig)
+
+
+# =============================================================================
+# Gráficas interactivas con figura persistente
+# =============================================================================
+# Las versiones de la Clase 16 crean una figura nueva en cada movimiento del
+# slider. Aquí la figura y sus objetos (líneas, círculo, superficie) se crean
+# una sola vez y el callback de `interact` sólo cambia sus datos y pide
+# redibujar con `fig.canvas.draw_idle()`. Para ver la actualización en el
+# lugar se necesita un backend interactivo (`%matplotlib widget`). `ipywidgets`
+# se importa dentro de cada función para que los GIF funcionen sin él.
+def elipse_interactiva_persistente(n: int = 400):
+    """
+    Elipse con sliders para a y b que actualiza una sola línea.
+
+    Parámetros
+    ----------
+    n : int
+        Número de muestras angulares de la curva.
+
+    Regresa
+    -------
+    El objeto de `interact` con los sliders.
+    """
+    from ipywidgets import interact, FloatSlider
+
+    t = np.linspace(0, 2*np.pi, n)
+    cos_t, sin_t = np.cos(t), np.sin(t)      # No dependen de a y b: se calculan una vez
+
+    fig, ax = plt.subplots(figsize=(5, 5))
+    linea, = ax.plot(cos_t, sin_t, lw=2)
+    ax.set_aspect("equal", adjustable="box")
+    ax.grid(True)
+
+    def actualizar(a=2.0, b=1.0):
+        if a <= 0 or b <= 0:
+            raise ValueError("Se requiere a > 0 y b > 0 para una elipse válida.")
+        linea.set_data(a * cos_t, b * sin_t)  # Sólo cambian los datos de la línea
+        m = max(a, b) * 1.1
+        ax.set_xlim(-m, m)
+        ax.set_ylim(-m, m)
+        ax.set_title(f"Elipse con a={a:.2f}, b={b:.2f}")
+        fig.canvas.draw_idle()
+
+    return interact(
+        actualizar,
+        a=FloatSlider(value=2.0, min=0.2, max=5.0, step=0.1, description='a'),
+        b=FloatSlider(value=1.0, min=0.2, max=5.0, step=0.1, description='b')
+    )
+
+
+def _reemplazar_superficie(ax, estado: dict, X, Y, Z, **opciones) -> None:
+    """
+    `plot_surface` no permite cambiar los datos de una superficie, así que se
+    quita la anterior y se dibuja la nueva sobre el mismo eje 3D.
+    """
+    if estado.get("superficie") is not None:
+        estado["superficie"].remove()
+    estado["superficie"] = ax.plot_surface(X, Y, Z, **opciones)
+
+
+def paraboloide_interactivo_persistente():
+    """
+    Paraboloide z = c_x x^2 + c_y y^2 con sliders, reutilizando la figura y el
+    eje 3D. La malla (X, Y) sólo se recalcula cuando cambian `rango` o `n`.
+
+    Regresa
+    -------
+    El objeto de `interact` con los sliders.
+    """
+    from ipywidgets import interact, FloatSlider, IntSlider
+
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.set_zlabel("z")
+    estado = {"superficie": None, "malla": None, "clave": None}
+
+    def actualizar(cx=1.0, cy=1.0, rango=2.0, n=50):
+        if estado["clave"] != (rango, n):
+            xs = np.linspace(-rango, rango, n)
+            estado["malla"] = np.meshgrid(xs, xs)
+            estado["clave"] = (rango, n)
+        X, Y = estado["malla"]
+        _reemplazar_superficie(ax, estado, X, Y, cx * X**2 + cy * Y**2,
+                               linewidth=0, antialiased=True, alpha=0.9)
+        ax.set_title(f"Paraboloide: z = {cx:.2f} x^2 + {cy:.2f} y^2")
+        fig.canvas.draw_idle()
+
+    return interact(
+        actualizar,
+        cx=FloatSlider(value=1.0, min=-2.0, max=2.0, step=0.1, description='c_x'),
+        cy=FloatSlider(value=1.0, min=-2.0, max=2.0, step=0.1, description='c_y'),
+        rango=FloatSlider(value=2.0, min=1.0, max=5.0, step=0.5, description='rango'),
+        n=IntSlider(value=50, min=20, max=120, step=5, description='resol.')
+    )
+
+
+def toroide_interactivo_persistente():
+    """
+    Toroide con sliders para (a, b, c) y la resolución (nu, nv), reutilizando
+    la figura y el eje 3D. Los senos y cosenos de la malla (u, v) sólo se
+    recalculan cuando cambia la resolución.
+
+    Regresa
+    -------
+    El objeto de `interact` con los sliders.
+    """
+    from ipywidgets import interact, FloatSlider, IntSlider
+
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.set_zlabel("z")
+    estado = {"superficie": None, "trig": None, "clave": None}
+
+    def actualizar(a=2.0, b=0.7, c=0.7, nu=60, nv=40):
+        if a <= 0:
+            raise ValueError("Se requiere a > 0 para un toroide válido.")
+        if estado["clave"] != (nu, nv):
+            U, V = np.meshgrid(np.linspace(0, 2*np.pi, nu), np.linspace(0, 2*np.pi, nv))
+            estado["trig"] = (np.cos(U), np.sin(U), np.cos(V), np.sin(V))
+            estado["clave"] = (nu, nv)
+        cu, su, cv, sv = estado["trig"]
+        X = (a + b*cv) * cu
+        Y = (a + b*cv) * su
+        Z = c * sv
+        _reemplazar_superficie(ax, estado, X, Y, Z, linewidth=0, antialiased=True, alpha=0.9)
+        ax.set_title(f"Toroide con a={a:.2f}, b={b:.2f}, c={c:.2f}")
+        R = a + max(abs(b), abs(c)) + 0.5
+        ax.set_xlim(-R, R)
+        ax.set_ylim(-R, R)
+        ax.set_zlim(-R, R)
+        fig.canvas.draw_idle()
+
+    return interact(
+        actualizar,
+        a=FloatSlider(value=2.0, min=0.5, max=4.0, step=0.1, description='a'),
+        b=FloatSlider(value=0.7, min=0.2, max=2.0, step=0.1, description='b'),
+        c=FloatSlider(value=0.7, min=0.2, max=2.0, step=0.1, description='c'),
+        nu=IntSlider(value=60, min=20, max=120, step=10, description='nu'),
+        nv=IntSlider(value=40, min=20, max=120, step=10, description='nv')
+    )
+
+
+def pendulo_interactivo_persistente():
+    """
+    Péndulo simple (aproximación de ángulo pequeño) con sliders para L, θ0,
+    ω0, g y t. Se mueven la cuerda y la masa existentes en lugar de redibujar.
+
+    Regresa
+    -------
+    El objeto de `interact` con los sliders.
+    """
+    from ipywidgets import interact, FloatSlider
+
+    fig, ax = plt.subplots(figsize=(5, 5))
+    cuerda, = ax.plot([0, 0], [0, -1], lw=2)
+    bob = plt.Circle((0, -1), radius=0.1, fill=True, alpha=0.7)
+    ax.add_patch(bob)
+    ax.plot([0], [0], marker='o')            # Pivote
+    ax.set_aspect("equal", adjustable="box")
+    ax.grid(True)
+
+    def actualizar(L=1.5, theta0=0.6, w0=0.0, g=9.81, t=0.0):
+        omega = math.sqrt(g / L)
+        theta = theta0 * math.cos(omega * t) + (w0 / omega) * math.sin(omega * t)
+        x, y = L * math.sin(theta), -L * math.cos(theta)
+        cuerda.set_data([0, x], [0, y])
+        bob.center = (x, y)
+        bob.set_radius(0.08 * L)
+        ax.set_xlim(-L*1.2, L*1.2)
+        ax.set_ylim(-L*1.2, L*0.2)
+        ax.set_title(f"Péndulo en t={t:.2f} s (θ={theta:.2f} rad)")
+        fig.canvas.draw_idle()
+
+    return interact(
+        actualizar,
+        L=FloatSlider(value=1.5, min=0.5, max=3.0, step=0.1, description='L (m)'),
+        theta0=FloatSlider(value=0.6, min=-1.2, max=1.2, step=0.05, description='θ0 (rad)'),
+        w0=FloatSlider(value=0.0, min=-2.0, max=2.0, step=0.1, description='ω0 (rad/s)'),
+        g=FloatSlider(value=9.81, min=1.0, max=20.0, step=0.1, description='g (m/s²)'),
+        t=FloatSlider(value=0.0, min=0.0, max=10.0, step=0.05, description='t (s)')
+    )